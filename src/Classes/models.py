@@ -1,6 +1,6 @@
 # models.py
 from datetime import date, datetime
-from typing import List, Literal
+from typing import List, Literal, Optional
 from pydantic.dataclasses import dataclass
 
 @dataclass
@@ -58,4 +58,12 @@ class OptimizationRequest:
     mutation_rate: float = 0.15
     crossover_rate: float = 0.85
     risk_factor: float = 0.0
-    ga_verbose: bool = True
\ No newline at end of file
+    ga_verbose: bool = True
+    # Island model (islands > 1): populations evolved in parallel processes with migration
+    islands: int = 1
+    migration_interval: int = 10
+    migrants: int = 2
+    migration_topology: Literal['ring', 'fully_connected'] = 'ring'
+
+    # Makes the run reproducible (None: a different random run every time)
+    seed: Optional[int] = None
@@ -0,0 +1,235 @@
+# columnarStore.py
+"""
+Columnar (Parquet / Arrow) storage for the campaigns / ads catalogue and the cleaned datasets.
+
+Catalogue files keep the model's types: Literal fields become dictionary-encoded
+(categorical) columns, dates and timestamps stay typed. Reads are memory-mapped and
+accept column selection and filters, which Parquet resolves from the row-group
+statistics before decoding anything.
+
+CLI (writes a .parquet next to each source file):
+    python -m src.Data_Store.columnarStore
+    python -m src.Data_Store.columnarStore --db src/DB --datasets src/Datasets/Cleaned_Datasets/Advertising
+"""
+import os
+import glob
+import time
+import argparse
+import dataclasses
+from datetime import date, datetime
+from typing import List, Dict, Tuple, Optional, Sequence, Type, TypeVar, Any, Literal, get_origin, get_args
+
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter
+
+from src.Classes.models import Campaign, Ad
+from src.Data_Store.jsonIngestion import LoadStats, load_columns, load_objects, find_data_file
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional: without it the JSON files are used
+    pa = None
+
+T = TypeVar('T')
+
+PARQUET_EXTENSION = '.parquet'
+
+# Rows per Parquet row group: the unit filters can skip
+ROW_GROUP_SIZE = 64 * 1024
+
+PARQUET_COMPRESSION = 'zstd'
+
+# A filter is a list of (column, op, value) tuples, all of which must hold, e.g. [('location', '=', 'UK')]
+Filters = List[Tuple[str, str, Any]]
+
+
+def columnar_available() -> bool:
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("The columnar store needs pyarrow (pip install pyarrow)")
+
+
+# ============================================================================
+# 1. SCHEMA
+# ============================================================================
+
+def _arrow_type(python_type):
+    if get_origin(python_type) is Literal:
+        # Categorical: int8 codes into the (small) set of categories
+        return pa.dictionary(pa.int8(), pa.string())
+    if python_type is bool:
+        return pa.bool_()
+    if python_type is int:
+        return pa.int64()
+    if python_type is float:
+        return pa.float64()
+    if python_type is datetime:
+        return pa.timestamp('us')
+    if python_type is date:
+        return pa.date32()
+    return pa.string()
+
+
+def model_schema(model: Type[Any]) -> 'pa.Schema':
+    """Arrow schema of a model dataclass (Campaign, Ad, ...); Literal fields are dictionary-encoded"""
+    _require_pyarrow()
+    return pa.schema([pa.field(field.name, _arrow_type(field.type), nullable=False)
+                      for field in dataclasses.fields(model)])
+
+
+def _category_order(model: Type[Any], name: str) -> Optional[List[str]]:
+    field_type = next(field.type for field in dataclasses.fields(model) if field.name == name)
+    return list(get_args(field_type)) if get_origin(field_type) is Literal else None
+
+
+# ============================================================================
+# 2. ESCRITA
+# ============================================================================
+
+def write_columns(columns: Dict[str, Sequence], model: Type[Any], path: str,
+                  row_group_size: int = ROW_GROUP_SIZE) -> int:
+    """Writes columns (one sequence per model field) to a Parquet file; returns the row count"""
+    schema = model_schema(model)
+    arrays = []
+    for field in schema:
+        values = columns[field.name]
+        if pa.types.is_dictionary(field.type):
+            # Dictionary in the order of the Literal, so the codes are the same in every file
+            categories = _category_order(model, field.name)
+            codes = pd.Categorical(values, categories=categories).codes
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(codes, type=pa.int8()), pa.array(categories, type=pa.string())))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+
+    table = pa.Table.from_arrays(arrays, schema=schema)
+    pq.write_table(table, path, row_group_size=row_group_size, compression=PARQUET_COMPRESSION)
+    return table.num_rows
+
+
+def write_objects(objects: Sequence[Any], model: Type[Any], path: str,
+                  row_group_size: int = ROW_GROUP_SIZE) -> int:
+    """Writes model objects (Campaign, Ad, ...) to a Parquet file; returns the row count"""
+    names = [field.name for field in dataclasses.fields(model)]
+    columns = {name: [getattr(obj, name) for obj in objects] for name in names}
+    return write_columns(columns, model, path, row_group_size)
+
+
+def import_json(json_path: str, model: Type[Any], parquet_path: Optional[str] = None) -> LoadStats:
+    """Converts a catalogue JSON / JSON-lines file to Parquet (validated like the API load)"""
+    _require_pyarrow()
+    parquet_path = parquet_path or os.path.splitext(json_path)[0] + PARQUET_EXTENSION
+    start = time.perf_counter()
+    columns, _ = load_columns(json_path, model)
+    rows = write_columns(columns, model, parquet_path)
+    return LoadStats(parquet_path, rows, time.perf_counter() - start)
+
+
+def import_csv(csv_path: str, parquet_path: Optional[str] = None) -> LoadStats:
+    """
+    Converts a dataset CSV to Parquet. Column types are inferred by the Arrow CSV reader
+    (text columns dictionary-encoded) and the unnamed pandas index column is dropped.
+    """
+    _require_pyarrow()
+    parquet_path = parquet_path or os.path.splitext(csv_path)[0] + PARQUET_EXTENSION
+    start = time.perf_counter()
+
+    table = pa_csv.read_csv(csv_path, convert_options=pa_csv.ConvertOptions(auto_dict_encode=True))
+    index_columns = [name for name in table.column_names if name == '' or name.startswith('Unnamed: ')]
+    table = table.drop_columns(index_columns)
+
+    pq.write_table(table, parquet_path, row_group_size=ROW_GROUP_SIZE, compression=PARQUET_COMPRESSION)
+    return LoadStats(parquet_path, table.num_rows, time.perf_counter() - start)
+
+
+# ============================================================================
+# 3. LEITURA
+# ============================================================================
+
+def read_table(path: str, columns: Optional[List[str]] = None,
+               filters: Optional[Filters] = None) -> 'pa.Table':
+    """
+    Memory-mapped read of a Parquet file. Only the requested columns are decoded and
+    row groups whose statistics cannot match the filters are skipped.
+    """
+    _require_pyarrow()
+    return pq.read_table(path, columns=columns, filters=filters or None, memory_map=True)
+
+
+def _to_numpy(column: 'pa.ChunkedArray'):
+    """
+    A column as NumPy: numeric and timestamp columns without nulls are zero-copy views of
+    the Arrow buffers, dictionary columns become a pandas Categorical (codes not copied).
+    """
+    if pa.types.is_dictionary(column.type):
+        return column.to_pandas().array
+    array = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+    return array.to_numpy(zero_copy_only=False)
+
+
+def read_columns(path: str, columns: Optional[List[str]] = None,
+                 filters: Optional[Filters] = None) -> Dict[str, Any]:
+    """
+    Columns of a Parquet file as a dict of NumPy arrays / Categoricals, the input format of
+    the predictors' feature schemas (FeatureSchema.encode).
+    """
+    table = read_table(path, columns, filters)
+    return {name: _to_numpy(table.column(name)) for name in table.column_names}
+
+
+def read_matrix(path: str, columns: List[str], filters: Optional[Filters] = None,
+                dtype=np.float32) -> np.ndarray:
+    """Numeric columns of a dataset (e.g. a model's feature columns) as one contiguous matrix"""
+    table = read_table(path, columns, filters)
+    matrix = np.empty((table.num_rows, len(columns)), dtype=dtype)
+    for j, name in enumerate(columns):
+        matrix[:, j] = _to_numpy(table.column(name))
+    return matrix
+
+
+def read_objects(path: str, model: Type[T], filters: Optional[Filters] = None) -> Tuple[List[T], LoadStats]:
+    """Model objects (Campaign, Ad, ...) of a catalogue Parquet file, validated in one call"""
+    start = time.perf_counter()
+    table = read_table(path, filters=filters)
+    objects = TypeAdapter(List[model]).validate_python(table.to_pylist())
+    return objects, LoadStats(path, len(objects), time.perf_counter() - start)
+
+
+def load_catalogue(directory: str, name: str, model: Type[T]) -> Tuple[List[T], LoadStats]:
+    """
+    Loads the '{name}' catalogue: from '{name}.parquet' when present (and pyarrow is
+    installed), otherwise from its JSON / JSON-lines file.
+    """
+    parquet_path = os.path.join(directory, name + PARQUET_EXTENSION)
+    if columnar_available() and os.path.exists(parquet_path):
+        return read_objects(parquet_path, model)
+    return load_objects(find_data_file(directory, name), model)
+
+
+# ============================================================================
+# 4. CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the catalogue and the cleaned datasets to Parquet")
+    parser.add_argument("--db", default="src/DB", help="Directory of campaigns.json / ads.json")
+    parser.add_argument("--datasets", default="src/Datasets/Cleaned_Datasets/Advertising",
+                        help="Directory of the dataset CSV files")
+    args = parser.parse_args()
+    _require_pyarrow()
+
+    for name, model in (('campaigns', Campaign), ('ads', Ad)):
+        print(import_json(find_data_file(args.db, name), model))
+
+    for csv_path in sorted(glob.glob(os.path.join(args.datasets, "*.csv"))):
+        print(import_csv(csv_path))
+
+
+if __name__ == "__main__":
+    main()
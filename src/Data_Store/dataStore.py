@@ -0,0 +1,120 @@
+# dataStore.py
+from typing import List, Dict, Tuple, Optional, Any, Generic, TypeVar, Sequence
+
+from src.Classes.models import Campaign, Ad, AllMarketingData
+from src.Data_Store.responseCache import EncodedPayload
+
+T = TypeVar('T')
+
+# Fields with a secondary index (filters on them do not scan the table)
+CAMPAIGN_INDEXED_FIELDS = ('channel_name', 'ext_service_name', 'search_tag_cat')
+AD_INDEXED_FIELDS = ('ad_topic', 'location', 'device_type', 'age_group', 'content_type')
+
+
+# ============================================================================
+# 1. TABELA INDEXADA
+# ============================================================================
+
+class IndexedTable(Generic[T]):
+    """
+    In-memory table with a hash index on id and secondary indexes on the given fields.
+    Each secondary index maps a field value to the (ascending) positions of its rows,
+    so filtered results keep the original order.
+    """
+
+    def __init__(self, indexed_fields: Sequence[str]):
+        self.indexed_fields = tuple(indexed_fields)
+        self.rows: List[T] = []
+        self.by_id: Dict[int, T] = {}
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {field: {} for field in self.indexed_fields}
+
+    def load(self, rows: List[T]):
+        """Replaces the table contents and rebuilds every index"""
+        self.rows = list(rows)
+        self.by_id = {row.id: row for row in self.rows}
+        self.indexes = {field: {} for field in self.indexed_fields}
+        for position, row in enumerate(self.rows):
+            for field in self.indexed_fields:
+                self.indexes[field].setdefault(getattr(row, field), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, row_id: int) -> Optional[T]:
+        return self.by_id.get(row_id)
+
+    def filter(self, **criteria) -> List[T]:
+        """
+        Rows matching every criterion (field=value; None values are ignored). Indexed
+        fields are resolved through their index, the others by scanning the candidates.
+        """
+        criteria = {field: value for field, value in criteria.items() if value is not None}
+        indexed = {f: v for f, v in criteria.items() if f in self.indexes}
+        scanned = {f: v for f, v in criteria.items() if f not in self.indexes}
+
+        if indexed:
+            # Start from the smallest posting list and intersect the others
+            postings = sorted((self.indexes[f].get(v, []) for f, v in indexed.items()), key=len)
+            positions = set(postings[0])
+            for posting in postings[1:]:
+                positions.intersection_update(posting)
+            candidates = [self.rows[p] for p in sorted(positions)]
+        else:
+            candidates = self.rows
+
+        if scanned:
+            candidates = [row for row in candidates
+                          if all(getattr(row, f) == v for f, v in scanned.items())]
+        return candidates
+
+    def page(self, offset: int = 0, limit: Optional[int] = None, **criteria) -> Tuple[List[T], int]:
+        """A page of the filtered rows and the total number of matches"""
+        rows = self.filter(**criteria)
+        end = None if limit is None else offset + limit
+        return rows[offset:end], len(rows)
+
+
+# ============================================================================
+# 2. STORE DE CAMPANHAS E ANÚNCIOS
+# ============================================================================
+
+class MarketingDataStore:
+    """
+    Indexed campaigns and ads, plus the prebuilt /allData wrapper and the pre-encoded
+    JSON of the full lists. Everything derived is rebuilt only after load().
+    """
+
+    def __init__(self):
+        self.campaigns: IndexedTable[Campaign] = IndexedTable(CAMPAIGN_INDEXED_FIELDS)
+        self.ads: IndexedTable[Ad] = IndexedTable(AD_INDEXED_FIELDS)
+        self.version = 0
+        self._all_data: Optional[AllMarketingData] = None
+        self._encoded: Dict[str, EncodedPayload] = {}
+
+    def load(self, campaigns: List[Campaign], ads: List[Ad]):
+        self.campaigns.load(campaigns)
+        self.ads.load(ads)
+        self.version += 1
+        self._all_data = None
+        self._encoded = {}
+
+    def all_data(self) -> AllMarketingData:
+        """AllMarketingData of the whole catalogue (built once per load)"""
+        if self._all_data is None:
+            self._all_data = AllMarketingData(campaigns=self.campaigns.rows, ads=self.ads.rows)
+        return self._all_data
+
+    def encoded(self, name: str) -> EncodedPayload:
+        """Pre-encoded JSON of 'campaigns', 'ads' or 'allData' for the current data version"""
+        payload = self._encoded.get(name)
+        if payload is None:
+            content = {
+                'campaigns': lambda: self.campaigns.rows,
+                'ads': lambda: self.ads.rows,
+                'allData': self.all_data,
+            }[name]()
+            payload = self._encoded[name] = EncodedPayload(content)
+        return payload
+
+
+data_store = MarketingDataStore()
@@ -0,0 +1,189 @@
+# jsonIngestion.py
+import os
+import json
+import time
+from dataclasses import dataclass, fields
+from typing import List, Dict, Iterator, Iterable, Tuple, Type, TypeVar, Any
+
+import numpy as np
+from pydantic import TypeAdapter
+
+T = TypeVar('T')
+
+# Bytes read from disk per step of the streaming parser
+READ_CHUNK_SIZE = 1 << 20
+
+# Records validated per pydantic call
+VALIDATION_BATCH_SIZE = 10_000
+
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+
+_WHITESPACE = ' \t\n\r'
+
+
+@dataclass
+class LoadStats:
+    """Timing of one file load"""
+    path: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+    def __str__(self) -> str:
+        return f"{self.rows} rows from {self.path} in {self.seconds:.3f}s ({self.rows_per_second:,.0f} rows/s)"
+
+
+# ============================================================================
+# 1. LEITURA INCREMENTAL
+# ============================================================================
+
+def iter_json_array(path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the elements of a top-level JSON array one at a time, reading the file in
+    chunks: only the current chunk and the element being decoded are held in memory.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        eof = False
+        started = False
+
+        def fill() -> bool:
+            nonlocal buffer, position, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        after_value = False
+        while True:
+            # Skip whitespace, reading on when the buffer runs out
+            while True:
+                while position < len(buffer) and buffer[position] in _WHITESPACE:
+                    position += 1
+                if position < len(buffer) or not fill():
+                    break
+
+            if position >= len(buffer):
+                raise ValueError(f"{path}: unexpected end of file")
+
+            char = buffer[position]
+            if not started:
+                if char != '[':
+                    raise ValueError(f"{path}: expected a JSON array")
+                started = True
+                position += 1
+                continue
+            if char == ']':
+                return
+            if after_value:
+                if char != ',':
+                    raise ValueError(f"{path}: expected ',' or ']' at offset {position}")
+                after_value = False
+                position += 1
+                continue
+
+            # Numbers and literals can be cut by the chunk boundary without a decode error:
+            # only decode them once the delimiter that ends them is in the buffer
+            if char not in '{["' and not eof and not any(d in buffer[position:] for d in ',]'):
+                fill()
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Element cut by the chunk boundary
+                if fill():
+                    continue
+                raise ValueError(f"{path}: invalid JSON at offset {position}")
+
+            position = end
+            after_value = True
+            yield value
+
+
+def iter_json_lines(path: str) -> Iterator[Any]:
+    """Yields one record per non-empty line of a JSON-lines file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_records(path: str) -> Iterator[Any]:
+    """Streams the records of a JSON array file, or of a JSON-lines file (.jsonl / .ndjson)"""
+    if path.endswith(JSON_LINES_EXTENSIONS):
+        return iter_json_lines(path)
+    return iter_json_array(path)
+
+
+def _batches(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ============================================================================
+# 2. VALIDAÇÃO EM BLOCO
+# ============================================================================
+
+def load_objects(path: str, model: Type[T], batch_size: int = VALIDATION_BATCH_SIZE) -> Tuple[List[T], LoadStats]:
+    """
+    Streams a file into validated model objects (Campaign, Ad, ...). Records are validated
+    in batches with a single pydantic call each, and the raw records of a batch are released
+    before the next one is read.
+    """
+    adapter = TypeAdapter(List[model])
+    start = time.perf_counter()
+
+    objects: List[T] = []
+    for batch in _batches(iter_records(path), batch_size):
+        objects.extend(adapter.validate_python(batch))
+
+    return objects, LoadStats(path, len(objects), time.perf_counter() - start)
+
+
+def load_columns(path: str, model: Type[T], batch_size: int = VALIDATION_BATCH_SIZE) -> Tuple[Dict[str, Any], LoadStats]:
+    """
+    Streams a file into a columnar representation: one entry per model field, NumPy arrays
+    for int / float fields and lists otherwise. Records are validated like in load_objects,
+    but no object is kept after its batch.
+    """
+    adapter = TypeAdapter(List[model])
+    names = [field.name for field in fields(model)]
+    start = time.perf_counter()
+
+    columns: Dict[str, list] = {name: [] for name in names}
+    for batch in _batches(iter_records(path), batch_size):
+        for obj in adapter.validate_python(batch):
+            for name in names:
+                columns[name].append(getattr(obj, name))
+
+    numeric = {field.name: np.dtype(field.type) for field in fields(model) if field.type in (int, float)}
+    result = {name: np.asarray(values, dtype=numeric[name]) if name in numeric else values
+              for name, values in columns.items()}
+
+    rows = len(columns[names[0]]) if names else 0
+    return result, LoadStats(path, rows, time.perf_counter() - start)
+
+
+def find_data_file(directory: str, name: str) -> str:
+    """Path of the '{name}' data file: the JSON-lines version when present, else '{name}.json'"""
+    for extension in JSON_LINES_EXTENSIONS:
+        path = os.path.join(directory, name + extension)
+        if os.path.exists(path):
+            return path
+    return os.path.join(directory, name + '.json')
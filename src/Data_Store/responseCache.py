@@ -0,0 +1,110 @@
+# responseCache.py
+import gzip
+import json
+import hashlib
+import dataclasses
+from datetime import date, datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional: fall back to the standard library encoder
+    orjson = None
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+
+
+# ============================================================================
+# 1. CODIFICAÇÃO JSON
+# ============================================================================
+
+def _json_default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(content: Any) -> bytes:
+    """JSON bytes of content (dataclasses, dates and datetimes included), with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+# ============================================================================
+# 2. RESPOSTAS PRÉ-SERIALIZADAS
+# ============================================================================
+
+class EncodedPayload:
+    """
+    A response body encoded once: JSON bytes, their gzip version (built on first use)
+    and an ETag derived from the content.
+    """
+
+    def __init__(self, content: Any):
+        self.body = encode_json(content)
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=16).hexdigest() + '"'
+        self._gzipped: Optional[bytes] = None
+
+    @property
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip: gzip (or x-gzip) listed with q > 0, or
+    not listed and '*' with q > 0. Codings with an invalid q value count as refused.
+    """
+    if not accept_encoding:
+        return False
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding] = quality
+
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def cached_json_response(request: Request, payload: EncodedPayload) -> Response:
+    """
+    Serves a pre-encoded payload: 304 when the client already has this ETag, the gzip
+    body when the client accepts it, the plain JSON bytes otherwise.
+    """
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if _etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+
+    if len(payload.body) >= GZIP_MIN_SIZE and _accepts_gzip(request.headers.get("accept-encoding")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=payload.gzipped, media_type="application/json", headers=headers)
+
+    return Response(content=payload.body, media_type="application/json", headers=headers)
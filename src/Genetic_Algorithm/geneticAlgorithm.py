@@ -1,8 +1,7 @@
 # genetic_algorithm_core.py
 import numpy as np
 import random
-from copy import deepcopy
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable, Union
 
 from src.Classes.models import Campaign, Ad
 
@@ -72,6 +71,124 @@ class Individual:
         return True
 
 
+class Genome:
+    """
+    Compact internal solution used inside GA and Tabu Search.
+    
+    Attributes:
+        assignment: int32 vector mapping each ad (ordered like DataManager.ad_ids)
+                    to a campaign index (ordered like DataManager.campaign_ids)
+        counts: Cached number of ads per campaign index
+        fitness, total_roi, total_cost, total_media_cost, total_media_revenue:
+                    Global metrics filled in by the FitnessEvaluator
+    
+    Every ad is assigned exactly once by construction, so a genome is valid as long
+    as every campaign has at least 1 ad. The pydantic Individual is only materialized
+    from the best genome (see FitnessEvaluator.to_individual).
+    
+    Genomes are copy-on-write: copy() shares the arrays, and the first move() on either
+    side copies them. Evaluated genomes (population members, elites, best solutions)
+    are never modified in place, so they are carried between generations by reference.
+    """
+    __slots__ = ('assignment', 'counts', 'fitness', 'total_roi', 'total_cost',
+                 'total_media_cost', 'total_media_revenue', '_shared')
+    
+    def __init__(self, assignment: np.ndarray, counts: np.ndarray):
+        self.assignment = assignment
+        self.counts = counts
+        self._shared = False
+        self.fitness = 0.0
+        self.total_roi = 0.0
+        self.total_cost = 0.0
+        self.total_media_cost = 0.0
+        self.total_media_revenue = 0.0
+    
+    @classmethod
+    def from_assignment(cls, assignment: np.ndarray, num_campaigns: int) -> 'Genome':
+        """Builds a genome from an ad->campaign index vector, counting ads per campaign"""
+        assignment = np.asarray(assignment, dtype=np.int32)
+        return cls(assignment, np.bincount(assignment, minlength=num_campaigns))
+    
+    def copy(self) -> 'Genome':
+        """Copy-on-write clone: shares the arrays until one of the two genomes is modified"""
+        clone = Genome(self.assignment, self.counts)
+        clone._shared = self._shared = True
+        clone.fitness = self.fitness
+        clone.total_roi = self.total_roi
+        clone.total_cost = self.total_cost
+        clone.total_media_cost = self.total_media_cost
+        clone.total_media_revenue = self.total_media_revenue
+        return clone
+    
+    def is_valid(self) -> bool:
+        """Each campaign must have at least 1 ad"""
+        return self.counts.size > 0 and bool(self.counts.min() > 0)
+    
+    def signature(self) -> bytes:
+        """Hashable signature of the allocation"""
+        return self.assignment.tobytes()
+    
+    def ads_of(self, campaign_idx: int) -> np.ndarray:
+        """Indexes of the ads assigned to a campaign index"""
+        return np.flatnonzero(self.assignment == campaign_idx)
+    
+    def move(self, ad_idx: int, target_idx: int):
+        """Moves an ad to another campaign index, keeping counts in sync"""
+        if self._shared:
+            self.assignment = self.assignment.copy()
+            self.counts = self.counts.copy()
+            self._shared = False
+        
+        self.counts[self.assignment[ad_idx]] -= 1
+        self.counts[target_idx] += 1
+        self.assignment[ad_idx] = target_idx
+
+
+class RandomStream:
+    """
+    Random state of one run (GA, Tabu Search, an island or a walker).
+    
+    Both generators derive from one numpy SeedSequence: `numpy` is a numpy Generator for
+    array draws, and `random` a random.Random for scalar draws (choice, randrange, ...),
+    several times cheaper per call than the Generator's scalar methods.
+    spawn() splits the stream into independent children, so parallel islands / walkers
+    get deterministic streams of their own.
+    """
+    
+    def __init__(self, seed: Union[None, int, np.random.SeedSequence] = None):
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.numpy = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        # PCG64 uses the first 4 words of the seed state; random.Random is seeded with the next 2
+        self.random = random.Random(int.from_bytes(self.seed_sequence.generate_state(6, np.uint64)[4:].tobytes(), 'little'))
+    
+    def spawn(self, n: int) -> List[np.random.SeedSequence]:
+        """Seeds of n independent child streams (picklable, for worker processes)"""
+        return self.seed_sequence.spawn(n)
+
+
+def create_random_genome(num_campaigns: int, num_ads: int, stream: Optional[RandomStream] = None) -> Genome:
+    """
+    Creates a valid random genome ensuring:
+    - Each campaign receives at least 1 ad
+    - All ads are distributed
+    """
+    if num_campaigns == 0 or num_ads == 0:
+        raise ValueError("Cannot create allocation with no campaigns or ads.")
+    
+    if num_campaigns > num_ads:
+        raise ValueError(f"Not enough ads ({num_ads}) to assign at least one to each campaign ({num_campaigns}).")
+    
+    rng = stream.numpy if stream is not None else np.random.default_rng()
+    shuffled_ads = rng.permutation(num_ads)
+    assignment = np.empty(num_ads, dtype=np.int32)
+    
+    # One ad per campaign first, then the remaining ads at random
+    assignment[shuffled_ads[:num_campaigns]] = np.arange(num_campaigns, dtype=np.int32)
+    assignment[shuffled_ads[num_campaigns:]] = rng.integers(0, num_campaigns, num_ads - num_campaigns)
+    
+    return Genome.from_assignment(assignment, num_campaigns)
+
+
 # ============================================================================
 # 2. DATA MANAGER
 # ============================================================================
@@ -84,12 +201,53 @@ class DataManager:
         self.ads_dict = {a.id: a for a in ads}
         self.campaign_ids = list(self.campaigns_dict.keys())
         self.ad_ids = list(self.ads_dict.keys())
+        
+        # Positional indexes used by the vectorized fitness engine
+        self.campaign_index = {cid: i for i, cid in enumerate(self.campaign_ids)}
+        self.ad_index = {ad_id: j for j, ad_id in enumerate(self.ad_ids)}
+        self._pack_arrays()
+    
+    def _pack_arrays(self):
+        """
+        Packs the attributes used by the fitness function into contiguous arrays.
+        Done once per run, after predictions have filled overcost and conversion_rate.
+        Arrays are ordered like campaign_ids / ad_ids.
+        """
+        campaigns = [self.campaigns_dict[cid] for cid in self.campaign_ids]
+        ads = [self.ads_dict[ad_id] for ad_id in self.ad_ids]
+        
+        self.campaign_clicks = np.array([c.clicks for c in campaigns], dtype=np.float64)
+        self.campaign_media_cost = np.array([c.media_cost_usd for c in campaigns], dtype=np.float64)
+        self.campaign_approved_budget = np.array([c.approved_budget for c in campaigns], dtype=np.float64)
+        self.campaign_overcost = np.array([c.overcost for c in campaigns], dtype=np.float64)
+        
+        self.ad_cost_per_click = np.array([a.cost_per_click for a in ads], dtype=np.float64)
+        self.ad_roi = np.array([a.roi for a in ads], dtype=np.float64)
+        self.ad_conversion_rate = np.array([a.conversion_rate for a in ads], dtype=np.float64)
+        
+        # Revenue per expected click = conversion_rate × value per conversion (CPC × ROI)
+        self.ad_revenue_per_click = self.ad_conversion_rate * (self.ad_cost_per_click * self.ad_roi)
     
     def get_campaign(self, campaign_id: int) -> Campaign:
         return self.campaigns_dict[campaign_id]
     
     def get_ad(self, ad_id: int) -> Ad:
         return self.ads_dict[ad_id]
+    
+    def allocation_to_assignment(self, allocation: Dict[int, List[int]]) -> np.ndarray:
+        """Encodes {campaign_id: [ad_ids]} as an ad->campaign index vector ordered like ad_ids"""
+        assignment = np.full(len(self.ad_ids), -1, dtype=np.int32)
+        for campaign_id, ad_ids in allocation.items():
+            if ad_ids:
+                assignment[[self.ad_index[ad_id] for ad_id in ad_ids]] = self.campaign_index[campaign_id]
+        return assignment
+    
+    def assignment_to_allocation(self, assignment: np.ndarray) -> Dict[int, List[int]]:
+        """Decodes an ad->campaign index vector back into {campaign_id: [ad_ids]}"""
+        allocation = {cid: [] for cid in self.campaign_ids}
+        for ad_id, campaign_idx in zip(self.ad_ids, assignment.tolist()):
+            allocation[self.campaign_ids[campaign_idx]].append(ad_id)
+        return allocation
 
 
 # ============================================================================
@@ -116,128 +274,200 @@ class FitnessEvaluator:
         
         Fitness = 0.7*Total_ROI + 0.3*Avg_Campaign_ROI + Balance_Penalty + Budget_Terms
         """
+        assignment = self.data_manager.allocation_to_assignment(individual.allocation)
+        scores = self._score_aggregates(*self._campaign_aggregates(assignment))
         
-        total_cost = 0.0  # Total cost for budget penalty (includes approved budget + overcost + ads)
-        total_media_cost = 0.0  # Total media cost for ROI calculation (only media costs)
-        total_media_revenue = 0.0
-        campaign_metrics = {}
+        self._set_metrics(individual, scores)
+        individual.campaign_metrics = self._campaign_metrics(scores)
         
-        for campaign_id, ad_ids in individual.allocation.items():
-            campaign = self.data_manager.get_campaign(campaign_id)
-            
-            # Overcost is relative to approved_budget
-            campaign_approved_budget = campaign.approved_budget
-            campaign_overcost_amount = campaign.overcost 
-            
-            # Budget cost for constraint checking (approved budget + overcost)
-            campaign_budget_cost = campaign_approved_budget + campaign_overcost_amount
-            
-            # Media cost for ROI calculation (only actual media spending)
-            campaign_media_cost = campaign.media_cost_usd
-            
-            campaign_revenue = 0.0
-            campaign_ads_cost = 0.0
-            conversion_rates_for_campaign = []
-            
-            if not ad_ids:
-                continue
-
-            for ad_id in ad_ids:
-                ad = self.data_manager.get_ad(ad_id)
-                
-                conversion_rate = ad.conversion_rate
-                conversion_rates_for_campaign.append(conversion_rate)
-                
-                # Distribute campaign clicks equally among ads
-                ad_share = 1.0 / len(ad_ids)
-                expected_clicks = campaign.clicks * ad_share
-                
-                # Ensure at least 1 click for calculation purposes
-                expected_clicks = max(expected_clicks, 1)
-                expected_conversions = expected_clicks * conversion_rate
-                
-                # Ad cost = clicks × cost per click
-                ad_cost = expected_clicks * ad.cost_per_click
-                campaign_ads_cost += ad_cost
-                
-                # Revenue = conversions × value per conversion
-                # Value per conversion = CPC × ROI (ROI represents value multiplier)
-                estimated_value_per_conversion = ad.cost_per_click * ad.roi
-                ad_revenue = expected_conversions * estimated_value_per_conversion
-                
-                campaign_revenue += ad_revenue
-            
-            # Cost for ROI = only media costs (campaign media + ad spending)
-            campaign_total_media_cost = campaign_media_cost + campaign_ads_cost
-            
-            # Calculate ROI for this campaign using only media costs
-            campaign_roi = ((campaign_revenue - campaign_total_media_cost) / 
-                           campaign_total_media_cost if campaign_total_media_cost > 0 else 0)
-            
-            total_cost += campaign_budget_cost
-            total_media_cost += campaign_total_media_cost
-            total_media_revenue += campaign_revenue
-            
-            campaign_metrics[campaign_id] = {
-                'cost': campaign_total_media_cost,  # Show media-based cost in metrics
-                'revenue': campaign_revenue,
-                'roi': campaign_roi,
-                'overcost': campaign_overcost_amount,
-                'budget_cost': campaign_budget_cost,
-                'media_cost': campaign_media_cost,
-                'ads_cost': campaign_ads_cost,
-                'approved_budget': campaign_approved_budget,
-                'avg_conversion_rate': np.mean(conversion_rates_for_campaign) if conversion_rates_for_campaign else 0,
-                'n_ads': len(ad_ids)
-            }
+        return individual.fitness
+    
+    def evaluate_batch(self, assignments: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Scores a whole population in one vectorized pass.
         
-        # Calculate ROI using only media costs
-        if total_media_cost > 0:
-            total_roi = (total_media_revenue - total_media_cost) / total_media_cost
-        else:
-            total_roi = 0.0
+        Args:
+            assignments: 2-D (population × ads) matrix of ad->campaign indexes
+        
+        Returns:
+            Dict of per-individual vectors: fitness, total_roi, total_cost,
+            total_media_cost and total_media_revenue
+        """
+        scores = self._score_aggregates(*self._campaign_aggregates(np.atleast_2d(assignments)))
+        return {key: scores[key] for key in
+                ('fitness', 'total_roi', 'total_cost', 'total_media_cost', 'total_media_revenue')}
+    
+    def evaluate_genome(self, genome: Genome) -> float:
+        """Fills the global metrics of a single genome (no per-campaign breakdown)"""
+        scores = self._score_aggregates(*self._campaign_aggregates(genome.assignment))
+        self._set_metrics(genome, scores)
+        return genome.fitness
+    
+    def evaluate_genomes(self, genomes: List[Genome]):
+        """Batch counterpart of evaluate_genome(): scores all genomes with a single evaluate_batch call"""
+        if not genomes:
+            return
         
-        # Calculate weighted average of campaign ROIs (encourages balanced performance)
-        campaign_roi_values = [metrics['roi'] for metrics in campaign_metrics.values()]
-        avg_campaign_roi = np.mean(campaign_roi_values) if campaign_roi_values else 0.0
+        scores = self.evaluate_batch(np.stack([genome.assignment for genome in genomes]))
+        
+        columns = zip(genomes, scores['fitness'].tolist(), scores['total_roi'].tolist(),
+                      scores['total_cost'].tolist(), scores['total_media_cost'].tolist(),
+                      scores['total_media_revenue'].tolist())
+        for genome, fitness, total_roi, total_cost, total_media_cost, total_media_revenue in columns:
+            genome.fitness = fitness
+            genome.total_roi = total_roi
+            genome.total_cost = total_cost
+            genome.total_media_cost = total_media_cost
+            genome.total_media_revenue = total_media_revenue
+    
+    def to_individual(self, genome: Genome) -> Individual:
+        """Materializes a genome as a fully evaluated Individual (API boundary)"""
+        individual = Individual(allocation=self.data_manager.assignment_to_allocation(genome.assignment))
+        scores = self._score_aggregates(*self._campaign_aggregates(genome.assignment))
+        self._set_metrics(individual, scores)
+        individual.campaign_metrics = self._campaign_metrics(scores)
+        return individual
+    
+    @staticmethod
+    def _set_metrics(target, scores: dict):
+        """Copies the global metrics of a single-solution score into a Genome or Individual"""
+        target.fitness = float(scores['fitness'])
+        target.total_roi = float(scores['total_roi'])
+        target.total_cost = float(scores['total_cost'])  # Store media-based cost for ROI tracking
+        target.total_media_cost = float(scores['total_media_cost'])
+        target.total_media_revenue = float(scores['total_media_revenue'])
+    
+    def _campaign_aggregates(self, assignment: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Segmented sums of the per-ad attributes for every campaign (bincount over the
+        ad->campaign index vector). Returns (n_ads, cpc_sum, revenue_per_click_sum, conversion_rate_sum).
         
+        A 2-D (population × ads) input yields (population × campaigns) aggregates; rows are
+        offset by row * n_campaigns so a single bincount covers the whole population.
+        """
+        dm = self.data_manager
+        n_campaigns = len(dm.campaign_ids)
+        
+        if assignment.ndim == 1:
+            counts = np.bincount(assignment, minlength=n_campaigns)
+            cpc_sums = np.bincount(assignment, weights=dm.ad_cost_per_click, minlength=n_campaigns)
+            revenue_sums = np.bincount(assignment, weights=dm.ad_revenue_per_click, minlength=n_campaigns)
+            conversion_sums = np.bincount(assignment, weights=dm.ad_conversion_rate, minlength=n_campaigns)
+            return counts, cpc_sums, revenue_sums, conversion_sums
+        
+        n_rows = assignment.shape[0]
+        shape = (n_rows, n_campaigns)
+        flat = (assignment + (np.arange(n_rows) * n_campaigns)[:, None]).ravel()
+        
+        def segmented_sum(weights: Optional[np.ndarray]) -> np.ndarray:
+            if weights is not None:
+                weights = np.tile(weights, n_rows)
+            return np.bincount(flat, weights=weights, minlength=n_rows * n_campaigns).reshape(shape)
+        
+        return (segmented_sum(None),
+                segmented_sum(dm.ad_cost_per_click),
+                segmented_sum(dm.ad_revenue_per_click),
+                segmented_sum(dm.ad_conversion_rate))
+    
+    def _score_aggregates(self,
+                          counts: np.ndarray,
+                          cpc_sums: np.ndarray,
+                          revenue_sums: np.ndarray,
+                          conversion_sums: np.ndarray) -> dict:
+        """
+        Applies the fitness formula to per-campaign aggregates (campaigns on the last axis).
+        Empty campaigns contribute no cost, revenue or ROI, as in the per-ad formulation.
+        """
+        dm = self.data_manager
+        active = counts > 0
         
-        # Balance penalty: penalize uneven distribution of ads
-        allocation_sizes = [len(ad_ids) for ad_ids in individual.allocation.values()]
-        if len(allocation_sizes) > 1:
-            std_dev = np.std(allocation_sizes)
-            mean_size = np.mean(allocation_sizes)
-            balance_penalty = - self.risk_factor * (std_dev / mean_size if mean_size > 0 else 0)
-        else:
-            balance_penalty = 0.0
+        # Campaign clicks are shared equally among its ads (at least 1 click per ad)
+        expected_clicks = np.maximum(dm.campaign_clicks / np.maximum(counts, 1), 1.0)
+        ads_cost = expected_clicks * cpc_sums
+        revenue = expected_clicks * revenue_sums
         
-        # Budget penalty uses full budget (approved budget + overcost + ads)
-        budget_penalty = 0.0
-        if total_cost > self.total_budget:
-            excess_ratio = (total_cost - self.total_budget) / self.total_budget
-            budget_penalty = -10.0 * excess_ratio
+        # Cost for ROI = only media costs (campaign media + ad spending)
+        media_cost = np.where(active, dm.campaign_media_cost + ads_cost, 0.0)
+        budget_cost = dm.campaign_approved_budget + dm.campaign_overcost
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            campaign_roi = np.where(media_cost > 0, (revenue - media_cost) / media_cost, 0.0)
+        
+        total_cost = np.where(active, budget_cost, 0.0).sum(axis=-1)
+        total_media_cost = media_cost.sum(axis=-1)
+        total_media_revenue = revenue.sum(axis=-1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total_roi = np.where(total_media_cost > 0,
+                                 (total_media_revenue - total_media_cost) / total_media_cost, 0.0)
+            
+            # Average of campaign ROIs (encourages balanced performance)
+            n_active = active.sum(axis=-1)
+            avg_campaign_roi = np.where(n_active > 0,
+                                        np.where(active, campaign_roi, 0.0).sum(axis=-1) / n_active, 0.0)
+            
+            # Balance penalty: penalize uneven distribution of ads
+            if counts.shape[-1] > 1:
+                mean_size = counts.mean(axis=-1)
+                relative_std = np.where(mean_size > 0, counts.std(axis=-1) / mean_size, 0.0)
+                balance_penalty = -self.risk_factor * relative_std
+            else:
+                balance_penalty = np.zeros_like(total_roi)
+        
+        # Budget penalty uses full budget (approved budget + overcost)
+        excess_ratio = (total_cost - self.total_budget) / self.total_budget
+        budget_penalty = np.where(total_cost > self.total_budget, -10.0 * excess_ratio, 0.0)
         
-        # Budget bonus also based on full budget constraint
-        #budget_usage = total_cost / self.total_budget if self.total_budget > 0 else 0
-        #if budget_usage > 0.85 and budget_usage <= 1.0:
-            #budget_bonus = 0.5 * budget_usage
-       # else:
-            #budget_bonus = 0.0
-
         budget_bonus = 0.0
         
         # Combined fitness: 70% total ROI + 30% average campaign ROI + balance penalty
-        fitness = (0.7 * total_roi + 0.3 * avg_campaign_roi + 
+        fitness = (0.7 * total_roi + 0.3 * avg_campaign_roi +
                    balance_penalty + budget_penalty + budget_bonus)
         
-        individual.fitness = fitness
-        individual.total_roi = total_roi
-        individual.total_cost = total_cost  # Store media-based cost for ROI tracking
-        individual.total_media_cost = total_media_cost
-        individual.total_media_revenue = total_media_revenue
-        individual.campaign_metrics = campaign_metrics
+        return {
+            'fitness': fitness,
+            'total_roi': total_roi,
+            'total_cost': total_cost,
+            'total_media_cost': total_media_cost,
+            'total_media_revenue': total_media_revenue,
+            'counts': counts,
+            'media_cost': media_cost,
+            'revenue': revenue,
+            'campaign_roi': campaign_roi,
+            'ads_cost': ads_cost,
+            'budget_cost': budget_cost,
+            'conversion_sums': conversion_sums,
+        }
+    
+    def _campaign_metrics(self, scores: dict) -> Dict[int, dict]:
+        """Builds the per-campaign metrics dict (non-empty campaigns only) for a single solution"""
+        dm = self.data_manager
+        counts = scores['counts'].tolist()
+        columns = zip(dm.campaign_ids, counts,
+                      scores['media_cost'].tolist(), scores['revenue'].tolist(),
+                      scores['campaign_roi'].tolist(), dm.campaign_overcost.tolist(),
+                      scores['budget_cost'].tolist(), dm.campaign_media_cost.tolist(),
+                      scores['ads_cost'].tolist(), dm.campaign_approved_budget.tolist(),
+                      scores['conversion_sums'].tolist())
         
-        return fitness
+        campaign_metrics = {}
+        for (campaign_id, n_ads, cost, revenue, roi, overcost, budget_cost,
+             media_cost, ads_cost, approved_budget, conversion_sum) in columns:
+            if n_ads == 0:
+                continue
+            campaign_metrics[campaign_id] = {
+                'cost': cost,  # Show media-based cost in metrics
+                'revenue': revenue,
+                'roi': roi,
+                'overcost': overcost,
+                'budget_cost': budget_cost,
+                'media_cost': media_cost,
+                'ads_cost': ads_cost,
+                'approved_budget': approved_budget,
+                'avg_conversion_rate': conversion_sum / n_ads,
+                'n_ads': n_ads
+            }
+        return campaign_metrics
 
 
 # ============================================================================
@@ -253,7 +483,8 @@ class GeneticAlgorithm:
                  mutation_rate: float,
                  crossover_rate: float,
                  fitness_evaluator: FitnessEvaluator,
-                 data_manager: DataManager):
+                 data_manager: DataManager,
+                 stream: Optional[RandomStream] = None):
         
         self.population_size = population_size
         self.max_generations = max_generations
@@ -267,40 +498,26 @@ class GeneticAlgorithm:
         self.num_campaigns = len(self.campaign_ids)
         self.num_ads = len(self.ad_ids)
         
-        self.population: List[Individual] = []
-        self.best_individual: Individual = None
+        self.population: List[Genome] = []
+        self.best_individual: Genome = None
         self.history = []
         self.generations_without_improvement = 0  # Track stagnation
         self.best_fitness_ever = float('-inf')
         self.diversity_threshold = 0.1  # Diversity threshold for triggering forced exploration
+        self.set_random_stream(stream or RandomStream())
     
-    def create_random_allocation(self) -> Dict[int, List[int]]:
+    def set_random_stream(self, stream: RandomStream):
+        """Draws every random decision of the GA from stream"""
+        self.stream = stream
+        self.random = stream.random
+    
+    def create_random_allocation(self) -> Genome:
         """
         Creates a valid random allocation ensuring:
         - Each campaign receives at least 1 ad
         - All ads are distributed
         """
-        allocation = {cid: [] for cid in self.campaign_ids}
-        available_ads = self.ad_ids.copy()
-        random.shuffle(available_ads)
-        
-        if not self.campaign_ids or not self.ad_ids:
-            raise ValueError("Cannot create allocation with no campaigns or ads.")
-
-        if len(self.campaign_ids) > len(available_ads):
-            raise ValueError(f"Not enough ads ({len(available_ads)}) to assign at least one to each campaign ({len(self.campaign_ids)}).")
-
-        temp_ads_for_init = available_ads[:self.num_campaigns]
-        remaining_ads = available_ads[self.num_campaigns:]
-        
-        for i, cid in enumerate(self.campaign_ids):
-            allocation[cid].append(temp_ads_for_init[i])
-        
-        for ad_id in remaining_ads:
-            random_campaign = random.choice(self.campaign_ids)
-            allocation[random_campaign].append(ad_id)
-        
-        return allocation
+        return create_random_genome(self.num_campaigns, self.num_ads, self.stream)
     
     def initialize_population(self):
         """Creates initial random population and evaluates fitness"""
@@ -308,10 +525,7 @@ class GeneticAlgorithm:
         
         for _ in range(self.population_size):
             try:
-                allocation = self.create_random_allocation()
-                individual = Individual(allocation=allocation)
-                self.fitness_evaluator.evaluate(individual)
-                self.population.append(individual)
+                self.population.append(self.create_random_allocation())
             except ValueError as e:
                 print(f"Skipping individual due to error: {e}")
                 if len(self.ad_ids) < len(self.campaign_ids):
@@ -321,20 +535,22 @@ class GeneticAlgorithm:
         if not self.population:
             raise ValueError("Could not initialize any valid individuals. Check input data (e.g., ads vs campaigns count).")
 
+        # Score the whole initial population in one batch
+        self.fitness_evaluator.evaluate_genomes(self.population)
         self.population.sort(key=lambda x: x.fitness, reverse=True)
-        self.best_individual = deepcopy(self.population[0])
+        self.best_individual = self.population[0]
     
-    def selection(self) -> Individual:
+    def selection(self) -> Genome:
         """Tournament selection with balanced selection pressure"""
         tournament_size = 3
-        competitors = random.sample(self.population, 
+        competitors = self.random.sample(self.population, 
                                    min(tournament_size, len(self.population)))
         return max(competitors, key=lambda x: x.fitness)
     
-    def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
+    def crossover(self, parent1: Genome, parent2: Genome) -> Tuple[Genome, Genome]:
         """
-        Ad-Centric Crossover Strategy, this method iterates through every Ad ID 
-        and decides which parent's assignment (destination campaign) the ad will inherit.
+        Ad-Centric Crossover Strategy, this method decides for every ad which parent's
+        assignment (destination campaign) the ad will inherit.
         
         Strategies:
         - Single Point: Split the list of ads; first half inherits from P1, second from P2.
@@ -344,105 +560,58 @@ class GeneticAlgorithm:
         only for empty campaigns.
         """
         # 1. Check crossover probability
-        if random.random() > self.crossover_rate:
-            return deepcopy(parent1), deepcopy(parent2)
-
-        # 2. Create Inverse Mappings (Ad ID -> Campaign ID)
-        # We need to know the destination of every ad in both parents
-        p1_map = {}
-        for cid, ads in parent1.allocation.items():
-            for ad_id in ads:
-                p1_map[ad_id] = cid
-
-        p2_map = {}
-        for cid, ads in parent2.allocation.items():
-            for ad_id in ads:
-                p2_map[ad_id] = cid
+        if self.random.random() > self.crossover_rate:
+            return parent1.copy(), parent2.copy()
 
-        # Initialize child mappings
-        child1_map = {}
-        child2_map = {}
-
-        # 3. Select Strategy
-        strategy = random.choice(['single_point', 'uniform'])
-        all_ads = self.ad_ids.copy()
+        # 2. Select Strategy (genomes already map Ad -> Campaign)
+        strategy = self.random.choice(['single_point', 'uniform'])
         
         if strategy == 'single_point':
             # Split the list of ADS (not campaigns)
-            if len(all_ads) > 1:
-                split_point = random.randint(1, len(all_ads) - 1)
+            if self.num_ads > 1:
+                split_point = self.random.randint(1, self.num_ads - 1)
             else:
                 split_point = 0
             
-            for i, ad_id in enumerate(all_ads):
-                if i < split_point:
-                    child1_map[ad_id] = p1_map.get(ad_id)
-                    child2_map[ad_id] = p2_map.get(ad_id)
-                else:
-                    child1_map[ad_id] = p2_map.get(ad_id)
-                    child2_map[ad_id] = p1_map.get(ad_id)
+            from_parent1 = np.arange(self.num_ads) < split_point
                     
         else: # uniform
             # For EACH ad, randomly decide which parent defines its destination
-            for ad_id in all_ads:
-                if random.random() < 0.5:
-                    child1_map[ad_id] = p1_map.get(ad_id)
-                    child2_map[ad_id] = p2_map.get(ad_id)
-                else:
-                    child1_map[ad_id] = p2_map.get(ad_id)
-                    child2_map[ad_id] = p1_map.get(ad_id)
-
-        # 4. Reconstruction: Transform Maps {Ad->Camp} back to Allocation {Camp->[Ads]}
-        child1_allocation = {cid: [] for cid in self.campaign_ids}
-        child2_allocation = {cid: [] for cid in self.campaign_ids}
-
-        # Populate Child 1
-        for ad_id, camp_id in child1_map.items():
-            # Fallback for safety: if camp_id is None (should not happen), pick random
-            if camp_id not in child1_allocation:
-                camp_id = random.choice(self.campaign_ids)
-            child1_allocation[camp_id].append(ad_id)
-
-        # Populate Child 2
-        for ad_id, camp_id in child2_map.items():
-            if camp_id not in child2_allocation:
-                camp_id = random.choice(self.campaign_ids)
-            child2_allocation[camp_id].append(ad_id)
-
-        # 5. Repair constraints (specifically empty campaigns)
-        child1_allocation = self._repair_allocation(child1_allocation)
-        child2_allocation = self._repair_allocation(child2_allocation)
-        
-        return Individual(allocation=child1_allocation), Individual(allocation=child2_allocation)
-
-    def _repair_allocation(self, allocation: Dict[int, List[int]]) -> Dict[int, List[int]]:
+            from_parent1 = self.stream.numpy.random(self.num_ads) < 0.5
+
+        child1_assignment = np.where(from_parent1, parent1.assignment, parent2.assignment)
+        child2_assignment = np.where(from_parent1, parent2.assignment, parent1.assignment)
+
+        # 3. Repair constraints (specifically empty campaigns)
+        child1 = self._repair_allocation(Genome.from_assignment(child1_assignment, self.num_campaigns))
+        child2 = self._repair_allocation(Genome.from_assignment(child2_assignment, self.num_campaigns))
+        
+        return child1, child2
+
+    def _repair_allocation(self, genome: Genome) -> Genome:
         """
         Repairs the allocation to ensure every campaign has at least one ad.
         
         """
         # Identify empty campaigns
-        empty_campaigns = [cid for cid in self.campaign_ids if not allocation[cid]]
+        empty_campaigns = np.flatnonzero(genome.counts == 0)
         
-        if not empty_campaigns:
-            return allocation
-
         # For each empty campaign, steal an ad from a campaign that has > 1 ad
-        for empty_cid in empty_campaigns:
+        for empty_idx in empty_campaigns.tolist():
             # Find potential donors (campaigns with more than 1 ad)
             # We refresh this list in every iteration to reflect recent moves
-            donors = [cid for cid in self.campaign_ids if len(allocation[cid]) > 1]
+            donors = np.flatnonzero(genome.counts > 1)
             
-            if not donors:
+            if donors.size == 0:
                 # Critical edge case: More campaigns than ads, or perfectly distributed 1-1-1
                 # Cannot solve the constraint without violating the 'unique ad' rule.
                 break
                 
             # Randomly select a donor and move one ad to the empty campaign
-            donor_cid = random.choice(donors)
-            ad_to_move = allocation[donor_cid].pop()
-            allocation[empty_cid].append(ad_to_move)
+            donor_idx = self.random.choice(donors.tolist())
+            genome.move(self.random.choice(genome.ads_of(donor_idx).tolist()), empty_idx)
             
-        return allocation
+        return genome
     
     def calculate_population_diversity(self) -> float:
         """
@@ -452,33 +621,26 @@ class GeneticAlgorithm:
         if not self.population:
             return 0.0
         
-        # Convert allocations to hashable format for comparison
-        allocation_signatures = []
-        for individual in self.population:
-            # Create signature: tuple of (campaign_id, sorted_ad_ids)
-            signature = tuple(sorted(
-                (cid, tuple(sorted(ad_ids))) 
-                for cid, ad_ids in individual.allocation.items()
-            ))
-            allocation_signatures.append(signature)
-        
-        # Count unique signatures
-        unique_count = len(set(allocation_signatures))
+        # Count unique signatures (the raw bytes of each assignment vector)
+        unique_count = len({individual.signature() for individual in self.population})
         diversity = unique_count / len(self.population)
         
         return diversity
     
-    def mutate(self, individual: Individual, adaptive_rate: float = None, force_diversity: bool = False):
+    def _random_other_campaign(self, campaign_idx: int) -> int:
+        """Random campaign index different from campaign_idx"""
+        other = self.random.randrange(self.num_campaigns - 1)
+        return other + 1 if other >= campaign_idx else other
+    
+    def mutate(self, individual: Genome, adaptive_rate: float = None, force_diversity: bool = False):
         """
         Adaptive mutation with multiple strategies.
         
         Args:
-            individual: Individual to mutate
+            individual: Genome to mutate (in place)
             adaptive_rate: Optional higher mutation rate for forced exploration
             force_diversity: If True, uses aggressive mutation strategies
         """
-        allocation = individual.allocation
-        
         if not self.campaign_ids or self.num_campaigns < 2 or not self.ad_ids or self.num_ads < 2:
             return
 
@@ -490,44 +652,39 @@ class GeneticAlgorithm:
             current_mutation_rate = min(0.6, current_mutation_rate * 3.0)
         
         # Choose mutation strategy
-        strategy = random.choice(['move', 'swap', 'scramble']) if force_diversity else 'move'
+        strategy = self.random.choice(['move', 'swap', 'scramble']) if force_diversity else 'move'
         
         if strategy == 'move':
             # Move ads between campaigns
             num_mutations_attempts = max(1, int(current_mutation_rate * self.num_ads))
             
             for _ in range(num_mutations_attempts):
-                if random.random() < current_mutation_rate:
-                    source_campaign_candidates = [cid for cid in self.campaign_ids 
-                                                if len(allocation[cid]) > 1]
+                if self.random.random() < current_mutation_rate:
+                    source_campaign_candidates = np.flatnonzero(individual.counts > 1)
                     
-                    if not source_campaign_candidates:
+                    if source_campaign_candidates.size == 0:
                         continue
                     
-                    source_cid = random.choice(source_campaign_candidates)
-                    target_cid = random.choice([c for c in self.campaign_ids if c != source_cid])
+                    source_idx = self.random.choice(source_campaign_candidates.tolist())
+                    target_idx = self._random_other_campaign(source_idx)
                     
-                    if allocation[source_cid]:
-                        ad_to_move = random.choice(allocation[source_cid])
-                        allocation[source_cid].remove(ad_to_move)
-                        allocation[target_cid].append(ad_to_move)
+                    ad_to_move = self.random.choice(individual.ads_of(source_idx).tolist())
+                    individual.move(ad_to_move, target_idx)
         
         elif strategy == 'swap':
             # Swap ads between two campaigns
             num_swaps = max(1, int(current_mutation_rate * self.num_ads * 0.5))
             
             for _ in range(num_swaps):
-                campaign1 = random.choice(self.campaign_ids)
-                campaign2 = random.choice([c for c in self.campaign_ids if c != campaign1])
+                campaign1 = self.random.randrange(self.num_campaigns)
+                campaign2 = self._random_other_campaign(campaign1)
                 
-                if allocation[campaign1] and allocation[campaign2]:
-                    ad1 = random.choice(allocation[campaign1])
-                    ad2 = random.choice(allocation[campaign2])
+                if individual.counts[campaign1] and individual.counts[campaign2]:
+                    ad1 = self.random.choice(individual.ads_of(campaign1).tolist())
+                    ad2 = self.random.choice(individual.ads_of(campaign2).tolist())
                     
-                    allocation[campaign1].remove(ad1)
-                    allocation[campaign2].remove(ad2)
-                    allocation[campaign1].append(ad2)
-                    allocation[campaign2].append(ad1)
+                    individual.move(ad1, campaign2)
+                    individual.move(ad2, campaign1)
         
         else:  # scramble
             # Scramble: redistribute multiple ads randomly
@@ -535,24 +692,23 @@ class GeneticAlgorithm:
             
             # Collect random ads from campaigns (that have more than 1 ad)
             ads_to_scramble = []
-            source_campaigns = [cid for cid in self.campaign_ids if len(allocation[cid]) > 1]
+            picked = set()
+            remaining = individual.counts.copy()
             
             for _ in range(num_to_scramble):
-                if not source_campaigns:
+                source_campaigns = np.flatnonzero(remaining > 1)
+                if source_campaigns.size == 0:
                     break
-                source_cid = random.choice(source_campaigns)
-                if allocation[source_cid]:
-                    ad_to_scramble = random.choice(allocation[source_cid])
-                    allocation[source_cid].remove(ad_to_scramble)
-                    ads_to_scramble.append(ad_to_scramble)
-                    
-                    # Update source campaigns list
-                    source_campaigns = [cid for cid in self.campaign_ids if len(allocation[cid]) > 1]
+                source_idx = self.random.choice(source_campaigns.tolist())
+                candidates = [ad for ad in individual.ads_of(source_idx).tolist() if ad not in picked]
+                ad_to_scramble = self.random.choice(candidates)
+                ads_to_scramble.append(ad_to_scramble)
+                picked.add(ad_to_scramble)
+                remaining[source_idx] -= 1
             
             # Redistribute scrambled ads randomly
-            for ad_id in ads_to_scramble:
-                target_cid = random.choice(self.campaign_ids)
-                allocation[target_cid].append(ad_id)
+            for ad_idx in ads_to_scramble:
+                individual.move(ad_idx, self.random.randrange(self.num_campaigns))
     
     def evolve(self, generation: int = 0):
         """Creates next generation with adaptive elitism and diversity preservation"""
@@ -568,7 +724,8 @@ class GeneticAlgorithm:
         else:
             elite_size = max(2, int(self.population_size * 0.15))  # Normal elite size
         
-        elites = [deepcopy(ind) for ind in self.population[:elite_size]]
+        # Carried-over individuals are never modified, so they are kept by reference
+        elites = self.population[:elite_size]
         new_population.extend(elites)
         
         # Diversity preservation: keep some random individuals (not just worst)
@@ -578,15 +735,16 @@ class GeneticAlgorithm:
             # Mix of worst and random from population
             diverse_individuals = []
             diverse_individuals.extend(self.population[-diversity_size//2:])
-            diverse_individuals.extend(random.sample(self.population[elite_size:-diversity_size//2], 
+            diverse_individuals.extend(self.random.sample(self.population[elite_size:-diversity_size//2], 
                                                     diversity_size//2) if len(self.population) > elite_size + diversity_size else [])
-            new_population.extend([deepcopy(ind) for ind in diverse_individuals])
+            new_population.extend(diverse_individuals)
         else:
             diversity_size = max(1, int(self.population_size * 0.05))
-            worst_individuals = [deepcopy(ind) for ind in self.population[-diversity_size:]]
+            worst_individuals = self.population[-diversity_size:]
             new_population.extend(worst_individuals)
         
-        # Fill the rest with crossover and mutation
+        # Fill the rest with crossover and mutation (scored together at the end)
+        offspring = []
         while len(new_population) < self.population_size:
             parent1 = self.selection()
             parent2 = self.selection()
@@ -597,39 +755,87 @@ class GeneticAlgorithm:
             self.mutate(child1, force_diversity=force_diversity_mode)
             self.mutate(child2, force_diversity=force_diversity_mode)
             
-            if child1.validate(self.campaign_ids, self.ad_ids):
-                self.fitness_evaluator.evaluate(child1)
+            if child1.is_valid():
                 new_population.append(child1)
+                offspring.append(child1)
             
             if len(new_population) < self.population_size:
-                if child2.validate(self.campaign_ids, self.ad_ids):
-                    self.fitness_evaluator.evaluate(child2)
+                if child2.is_valid():
                     new_population.append(child2)
+                    offspring.append(child2)
         
         # Inject random immigrants more frequently when diversity is low
         num_immigrants = 3 if force_diversity_mode else 1
+        immigrants = []
         
         if len(new_population) >= self.population_size:
             for _ in range(num_immigrants):
                 if len(new_population) > elite_size + 1:
-                    replace_idx = random.randint(elite_size, len(new_population) - 1)
-                    new_allocation = self.create_random_allocation()
-                    new_individual = Individual(allocation=new_allocation)
-                    self.fitness_evaluator.evaluate(new_individual)
+                    replace_idx = self.random.randint(elite_size, len(new_population) - 1)
+                    new_individual = self.create_random_allocation()
+                    immigrants.append(new_individual)
                     new_population[replace_idx] = new_individual
         
+        # Score every new individual of this generation in a single batch call
+        self.fitness_evaluator.evaluate_genomes(offspring + immigrants)
+        
         self.population = new_population[:self.population_size]
         self.population.sort(key=lambda x: x.fitness, reverse=True)
         
         # Track improvement
         if self.population[0].fitness > self.best_individual.fitness:
-            self.best_individual = deepcopy(self.population[0])
+            self.best_individual = self.population[0]
             self.generations_without_improvement = 0
         else:
             self.generations_without_improvement += 1
     
-    def run(self, verbose=True):
-        """Executes the complete genetic algorithm optimization process"""
+    def record_generation(self, generation: int) -> dict:
+        """Appends the statistics of the current population to the history and returns them"""
+        self.history.append({
+            'generation': generation,
+            'best_fitness': self.best_individual.fitness,
+            'best_roi': self.best_individual.total_roi,
+            'best_cost': self.best_individual.total_cost,
+            'avg_fitness': np.mean([ind.fitness for ind in self.population]),
+            'avg_roi': np.mean([ind.total_roi for ind in self.population]),
+            'diversity': self.calculate_population_diversity()
+        })
+        return self.history[-1]
+    
+    def receive_migrants(self, migrants: List[Genome]):
+        """
+        Replaces the worst individuals with already evaluated migrants from other islands
+        (island model). Migrants already in the population are skipped.
+        """
+        known = {genome.signature() for genome in self.population}
+        accepted = []
+        for genome in migrants:
+            if genome.signature() not in known:
+                known.add(genome.signature())
+                accepted.append(genome)
+        migrants = accepted[:max(0, len(self.population) - 1)]
+        if not migrants:
+            return
+        
+        self.population = self.population[:len(self.population) - len(migrants)] + migrants
+        self.population.sort(key=lambda x: x.fitness, reverse=True)
+        if self.population[0].fitness > self.best_individual.fitness:
+            self.best_individual = self.population[0]
+    
+    def run(self,
+            verbose=True,
+            progress_callback: Optional[Callable[[dict], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> Optional[Genome]:
+        """
+        Executes the complete genetic algorithm optimization process.
+        Returns the best Genome; use FitnessEvaluator.to_individual for the API model.
+        
+        Args:
+            verbose: Whether to print progress
+            progress_callback: Called with each generation's history entry
+            should_stop: Checked before every generation; when it returns True the run
+                         stops early and returns the best individual found so far
+        """
         print("Inicializando população para GA...")
         try:
             self.initialize_population()
@@ -646,29 +852,23 @@ class GeneticAlgorithm:
             print("-" * 70)
         
         for generation in range(self.max_generations):
-            self.evolve(generation=generation)
+            if should_stop is not None and should_stop():
+                print(f"GA interrompido na geração {generation}.")
+                break
             
-            avg_fitness = np.mean([ind.fitness for ind in self.population])
-            avg_roi = np.mean([ind.total_roi for ind in self.population])
-            diversity = self.calculate_population_diversity()
+            self.evolve(generation=generation)
+            entry = self.record_generation(generation)
             
-            self.history.append({
-                'generation': generation,
-                'best_fitness': self.best_individual.fitness,
-                'best_roi': self.best_individual.total_roi,
-                'best_cost': self.best_individual.total_cost,
-                'avg_fitness': avg_fitness,
-                'avg_roi': avg_roi,
-                'diversity': diversity
-            })
+            if progress_callback is not None:
+                progress_callback(entry)
             
             if verbose and (generation % 10 == 0 or generation == self.max_generations - 1):
                 print(f"Gen {generation:3d} | "
                       f"ROI: {self.best_individual.total_roi:7.2%} | "
                       f"Fitness: {self.best_individual.fitness:8.3f} | "
                       f"Cost: ${self.best_individual.total_cost:,.0f} | "
-                      f"Avg ROI: {avg_roi:7.2%} | "
-                      f"Div: {diversity:5.2%}")
+                      f"Avg ROI: {entry['avg_roi']:7.2%} | "
+                      f"Div: {entry['diversity']:5.2%}")
         
         if verbose:
             print("-" * 70)
@@ -728,12 +928,24 @@ def run_genetic_optimization(
     crossover_rate: float,
     total_budget: float,
     risk_factor: float,
-    verbose: bool = True
+    verbose: bool = True,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    islands: int = 1,
+    migration_interval: int = 10,
+    migrants: int = 2,
+    migration_topology: str = 'ring',
+    seed: Union[None, int, np.random.SeedSequence] = None
 ) -> Optional[Individual]:
     """
     Orchestrates the entire Genetic Algorithm optimization process.
     Expects campaigns and ads with already predicted overcosts and conversion rates.
     Handles GA setup and execution.
+    progress_callback / should_stop are forwarded to GeneticAlgorithm.run.
+    With islands > 1 the island model is used instead (see islandModel.run_island_model):
+    that many populations of population_size evolve in parallel processes and exchange
+    their best migrants every migration_interval generations.
+    seed makes the run reproducible (None: fresh entropy).
     """
     if not campaigns or not ads:
         print("Error: Campaigns or Ads lists are empty. Cannot run GA.")
@@ -746,24 +958,41 @@ def run_genetic_optimization(
         print("Error: No valid campaigns or ads found after processing for GA.")
         return None
     
+    stream = RandomStream(seed)
+    
     fitness_evaluator = FitnessEvaluator(
         data_manager=data_manager,
         total_budget=total_budget,
         risk_factor=risk_factor
     )
     
-    ga = GeneticAlgorithm(
-        population_size=population_size,
-        max_generations=max_generations,
-        mutation_rate=mutation_rate,
-        crossover_rate=crossover_rate,
-        fitness_evaluator=fitness_evaluator,
-        data_manager=data_manager
-    )
-    
     # 3. Run the Genetic Algorithm
     print("\n--- GA Orchestrator: Running Genetic Algorithm ---")
-    best_solution = ga.run(verbose=verbose)
+    if islands > 1:
+        # Imported here: islandModel depends on this module
+        from src.Genetic_Algorithm.islandModel import run_island_model
+        best_genome = run_island_model(
+            campaigns=campaigns, ads=ads, islands=islands,
+            population_size=population_size, max_generations=max_generations,
+            mutation_rate=mutation_rate, crossover_rate=crossover_rate,
+            total_budget=total_budget, risk_factor=risk_factor,
+            migration_interval=migration_interval, migrants=migrants, topology=migration_topology,
+            seed=stream.seed_sequence, verbose=verbose, progress_callback=progress_callback, should_stop=should_stop
+        )
+    else:
+        ga = GeneticAlgorithm(
+            population_size=population_size,
+            max_generations=max_generations,
+            mutation_rate=mutation_rate,
+            crossover_rate=crossover_rate,
+            fitness_evaluator=fitness_evaluator,
+            data_manager=data_manager,
+            stream=stream
+        )
+        best_genome = ga.run(verbose=verbose, progress_callback=progress_callback, should_stop=should_stop)
+    
+    # Materialize the API model only for the returned solution
+    best_solution = fitness_evaluator.to_individual(best_genome) if best_genome else None
     
     if best_solution:
         print("\n--- GA Orchestrator: Best solution details ---")
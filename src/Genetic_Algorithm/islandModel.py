@@ -0,0 +1,218 @@
+# islandModel.py
+"""
+Island-model Genetic Algorithm.
+
+K islands (independent populations) evolve in separate processes. The run is split in
+epochs of migration_interval generations: after each epoch, the best individuals of every
+island migrate to its neighbours (ring: island i -> island i+1; fully_connected: each island
+receives the best migrants of all the others) and replace their worst individuals.
+
+Each island is evolved by a GeneticAlgorithm built once per worker process (see
+_init_island_worker); between epochs the islands are plain picklable state.
+"""
+import os
+import numpy as np
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Callable, Literal, Union, get_args
+
+from src.Classes.models import Campaign, Ad
+from src.Genetic_Algorithm.geneticAlgorithm import Genome, GeneticAlgorithm, DataManager, FitnessEvaluator, RandomStream
+from src.Workers.optimizationPool import pack_problem, unpack_problem
+
+MigrationTopology = Literal['ring', 'fully_connected']
+
+# Maximum number of processes evolving islands for one run (env: ISLAND_WORKERS)
+ISLAND_WORKERS = max(1, int(os.getenv("ISLAND_WORKERS", os.cpu_count() or 1)))
+
+
+@dataclass
+class IslandState:
+    """Population and progress of one island between epochs"""
+    population: List[Genome]
+    best_individual: Genome
+    generations_without_improvement: int = 0
+    history: List[dict] = field(default_factory=list)
+
+
+# ============================================================================
+# 1. WORKER
+# ============================================================================
+
+# GeneticAlgorithm of the worker process, built once by _init_island_worker
+_island_ga: Optional[GeneticAlgorithm] = None
+
+
+def _init_island_worker(problem, settings: dict):
+    global _island_ga
+    campaigns, ads = unpack_problem(problem)
+    data_manager = DataManager(campaigns, ads)
+    _island_ga = GeneticAlgorithm(
+        population_size=settings['population_size'],
+        max_generations=settings['max_generations'],
+        mutation_rate=settings['mutation_rate'],
+        crossover_rate=settings['crossover_rate'],
+        fitness_evaluator=FitnessEvaluator(data_manager=data_manager,
+                                           total_budget=settings['total_budget'],
+                                           risk_factor=settings['risk_factor']),
+        data_manager=data_manager
+    )
+
+
+def _run_island_epoch(state: Optional[IslandState], migrants: List[Genome],
+                      first_generation: int, generations: int, seed: np.random.SeedSequence) -> IslandState:
+    """Receives the migrants and evolves one island for an epoch (state None: new island)"""
+    ga = _island_ga
+    ga.set_random_stream(RandomStream(seed))
+
+    if state is None:
+        ga.initialize_population()
+        ga.generations_without_improvement = 0
+    else:
+        ga.population = state.population
+        ga.best_individual = state.best_individual
+        ga.generations_without_improvement = state.generations_without_improvement
+    ga.history = []
+
+    ga.receive_migrants(migrants)
+    for generation in range(first_generation, first_generation + generations):
+        ga.evolve(generation=generation)
+        ga.record_generation(generation)
+
+    return IslandState(ga.population, ga.best_individual, ga.generations_without_improvement, ga.history)
+
+
+# ============================================================================
+# 2. MIGRAÇÃO
+# ============================================================================
+
+def route_migrants(emigrants: List[List[Genome]], topology: MigrationTopology, count: int) -> List[List[Genome]]:
+    """Migrants received by each island, given the emigrants (best individuals) of every island"""
+    islands = len(emigrants)
+    if islands < 2 or count <= 0:
+        return [[] for _ in range(islands)]
+
+    if topology == 'ring':
+        return [list(emigrants[(i - 1) % islands][:count]) for i in range(islands)]
+
+    if topology == 'fully_connected':
+        received = []
+        for i in range(islands):
+            others = [genome for j in range(islands) if j != i for genome in emigrants[j]]
+            received.append(sorted(others, key=lambda genome: genome.fitness, reverse=True)[:count])
+        return received
+
+    raise ValueError(f"Unknown migration topology '{topology}'")
+
+
+def _merge_history(histories: List[List[dict]]) -> List[dict]:
+    """
+    One entry per generation for the whole archipelago: best values from the island with the
+    best fitness, averages (avg_fitness, avg_roi, diversity) over the islands.
+    """
+    merged = []
+    for entries in zip(*histories):
+        best = max(entries, key=lambda entry: entry['best_fitness'])
+        merged.append({
+            **best,
+            'avg_fitness': float(np.mean([entry['avg_fitness'] for entry in entries])),
+            'avg_roi': float(np.mean([entry['avg_roi'] for entry in entries])),
+            'diversity': float(np.mean([entry['diversity'] for entry in entries])),
+            'best_island': entries.index(best),
+        })
+    return merged
+
+
+# ============================================================================
+# 3. ORQUESTRAÇÃO
+# ============================================================================
+
+def run_island_model(
+    campaigns: List[Campaign],
+    ads: List[Ad],
+    islands: int,
+    population_size: int,
+    max_generations: int,
+    mutation_rate: float,
+    crossover_rate: float,
+    total_budget: float,
+    risk_factor: float,
+    migration_interval: int = 10,
+    migrants: int = 2,
+    topology: MigrationTopology = 'ring',
+    verbose: bool = True,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    max_workers: int = ISLAND_WORKERS,
+    seed: Union[None, int, np.random.SeedSequence] = None
+) -> Optional[Genome]:
+    """
+    Evolves `islands` populations of population_size individuals for max_generations in a
+    dedicated process pool, migrating `migrants` individuals every migration_interval
+    generations. Returns the best Genome over all islands.
+    progress_callback receives one merged history entry per generation, after each epoch;
+    should_stop is checked between epochs. Each island draws from its own child stream of
+    seed, so a seeded run is reproducible whatever the number of worker processes.
+    """
+    if islands < 1:
+        raise ValueError("islands must be at least 1")
+    if migration_interval < 1:
+        raise ValueError("migration_interval must be at least 1")
+    if topology not in get_args(MigrationTopology):
+        raise ValueError(f"Unknown migration topology '{topology}'")
+
+    settings = dict(population_size=population_size, max_generations=max_generations,
+                    mutation_rate=mutation_rate, crossover_rate=crossover_rate,
+                    total_budget=total_budget, risk_factor=risk_factor)
+    island_seeds = RandomStream(seed).spawn(islands)
+
+    states: List[Optional[IslandState]] = [None] * islands
+    received: List[List[Genome]] = [[] for _ in range(islands)]
+    best: Optional[Genome] = None
+
+    if verbose:
+        print(f"GA em ilhas: {islands} ilhas x {population_size} indivíduos, "
+              f"migração de {migrants} a cada {migration_interval} gerações ({topology})")
+
+    with ProcessPoolExecutor(max_workers=min(islands, max_workers), initializer=_init_island_worker,
+                             initargs=(pack_problem(campaigns, ads), settings)) as executor:
+        for first_generation in range(0, max_generations, migration_interval):
+            if should_stop is not None and should_stop():
+                print(f"GA interrompido na geração {first_generation}.")
+                break
+
+            generations = min(migration_interval, max_generations - first_generation)
+            # Every island / epoch gets its own random state
+            futures = [
+                executor.submit(_run_island_epoch, states[i], received[i], first_generation, generations,
+                                island_seeds[i].spawn(1)[0])
+                for i in range(islands)
+            ]
+            try:
+                states = [future.result() for future in futures]
+            except ValueError as e:
+                print(f"FATAL GA ERROR: {e}")
+                return None
+
+            received = route_migrants([state.population[:migrants] for state in states], topology, migrants)
+
+            for state in states:
+                if best is None or state.best_individual.fitness > best.fitness:
+                    best = state.best_individual
+
+            history = _merge_history([state.history for state in states])
+            if progress_callback is not None:
+                for entry in history:
+                    progress_callback(entry)
+
+            if verbose and history:
+                entry = history[-1]
+                print(f"Gen {entry['generation']:3d} | "
+                      f"ROI: {best.total_roi:7.2%} | "
+                      f"Fitness: {best.fitness:8.3f} | "
+                      f"Cost: ${best.total_cost:,.0f} | "
+                      f"Avg ROI: {entry['avg_roi']:7.2%} | "
+                      f"Div: {entry['diversity']:5.2%} | "
+                      f"Ilha: {entry['best_island']}")
+
+    return best
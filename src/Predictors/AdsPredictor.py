@@ -1,19 +1,29 @@
-import joblib
-import pandas as pd
+import os
 import numpy as np
-import holidays
-import calendar
-from typing import List
-from datetime import datetime
+from typing import List, Dict, Sequence
 from src.Classes.models import Ad
+from src.Predictors.modelRegistry import model_registry, MODELS_DIRECTORY
+from src.Predictors.inferenceBackend import make_predictor
+from src.Predictors.predictionCache import PredictionCache, predict_with_cache
+from src.Predictors.featureSchema import FeatureSchema, DateFeature, CategoricalFeature, one_hot
 
-# --- 1. Carregar o Modelo ---
-try:
-    MODEL = joblib.load("src/Model_Training/Trained_Models/Advertising/Advertising_LightGBM_Optimized_R2-0.771_20260118_1509.joblib") 
-    print("Modelo ML Ads carregado com sucesso.")
-except Exception as e:
-    print(f"ERRO CRÍTICO: Não foi possível carregar o modelo. {e}")
-    MODEL = None
+# --- 1. Registar o Modelo ---
+# O model_registry carrega a versão mais recente de MODEL_DIRECTORY (em background no arranque
+# ou no primeiro uso) e permite trocá-la em execução
+MODEL_NAME = "ads"
+MODEL_DIRECTORY = os.path.join(MODELS_DIRECTORY, "Advertising")
+
+def prepare_model(artifact):
+    """Backend de inferência nativo (booster LightGBM) sobre matrizes em COLUNAS_MODELO"""
+    return make_predictor(artifact, COLUNAS_MODELO)
+
+def warmup_model(model):
+    """Previsão de aquecimento com uma linha a zeros"""
+    model.predict(np.zeros((1, len(COLUNAS_MODELO)), dtype=ADS_SCHEMA.dtype))
+
+model_registry.register(MODEL_NAME, MODEL_DIRECTORY, warmup=warmup_model, prepare=prepare_model)
+
+PREDICTION_CACHE = PredictionCache()
 
 # --- 2. Definições e Mapeamentos ---
 
@@ -44,127 +54,73 @@ def get_time_of_day(hour: int) -> int:
     elif 12 <= hour < 18: return 2  # Tarde
     else: return 3                  # Noite
 
-def is_holiday_check(date_obj, country_str: str) -> int:
+# --- 4. Construção Vetorizada das Features ---
+
+def time_of_day_from_hours(hours: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de get_time_of_day: [0,6) Madrugada, [6,12) Manhã, [12,18) Tarde, [18,24) Noite"""
+    return hours // 6
+
+ADS_SCHEMA = FeatureSchema(COLUNAS_MODELO, [
+    DateFeature('time_of_day', 'timestamp', 'hour', time_of_day_from_hours),
+    CategoricalFeature('age_group_encoded', 'age_group', AGE_MAP),
+    CategoricalFeature('engagement_level_encoded', 'engagement_level', ENGAGEMENT_MAP),
+    *one_hot('device_type', ['Mobile', 'Tablet']),
+    *one_hot('location', ['Germany', 'India', 'UK', 'USA']),
+    *one_hot('gender', ['Male']),
+    *one_hot('content_type', ['Text', 'Video']),
+    *one_hot('ad_topic', ['Electronics', 'Entertainment', 'Fashion', 'Finance', 'Food', 'Health', 'Travel']),
+    *one_hot('ad_target_audience', ['Fitness Lovers', 'Professionals', 'Students',
+                                    'Tech Enthusiasts', 'Travel Lovers', 'Young Adults']),
+])
+
+
+def ads_to_columns(ads: List[Ad]) -> Dict[str, list]:
+    """Transpõe uma lista de Ads em colunas (uma lista por atributo)"""
+    return ADS_SCHEMA.to_columns(ads)
+
+
+def build_ads_feature_matrix(columns: Dict[str, Sequence]) -> np.ndarray:
     """
-    Verifica se é feriado usando a biblioteca 'holidays' dinamicamente.
+    Constrói a matriz de features (float32, colunas na ordem de COLUNAS_MODELO) a partir
+    de colunas de atributos. Categorias desconhecidas ficam a 0, como no mapeamento original.
+    """
+    return ADS_SCHEMA.encode(columns)
+
+
+def build_ads_features(ads: List[Ad]) -> np.ndarray:
+    """Matriz de features de uma lista de Ads (ver build_ads_feature_matrix)"""
+    return ADS_SCHEMA.encode_objects(ads)
+
+
+# --- 5. Função Principal de Previsão ---
+
+def predict_ads_conversion_rates_ml(ads: List[Ad], raise_errors: bool = False) -> List[Ad]:
+    """
+    Preenche conversion_rate de cada Ad com a previsão do modelo. Com raise_errors, um erro no
+    predict é propagado; caso contrário é apenas registado e os objetos ficam sem previsão.
     """
-    try:
-        # Mapear string do modelo para a classe da biblioteca holidays
-        country_obj = None
-        year = date_obj.year
-        
-        if country_str == 'USA': country_obj = holidays.US(years=year)
-        elif country_str == 'UK': country_obj = holidays.GB(years=year)
-        elif country_str == 'Germany': country_obj = holidays.DE(years=year)
-        elif country_str == 'India': country_obj = holidays.IN(years=year)
-        elif country_str == 'Canada': country_obj = holidays.CA(years=year)
-        
-        if country_obj and date_obj in country_obj:
-            return 1
-        return 0
-    except Exception:
-        return 0
-
-# --- 4. Função Principal de Previsão ---
-
-def predict_ads_conversion_rates_ml(ads: List[Ad]) -> List[Ad]:
     if not ads:
         return []
     
-    if MODEL is None:
+    model, model_version = model_registry.get(MODEL_NAME)
+    if model is None:
         print("Aviso: Modelo off-line. Retornando conversion_rate = 0")
         return ads
 
-    rows = []
-
-    for ad in ads:
-        # Garantir que é um objeto datetime
-        if isinstance(ad.timestamp, str):
-            dt = datetime.fromisoformat(ad.timestamp)
-        else:
-            dt = ad.timestamp
-        
-        # --- FEATURE ENGINEERING (Réplica Exata) ---
-        
-        # 1. Features Básicas
-        hour = dt.hour
-        day_of_week = dt.weekday() # 0=Monday, 6=Sunday
-        day_of_month = dt.day
-        month = dt.month
-        
-        # 2. Início e Fim do Mês 
-        # "is_month_start = 1 if x <= 7 else 0"
-        is_month_start = 1 if day_of_month <= 7 else 0
-        
-        # "is_month_end = 1 if (days_in_month - day) < 7 else 0"
-        # calendar.monthrange retorna (weekday_first_day, number_of_days)
-        total_days_in_month = calendar.monthrange(dt.year, dt.month)[1]
-        is_month_end = 1 if (total_days_in_month - day_of_month) < 7 else 0
-        
-        # 3. Fim de Semana
-        # "is_weekend = 1 if x >= 5 else 0" (Sábado=5, Domingo=6)
-        is_weekend = 1 if day_of_week >= 5 else 0
-        
-        # 4. Time of Day 
-        time_of_day_val = get_time_of_day(hour)
-        
-        # 5. Feriados (Usando biblioteca holidays)
-        is_holiday_val = is_holiday_check(dt, ad.location)
-        
-        # --- CONSTRUÇÃO DO DICIONÁRIO ---
-        row = {
-            'time_of_day': time_of_day_val,
-            'age_group_encoded': AGE_MAP.get(ad.age_group, 0),
-            'engagement_level_encoded': ENGAGEMENT_MAP.get(ad.engagement_level, 0),
-            # One-Hot Encoding Manual (0 ou 1)
-            'device_type_Mobile': 1 if ad.device_type == 'Mobile' else 0,
-            'device_type_Tablet': 1 if ad.device_type == 'Tablet' else 0,
-            'location_Germany': 1 if ad.location == 'Germany' else 0,
-            'location_India': 1 if ad.location == 'India' else 0,
-            'location_UK': 1 if ad.location == 'UK' else 0,
-            'location_USA': 1 if ad.location == 'USA' else 0,
-            'gender_Male': 1 if ad.gender == 'Male' else 0,
-            'content_type_Text': 1 if ad.content_type == 'Text' else 0,
-            'content_type_Video': 1 if ad.content_type == 'Video' else 0,
-            'ad_topic_Electronics': 1 if ad.ad_topic == 'Electronics' else 0,
-            'ad_topic_Entertainment': 1 if ad.ad_topic == 'Entertainment' else 0,
-            'ad_topic_Fashion': 1 if ad.ad_topic == 'Fashion' else 0,
-            'ad_topic_Finance': 1 if ad.ad_topic == 'Finance' else 0,
-            'ad_topic_Food': 1 if ad.ad_topic == 'Food' else 0,
-            'ad_topic_Health': 1 if ad.ad_topic == 'Health' else 0,
-            'ad_topic_Travel': 1 if ad.ad_topic == 'Travel' else 0, 
-            'ad_target_audience_Fitness_Lovers': 1 if ad.ad_target_audience == 'Fitness Lovers' else 0,
-            'ad_target_audience_Professionals': 1 if ad.ad_target_audience == 'Professionals' else 0,
-            'ad_target_audience_Students': 1 if ad.ad_target_audience == 'Students' else 0,
-            'ad_target_audience_Tech_Enthusiasts': 1 if ad.ad_target_audience == 'Tech Enthusiasts' else 0,
-            'ad_target_audience_Travel_Lovers': 1 if ad.ad_target_audience == 'Travel Lovers' else 0,
-            'ad_target_audience_Young_Adults': 1 if ad.ad_target_audience == 'Young Adults' else 0,
-        }
-            
-        # Preencher colunas faltantes com 0 (segurança)
-        for col in COLUNAS_MODELO:
-            if col not in row:
-                row[col] = 0
-                
-        rows.append(row)
-
-    # --- PREVISÃO ---
-    if rows:
-        # Criar DataFrame e forçar ordem das colunas
-        df_predict = pd.DataFrame(rows)
-        df_predict = df_predict[COLUNAS_MODELO]
-
-        try:
-            predictions = MODEL.predict(df_predict)
-            
-            # Atualizar os objetos Ad originais
-            for i, ad in enumerate(ads):
-                # Arredondar e garantir que é float python (não numpy float)
-                ad.conversion_rate = round(float(predictions[i]), 4)
-                #print(f"Conversion Rate previsto para Ad ID {ad.id}: {ad.conversion_rate}")
-
-                    
-        except Exception as e:
-            print(f"Erro durante o predict: {e}")
-
-    return ads
\ No newline at end of file
+    try:
+        # Só as linhas com features ainda não vistas passam pelo modelo
+        predictions = predict_with_cache(
+            PREDICTION_CACHE, build_ads_features(ads), model_version,
+            model.predict
+        )
+
+        # Atualizar os objetos Ad originais
+        for ad, prediction in zip(ads, predictions):
+            ad.conversion_rate = prediction
+
+    except Exception as e:
+        print(f"Erro durante o predict: {e}")
+        if raise_errors:
+            raise
+
+    return ads
@@ -1,19 +1,29 @@
-import joblib
-import pandas as pd
+import os
 import numpy as np
-import holidays
-import calendar
 from typing import List
-from datetime import datetime
 from src.Classes.models import Campaign
+from src.Predictors.modelRegistry import model_registry, MODELS_DIRECTORY
+from src.Predictors.inferenceBackend import make_predictor
+from src.Predictors.predictionCache import PredictionCache, predict_with_cache
+from src.Predictors.featureSchema import FeatureSchema, NumericFeature, DateFeature, one_hot
 
-# --- 1. Carregar o Modelo ---
-try:
-    MODEL = joblib.load("src/Model_Training/Trained_Models/Marketing/Marketing_LightGBM_Optimized_R2-0.635_20260118_1515.joblib") 
-    print("Modelo ML Campaigns carregado com sucesso.")
-except Exception as e:
-    print(f"ERRO CRÍTICO: Não foi possível carregar o modelo. {e}")
-    MODEL = None
+# --- 1. Registar o Modelo ---
+# O model_registry carrega a versão mais recente de MODEL_DIRECTORY (em background no arranque
+# ou no primeiro uso) e permite trocá-la em execução
+MODEL_NAME = "campaigns"
+MODEL_DIRECTORY = os.path.join(MODELS_DIRECTORY, "Marketing")
+
+def prepare_model(artifact):
+    """Backend de inferência nativo (booster LightGBM) sobre matrizes em COLUNAS_MODELO"""
+    return make_predictor(artifact, COLUNAS_MODELO)
+
+def warmup_model(model):
+    """Previsão de aquecimento com uma linha a zeros"""
+    model.predict(np.zeros((1, len(COLUNAS_MODELO)), dtype=CAMPAIGNS_SCHEMA.dtype))
+
+model_registry.register(MODEL_NAME, MODEL_DIRECTORY, warmup=warmup_model, prepare=prepare_model)
+
+PREDICTION_CACHE = PredictionCache()
 
 # --- 2. Definições e Mapeamentos ---
 
@@ -23,86 +33,57 @@ COLUNAS_MODELO = ['no_of_days', 'approved_budget', 'start_month',
                   'channel_name_Search', 'channel_name_Social', 'channel_name_Video', 
                   'search_tag_cat_Other', 'search_tag_cat_Retargeting', 'search_tag_cat_Youtube']    
 
-# --- 3. Função Principal de Previsão ---
+def is_weekend_from_weekdays(weekdays: np.ndarray) -> np.ndarray:
+    """"is_weekend = 1 if x >= 5 else 0" (Sábado=5, Domingo=6)"""
+    return (weekdays >= 5).astype(np.int8)
+
+# float64: approved_budget não cabe sem perdas em float32
+CAMPAIGNS_SCHEMA = FeatureSchema(COLUNAS_MODELO, [
+    NumericFeature('no_of_days', 'no_of_days'),
+    NumericFeature('approved_budget', 'approved_budget'),
+    DateFeature('start_month', 'time', 'month'),
+    DateFeature('day_of_week', 'time', 'dayofweek'),  # 0=Monday, 6=Sunday
+    DateFeature('is_weekend', 'time', 'dayofweek', is_weekend_from_weekdays),
+    *one_hot('ext_service_name', ['Facebook Ads', 'Google Ads'], space=' '),
+    *one_hot('channel_name', ['Mobile', 'Search', 'Social', 'Video']),
+    *one_hot('search_tag_cat', ['Other', 'Retargeting', 'Youtube']),
+], dtype=np.float64)
+
 
-def predict_campaigns_overcosts_ml(campaigns: List[Campaign]) -> List[Campaign]:
+def build_campaigns_features(campaigns: List[Campaign]) -> np.ndarray:
+    """Matriz de features (colunas na ordem de COLUNAS_MODELO) de uma lista de Campaigns"""
+    return CAMPAIGNS_SCHEMA.encode_objects(campaigns)
+
+
+# --- 4. Função Principal de Previsão ---
+
+def predict_campaigns_overcosts_ml(campaigns: List[Campaign], raise_errors: bool = False) -> List[Campaign]:
+    """
+    Preenche overcost de cada Campaign com a previsão do modelo. Com raise_errors, um erro no
+    predict é propagado; caso contrário é apenas registado e os objetos ficam sem previsão.
+    """
     if not campaigns:
         return []
     
-    if MODEL is None:
+    model, model_version = model_registry.get(MODEL_NAME)
+    if model is None:
         print("Aviso: Modelo off-line. Retornando overcost = 0")
         return campaigns
 
-    rows = []
-
-    for campaign in campaigns:
-        # Garantir que é um objeto date
-        dt = campaign.time
-        if not isinstance(dt, datetime):
-            dt = datetime.combine(campaign.time, datetime.min.time())
-        
-        # --- FEATURE ENGINEERING (Réplica Exata) ---
-        
-        # 1. Features Básicas
-        day_of_week = dt.weekday() # 0=Monday, 6=Sunday
-        day_of_month = dt.day
-        month = dt.month
-        
-        # 2. Início e Fim do Mês 
-        # "is_month_start = 1 if x <= 7 else 0"
-        is_month_start = 1 if day_of_month <= 7 else 0
-        
-        # "is_month_end = 1 if (days_in_month - day) < 7 else 0"
-        # calendar.monthrange retorna (weekday_first_day, number_of_days)
-        total_days_in_month = calendar.monthrange(dt.year, dt.month)[1]
-        is_month_end = 1 if (total_days_in_month - day_of_month) < 7 else 0
-        
-        # 3. Fim de Semana
-        # "is_weekend = 1 if x >= 5 else 0" (Sábado=5, Domingo=6)
-        is_weekend = 1 if day_of_week >= 5 else 0
-
-        # --- CONSTRUÇÃO DO DICIONÁRIO ---
-        row = {
-            'no_of_days': campaign.no_of_days,
-            'approved_budget': campaign.approved_budget,
-            'start_month': month,
-            'day_of_week': day_of_week,
-            'is_weekend': is_weekend,
-            'ext_service_name_Facebook Ads': 1 if campaign.ext_service_name == 'Facebook Ads' else 0,
-            'ext_service_name_Google Ads': 1 if campaign.ext_service_name == 'Google Ads' else 0,
-            'channel_name_Mobile': 1 if campaign.channel_name == 'Mobile' else 0,
-            'channel_name_Search': 1 if campaign.channel_name == 'Search' else 0,
-            'channel_name_Social': 1 if campaign.channel_name == 'Social' else 0,
-            'channel_name_Video': 1 if campaign.channel_name == 'Video' else 0,
-            'search_tag_cat_Other': 1 if campaign.search_tag_cat == 'Other' else 0,
-            'search_tag_cat_Retargeting': 1 if campaign.search_tag_cat == 'Retargeting' else 0,
-            'search_tag_cat_Youtube': 1 if campaign.search_tag_cat == 'Youtube' else 0,
-        }
-        
-        # Preencher colunas faltantes com 0 (segurança)
-        for col in COLUNAS_MODELO:
-            if col not in row:
-                row[col] = 0
-                
-        rows.append(row)
-
-    # --- PREVISÃO ---
-    if rows:
-        # Criar DataFrame e forçar ordem das colunas
-        df_predict = pd.DataFrame(rows)
-        df_predict = df_predict[COLUNAS_MODELO]
-
-        try:
-            predictions = MODEL.predict(df_predict)
-            
-            # Atualizar os objetos Ad originais
-            for i, campaign in enumerate(campaigns):
-                # Arredondar e garantir que é float python (não numpy float)
-                campaign.overcost = round(float(predictions[i]), 4)
-                #print(f"Conversion Rate previsto para Campaign ID {campaign.ID}: {campaign.overcost}")
-
-                    
-        except Exception as e:
-            print(f"Erro durante o predict: {e}")
-
-    return campaigns
\ No newline at end of file
+    try:
+        # Só as linhas com features ainda não vistas passam pelo modelo
+        predictions = predict_with_cache(
+            PREDICTION_CACHE, build_campaigns_features(campaigns), model_version,
+            model.predict
+        )
+
+        # Atualizar os objetos Campaign originais
+        for campaign, prediction in zip(campaigns, predictions):
+            campaign.overcost = prediction
+
+    except Exception as e:
+        print(f"Erro durante o predict: {e}")
+        if raise_errors:
+            raise
+
+    return campaigns
@@ -0,0 +1,140 @@
+# featureSchema.py
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Dict, Sequence, Callable, Optional, Union, Any
+
+# --- 1. Tipos de Feature ---
+
+@dataclass(frozen=True)
+class NumericFeature:
+    """Coluna copiada diretamente de um atributo numérico"""
+    column: str
+    attribute: str
+
+
+@dataclass(frozen=True)
+class DateFeature:
+    """
+    Coluna derivada de um atributo de data / hora.
+    part é um campo do DatetimeIndex do pandas ('hour', 'dayofweek', 'month', 'day', ...);
+    transform (opcional) é aplicado ao array inteiro resultante.
+    """
+    column: str
+    attribute: str
+    part: str
+    transform: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+
+@dataclass(frozen=True)
+class CategoricalFeature:
+    """Coluna obtida mapeando cada categoria para um valor (categorias desconhecidas -> 0)"""
+    column: str
+    attribute: str
+    mapping: Dict[Any, float]
+
+
+Feature = Union[NumericFeature, DateFeature, CategoricalFeature]
+
+
+def one_hot(attribute: str, values: Sequence[str], prefix: Optional[str] = None,
+            space: str = '_') -> List[CategoricalFeature]:
+    """Colunas one-hot '{prefix}_{valor}' de um atributo categórico (espaços do valor passam a space)"""
+    prefix = prefix or attribute
+    return [CategoricalFeature(f"{prefix}_{value.replace(' ', space)}", attribute, {value: 1})
+            for value in values]
+
+
+def wall_clock(values: Sequence) -> pd.DatetimeIndex:
+    """
+    Datas / horas locais de uma coluna, como ao ler dt.hour, dt.month, ... linha a linha:
+    o fuso de cada valor é descartado (sem conversão para UTC), pelo que uma coluna pode
+    misturar fusos diferentes, ou valores com e sem fuso.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+        return pd.DatetimeIndex(values)
+
+    local = []
+    for value in values:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        local.append(value)
+    return pd.DatetimeIndex(pd.to_datetime(local))
+
+
+# --- 2. Schema ---
+
+class FeatureSchema:
+    """
+    Codificador colunar declarativo: transforma colunas de atributos (ou uma lista de
+    objetos) numa matriz contígua com as colunas na ordem do modelo, sem ciclos por linha.
+    Colunas do modelo sem feature declarada ficam a 0.
+    """
+
+    def __init__(self, columns: List[str], features: List[Feature], dtype=np.float32):
+        self.columns = list(columns)
+        self.features = list(features)
+        self.dtype = dtype
+        self.column_index = {col: i for i, col in enumerate(self.columns)}
+
+        unknown = [f.column for f in self.features if f.column not in self.column_index]
+        if unknown:
+            raise ValueError(f"Features fora das colunas do modelo: {unknown}")
+
+        self.attributes = tuple(dict.fromkeys(f.attribute for f in self.features))
+
+        # Features categóricas agrupadas por atributo (cada atributo é fatorizado uma vez)
+        self._categorical: Dict[str, List[CategoricalFeature]] = {}
+        for feature in self.features:
+            if isinstance(feature, CategoricalFeature):
+                self._categorical.setdefault(feature.attribute, []).append(feature)
+
+    def to_columns(self, objects: Sequence[Any]) -> Dict[str, list]:
+        """Transpõe uma lista de objetos em colunas (uma lista por atributo usado)"""
+        return {attr: [getattr(obj, attr) for obj in objects] for attr in self.attributes}
+
+    def encode(self, columns: Dict[str, Sequence]) -> np.ndarray:
+        """
+        Constrói a matriz de features (n_linhas x len(columns)) a partir de colunas de atributos
+        (listas, arrays NumPy ou pd.Categorical).
+        """
+        n_rows = len(columns[self.attributes[0]]) if self.attributes else 0
+        matrix = np.zeros((n_rows, len(self.columns)), dtype=self.dtype)
+        dates: Dict[str, pd.DatetimeIndex] = {}
+
+        for feature in self.features:
+            target = self.column_index[feature.column]
+
+            if isinstance(feature, NumericFeature):
+                matrix[:, target] = np.asarray(columns[feature.attribute], dtype=np.float64)
+
+            elif isinstance(feature, DateFeature):
+                if feature.attribute not in dates:
+                    dates[feature.attribute] = wall_clock(columns[feature.attribute])
+                values = np.asarray(getattr(dates[feature.attribute], feature.part))
+                matrix[:, target] = feature.transform(values) if feature.transform else values
+
+        for attribute, features in self._categorical.items():
+            values = columns[attribute]
+            if isinstance(values, pd.Categorical):
+                # Já codificada (ex.: coluna dictionary lida de Parquet): sem fatorizar
+                codes, categories = values.codes, values.categories
+            else:
+                codes, categories = pd.factorize(np.asarray(values, dtype=object))
+            target = [self.column_index[f.column] for f in features]
+
+            # Última linha a zeros: os valores em falta (código -1) indexam-na
+            table = np.zeros((len(categories) + 1, len(features)), dtype=self.dtype)
+            for j, feature in enumerate(features):
+                table[:-1, j] = [feature.mapping.get(category, 0) for category in categories]
+
+            matrix[:, target] = table[codes]
+
+        return matrix
+
+    def encode_objects(self, objects: Sequence[Any]) -> np.ndarray:
+        """Matriz de features de uma lista de objetos (ver encode)"""
+        return self.encode(self.to_columns(objects))
@@ -0,0 +1,82 @@
+# inferenceBackend.py
+import os
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Any
+
+# Threads used by LightGBM per prediction call (env: INFERENCE_THREADS, 0 = LightGBM default)
+INFERENCE_THREADS = int(os.getenv("INFERENCE_THREADS", 1))
+
+# Rows per booster call for very large batches (env: INFERENCE_CHUNK_SIZE)
+INFERENCE_CHUNK_SIZE = int(os.getenv("INFERENCE_CHUNK_SIZE", 100_000))
+
+
+class BoosterPredictor:
+    """
+    Native inference on the LightGBM booster of a trained artifact: feature-selection
+    steps of the pipeline are folded into a column index, and the raw NumPy matrix is
+    passed straight to Booster.predict (no DataFrame, no sklearn validation).
+    """
+
+    def __init__(self, booster, feature_index: Optional[np.ndarray] = None,
+                 num_threads: int = INFERENCE_THREADS, chunk_size: int = INFERENCE_CHUNK_SIZE):
+        self.booster = booster
+        self.feature_index = feature_index
+        self.num_threads = num_threads
+        self.chunk_size = chunk_size
+
+    def predict(self, matrix: np.ndarray) -> np.ndarray:
+        if self.feature_index is not None:
+            matrix = matrix[:, self.feature_index]
+        matrix = np.ascontiguousarray(matrix)
+
+        if len(matrix) <= self.chunk_size:
+            return self.booster.predict(matrix, num_threads=self.num_threads)
+
+        predictions = np.empty(len(matrix), dtype=np.float64)
+        for start in range(0, len(matrix), self.chunk_size):
+            end = start + self.chunk_size
+            predictions[start:end] = self.booster.predict(matrix[start:end], num_threads=self.num_threads)
+        return predictions
+
+
+class FramePredictor:
+    """Fallback for artifacts that are not (a pipeline ending in) a LightGBM model"""
+
+    def __init__(self, artifact, columns: List[str]):
+        self.artifact = artifact
+        self.columns = columns
+
+    def predict(self, matrix: np.ndarray) -> np.ndarray:
+        # Colunas nomeadas: o pipeline foi treinado com um DataFrame
+        return np.asarray(self.artifact.predict(pd.DataFrame(matrix, columns=self.columns, copy=False)))
+
+
+def _as_booster(estimator) -> Optional[Any]:
+    if hasattr(estimator, 'booster_'):          # LGBMRegressor / LGBMModel
+        return estimator.booster_
+    if hasattr(estimator, 'model_to_string'):   # lightgbm.Booster
+        return estimator
+    return None
+
+
+def make_predictor(artifact, columns: List[str]):
+    """
+    Inference backend of a loaded artifact whose input is a matrix in `columns` order:
+    BoosterPredictor when the artifact reduces to a LightGBM booster, FramePredictor otherwise.
+    """
+    steps = [step for _, step in artifact.steps] if hasattr(artifact, 'steps') else [artifact]
+    feature_index = np.arange(len(columns))
+
+    for step in steps[:-1]:
+        if step == 'passthrough' or step is None:
+            continue
+        if not hasattr(step, 'get_support'):
+            return FramePredictor(artifact, columns)
+        feature_index = feature_index[step.get_support()]
+
+    booster = _as_booster(steps[-1])
+    if booster is None:
+        return FramePredictor(artifact, columns)
+
+    return BoosterPredictor(booster, None if len(feature_index) == len(columns) else feature_index)
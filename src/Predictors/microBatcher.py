@@ -0,0 +1,103 @@
+# microBatcher.py
+import os
+import asyncio
+from typing import List, Tuple, Callable, Optional, Any, Set
+
+# How long the first request of a batch waits for others to join it (env: MICROBATCH_WAIT_MS)
+MICROBATCH_WAIT_MS = float(os.getenv("MICROBATCH_WAIT_MS", 2))
+
+# A batch is sent as soon as it reaches this many rows (env: MICROBATCH_MAX_ROWS)
+MICROBATCH_MAX_ROWS = int(os.getenv("MICROBATCH_MAX_ROWS", 4096))
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests into one model call.
+
+    Requests arriving within max_wait_ms of the first pending one (or until max_rows rows
+    are pending) are concatenated, predicted with a single predict_fn call in a worker
+    thread, and each caller gets back its own slice of the result.
+    predict_fn takes and returns a list of rows in the same order, and raises on errors:
+    when a merged call fails, each request of the batch is predicted on its own, so the
+    error only reaches the request(s) that caused it.
+    """
+
+    def __init__(self, predict_fn: Callable[[List[Any]], List[Any]],
+                 max_wait_ms: float = MICROBATCH_WAIT_MS, max_rows: int = MICROBATCH_MAX_ROWS):
+        self.predict_fn = predict_fn
+        self.max_wait = max_wait_ms / 1000
+        self.max_rows = max_rows
+
+        self._pending: List[Tuple[List[Any], asyncio.Future]] = []
+        self._pending_rows = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.requests = 0
+        self.rows = 0
+
+    async def submit(self, rows: List[Any]) -> List[Any]:
+        """Predicts rows as part of the next batch"""
+        if not rows:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((rows, future))
+        self._pending_rows += len(rows)
+
+        if self._pending_rows >= self.max_rows:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+
+        return await future
+
+    def _dispatch(self):
+        """Takes every pending request as one batch and predicts it in the background"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending, self._pending_rows = self._pending, [], 0
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[List[Any], asyncio.Future]]):
+        rows = [row for request_rows, _ in batch for row in request_rows]
+        try:
+            results = await asyncio.to_thread(self.predict_fn, rows)
+        except Exception as e:
+            if len(batch) > 1:
+                await asyncio.gather(*(self._run([request]) for request in batch))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.requests += len(batch)
+        self.rows += len(rows)
+
+        # Scatter: each request gets its slice back
+        start = 0
+        for request_rows, future in batch:
+            end = start + len(request_rows)
+            if not future.done():
+                future.set_result(results[start:end])
+            start = end
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "rows": self.rows,
+            "avg_requests_per_batch": self.requests / self.batches if self.batches else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_rows": self.max_rows,
+        }
@@ -0,0 +1,287 @@
+# modelRegistry.py
+import os
+import re
+import glob
+import time
+import threading
+import joblib
+from typing import Dict, List, Tuple, Optional, Callable, Any, Literal
+
+ModelState = Literal['not_loaded', 'loading', 'ready', 'failed']
+
+# 'background' loads every model in a thread at startup, 'lazy' on first use (env: MODEL_LOADING)
+MODEL_LOADING = os.getenv("MODEL_LOADING", "background")
+
+# Seconds before a model that failed to load is tried again (env: MODEL_RETRY_SECONDS)
+MODEL_RETRY_SECONDS = float(os.getenv("MODEL_RETRY_SECONDS", 30))
+
+# Root of the trained models, one sub-directory per model family (env: MODELS_DIRECTORY)
+MODELS_DIRECTORY = os.getenv("MODELS_DIRECTORY", "src/Experiments/Model_Training/Trained_Models")
+
+# File in a model directory naming the version activated with activate(), shared by every
+# process serving the model (API workers, optimization / benchmark workers)
+ACTIVE_MARKER = "ACTIVE"
+
+# Training timestamp in the artifact names, e.g. ..._R2-0.764_20260118_1540.joblib
+_TIMESTAMP = re.compile(r'(\d{8}_\d{4})\.joblib$')
+
+
+def load_artifact(path: str):
+    """
+    Loads a joblib artifact with its numpy arrays memory-mapped read-only. Only those
+    arrays are backed by the file; objects built from the artifact (the LightGBM booster
+    of a prepared model) are still private to each process.
+    """
+    return joblib.load(path, mmap_mode='r')
+
+
+class ModelEntry:
+    """
+    A registered model: the directory its versions are discovered in, its load state,
+    preparation (artifact -> inference backend), warm-up and the active (model, version) pair.
+    """
+
+    def __init__(self, name: str, directory: str, warmup: Optional[Callable[[Any], None]] = None,
+                 version: Optional[str] = None, prepare: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.directory = directory
+        self.warmup = warmup
+        self.prepare = prepare
+        self.requested_version = version
+
+        self.state: ModelState = 'not_loaded'
+        # Replaced as a whole on hot-swap, so readers always see a matching model / version
+        self.active: Tuple[Any, Optional[str]] = (None, None)
+        self.error: Optional[str] = None
+        self.failed_at: Optional[float] = None
+        # (mtime_ns, version) of the ACTIVE marker as last read by this process
+        self.marker: Tuple[Optional[int], Optional[str]] = (None, None)
+        # mtime_ns of the marker this process last switched to (or tried to)
+        self.followed_marker: Optional[int] = None
+        self.load_seconds: Optional[float] = None
+        self.lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.active[1]
+
+    def available_versions(self) -> List[str]:
+        """Artifact file names in the model directory, oldest first"""
+        paths = glob.glob(os.path.join(self.directory, "*.joblib"))
+
+        def sort_key(path):
+            match = _TIMESTAMP.search(path)
+            return (match.group(1) if match else "", os.path.getmtime(path))
+
+        return [os.path.basename(path) for path in sorted(paths, key=sort_key)]
+
+    @property
+    def marker_path(self) -> str:
+        return os.path.join(self.directory, ACTIVE_MARKER)
+
+    def read_marker(self) -> Tuple[Optional[int], Optional[str]]:
+        """
+        (mtime_ns, version) of the ACTIVE marker, (None, None) without one. The file is
+        only read when its mtime differs from the last read.
+        """
+        try:
+            mtime = os.stat(self.marker_path).st_mtime_ns
+        except FileNotFoundError:
+            self.marker = (None, None)
+            return self.marker
+        if mtime != self.marker[0]:
+            with open(self.marker_path, "r", encoding="utf-8") as f:
+                self.marker = (mtime, f.read().strip() or None)
+        return self.marker
+
+    def write_marker(self, version: str):
+        """Makes version the active one for every process (atomic replace of the marker)"""
+        temporary = f"{self.marker_path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(temporary, self.marker_path)
+        self.marker = (os.stat(self.marker_path).st_mtime_ns, version)
+        self.followed_marker = self.marker[0]
+
+    def default_version(self) -> Optional[str]:
+        """
+        Version named by the ACTIVE marker, otherwise the one requested at registration,
+        otherwise the most recent artifact.
+        """
+        versions = self.available_versions()
+        marked = self.read_marker()[1]
+        if marked in versions:
+            return marked
+        if self.requested_version in versions:
+            return self.requested_version
+        return versions[-1] if versions else None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "directory": self.directory,
+            "version": self.version,
+            "active_marker": self.marker[1],
+            "available_versions": self.available_versions(),
+            "load_seconds": self.load_seconds,
+            "error": self.error,
+        }
+
+
+class ModelRegistry:
+    """
+    Loads the predictors' models outside of module import: lazily on first use or in a
+    background thread at startup. Each model gets a warm-up prediction once loaded so
+    that the first real request does not pay the initialization cost. The active
+    version of a model can be swapped at runtime with activate(): the choice is written to
+    the ACTIVE marker of the model directory and every process follows it on its next get().
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, ModelEntry] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, directory: str, warmup: Optional[Callable[[Any], None]] = None,
+                 version: Optional[str] = None, prepare: Optional[Callable[[Any], Any]] = None):
+        """
+        Registers a model family; version pins an artifact (default: most recent) and
+        prepare turns a loaded artifact into the object returned by get().
+        """
+        self.entries[name] = ModelEntry(name, directory, warmup, version, prepare)
+
+    def _load_version(self, entry: ModelEntry, version: str):
+        """Loads and warms up one artifact of a model; returns the model and its load time"""
+        start = time.perf_counter()
+        model = load_artifact(os.path.join(entry.directory, version))
+        if entry.prepare is not None:
+            model = entry.prepare(model)
+        if entry.warmup is not None:
+            entry.warmup(model)
+        return model, time.perf_counter() - start
+
+    def _load(self, entry: ModelEntry):
+        """
+        Loads (once) the default version of a model. A failure leaves the model offline
+        until the next attempt, at least MODEL_RETRY_SECONDS later. Returns at once when
+        another thread is already loading the model.
+        """
+        if not entry.lock.acquire(blocking=False):
+            return
+        try:
+            if entry.state == 'ready':
+                return
+            if entry.state == 'failed' and time.monotonic() - entry.failed_at < MODEL_RETRY_SECONDS:
+                return
+
+            entry.state = 'loading'
+            try:
+                version = entry.default_version()
+                if version is None:
+                    raise FileNotFoundError(f"Nenhum modelo .joblib em '{entry.directory}'")
+                model, load_seconds = self._load_version(entry, version)
+            except Exception as e:
+                print(f"ERRO CRÍTICO: Não foi possível carregar o modelo '{entry.name}'. {e}")
+                entry.state = 'failed'
+                entry.error = str(e)
+                entry.failed_at = time.monotonic()
+                return
+
+            entry.active = (model, version)
+            entry.load_seconds = load_seconds
+            entry.error = None
+            entry.state = 'ready'
+            print(f"Modelo ML '{entry.name}' ({version}) carregado com sucesso ({load_seconds:.2f}s).")
+        finally:
+            entry.lock.release()
+
+    def get(self, name: str) -> Tuple[Any, Optional[str]]:
+        """
+        The active (model, version) pair, loading the model now if needed (failed models
+        are retried, see _load). The model is None when it could not be loaded or is
+        being loaded by another thread.
+        """
+        entry = self.entries[name]
+        if entry.state != 'ready':
+            self._load(entry)
+        else:
+            self._follow_marker(entry)
+        return entry.active
+
+    def _follow_marker(self, entry: ModelEntry):
+        """
+        Switches a ready model to the version of the ACTIVE marker when another process
+        activated a different one (one attempt per marker write). The new version is loaded
+        in a background thread; callers keep the current model until the swap.
+        """
+        mtime, version = entry.read_marker()
+        if mtime is None or mtime == entry.followed_marker:
+            return
+        if not entry.lock.acquire(blocking=False):
+            return
+        entry.followed_marker = mtime
+        if version is None or version == entry.version or version not in entry.available_versions():
+            entry.lock.release()
+            return
+
+        def swap():
+            try:
+                model, load_seconds = self._load_version(entry, version)
+                entry.active = (model, version)
+                entry.load_seconds = load_seconds
+                print(f"Modelo ML '{entry.name}' trocado para {version} ({load_seconds:.2f}s).")
+            except Exception as e:
+                print(f"ERRO: Não foi possível trocar o modelo '{entry.name}' para {version}. {e}")
+            finally:
+                entry.lock.release()
+
+        threading.Thread(target=swap, name=f"model-swap-{entry.name}", daemon=True).start()
+
+    def activate(self, name: str, version: str) -> Dict[str, Any]:
+        """
+        Hot-swaps the active version of a model. The new artifact is loaded and warmed up
+        before the swap; predictions already running keep the model they started with.
+        """
+        entry = self.entries[name]
+        if version not in entry.available_versions():
+            raise FileNotFoundError(f"Versão '{version}' não encontrada em '{entry.directory}'")
+
+        model, load_seconds = self._load_version(entry, version)
+        with entry.lock:
+            entry.active = (model, version)
+            entry.load_seconds = load_seconds
+            entry.error = None
+            entry.state = 'ready'
+            entry.write_marker(version)
+
+        print(f"Modelo ML '{name}' trocado para {version} ({load_seconds:.2f}s).")
+        return entry.status()
+
+    def start_background_loading(self):
+        """Loads every registered model that is not ready yet in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=lambda: [self._load(entry) for entry in list(self.entries.values())],
+            name="model-loader", daemon=True)
+        self._thread.start()
+
+    def is_ready(self) -> bool:
+        return all(entry.state == 'ready' for entry in self.entries.values())
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        for entry in self.entries.values():
+            entry.read_marker()
+        return {name: entry.status() for name, entry in self.entries.items()}
+
+    def _reset_after_fork(self):
+        # A forked worker does not inherit the loader thread: models it was still loading
+        # are loaded again on demand, with fresh (unlocked) locks
+        self._thread = None
+        for entry in self.entries.values():
+            entry.lock = threading.Lock()
+            if entry.state == 'loading':
+                entry.state = 'not_loaded'
+
+
+model_registry = ModelRegistry()
+os.register_at_fork(after_in_child=model_registry._reset_after_fork)
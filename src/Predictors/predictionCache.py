@@ -0,0 +1,115 @@
+# predictionCache.py
+import os
+import time
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Optional, Hashable, Any
+
+# Maximum cached predictions per model (env: PREDICTION_CACHE_SIZE)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", 200_000))
+
+# Seconds a prediction stays valid, 0 = no expiry (env: PREDICTION_CACHE_TTL)
+PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", 3600))
+
+
+def feature_fingerprints(matrix: np.ndarray, model_version: Optional[str]) -> List[Tuple[Optional[str], bytes]]:
+    """
+    Cache key of each row of a feature matrix: (model version, raw bytes of the row).
+    The bytes are hashed by the dict lookup and compared exactly, so two rows only share
+    a prediction when every model feature is identical.
+    """
+    matrix = np.ascontiguousarray(matrix)
+    row_bytes = matrix.view(np.dtype((np.void, matrix.dtype.itemsize * matrix.shape[1]))).ravel()
+    return [(model_version, row) for row in row_bytes.tolist()]
+
+
+class PredictionCache:
+    """Thread-safe LRU cache of predictions with an optional time-to-live and hit/miss counters"""
+
+    def __init__(self, max_size: int = PREDICTION_CACHE_SIZE, ttl_seconds: float = PREDICTION_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[Any]]:
+        """Cached value of each key (None when missing or expired)"""
+        now = time.monotonic()
+        values = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl_seconds and entry[1] < now:
+                    del self._entries[key]
+                    self.expirations += 1
+                    entry = None
+
+                if entry is None:
+                    self.misses += 1
+                    values.append(None)
+                else:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    values.append(entry[0])
+        return values
+
+    def put_many(self, keys: List[Hashable], values: List[Any]):
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else float('inf')
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+
+            overflow = len(self._entries) - self.max_size
+            for _ in range(max(0, overflow)):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+def predict_with_cache(cache: PredictionCache, matrix: np.ndarray, model_version: Optional[str],
+                       predict_rows) -> List[float]:
+    """
+    Prediction of every row of matrix, rounded to 4 decimals. Only rows whose features
+    are not cached (deduplicated) are passed to predict_rows(sub_matrix) -> array.
+    """
+    keys = feature_fingerprints(matrix, model_version)
+    predictions = cache.get_many(keys)
+
+    # Unseen feature rows, each predicted once even if repeated in the batch
+    missing: Dict[Hashable, int] = {}
+    for i, (key, prediction) in enumerate(zip(keys, predictions)):
+        if prediction is None and key not in missing:
+            missing[key] = i
+
+    if missing:
+        rows = list(missing.values())
+        new_values = [round(p, 4) for p in np.asarray(predict_rows(matrix[rows])).tolist()]
+        cache.put_many(list(missing.keys()), new_values)
+
+        computed = dict(zip(missing.keys(), new_values))
+        predictions = [computed[key] if p is None else p for key, p in zip(keys, predictions)]
+
+    return predictions
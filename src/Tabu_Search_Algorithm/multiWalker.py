@@ -0,0 +1,208 @@
+# multiWalker.py
+"""
+Parallel multi-walker Tabu Search.
+
+W walkers, each a TabuSearch started from its own random solution, run in separate
+processes. The run is split in epochs of sync_interval iterations: after each epoch the
+best solutions of all walkers are merged into a shared elite pool (the elite_size best
+distinct solutions), which every walker receives for the next epoch. A stagnating walker
+restarts from a random elite member instead of the random diversification kick.
+
+Each walker is driven by a TabuSearch built once per worker process (see
+_init_walker_worker); between epochs the walkers are plain picklable state.
+"""
+import os
+import numpy as np
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Callable, Union
+
+from src.Classes.models import Campaign, Ad
+from src.Genetic_Algorithm.geneticAlgorithm import Genome, DataManager, FitnessEvaluator, RandomStream
+from src.Tabu_Search_Algorithm.tabuSearchAlgorithm import TabuSearch, TabuList
+from src.Workers.optimizationPool import pack_problem, unpack_problem
+
+# Maximum number of processes running walkers for one search (env: TABU_WALKER_WORKERS)
+TABU_WALKER_WORKERS = max(1, int(os.getenv("TABU_WALKER_WORKERS", os.cpu_count() or 1)))
+
+
+@dataclass
+class WalkerState:
+    """Position and memory of one walker between epochs"""
+    current_solution: Genome
+    best_solution: Genome
+    tabu_list: TabuList
+    iterations_without_improvement: int
+    history: List[dict]
+
+
+# ============================================================================
+# 1. WORKER
+# ============================================================================
+
+# TabuSearch of the worker process, built once by _init_walker_worker
+_walker: Optional[TabuSearch] = None
+
+
+def _init_walker_worker(problem, settings: dict):
+    global _walker
+    campaigns, ads = unpack_problem(problem)
+    data_manager = DataManager(campaigns, ads)
+    _walker = TabuSearch(
+        max_iterations=settings['max_iterations'],
+        tabu_tenure=settings['tabu_tenure'],
+        neighborhood_size=settings['neighborhood_size'],
+        fitness_evaluator=FitnessEvaluator(data_manager=data_manager,
+                                           total_budget=settings['total_budget'],
+                                           risk_factor=settings['risk_factor']),
+        data_manager=data_manager,
+        use_aspiration=settings['use_aspiration'],
+        intensification_threshold=settings['intensification_threshold'],
+        diversification_threshold=settings['diversification_threshold'],
+        parallel_neighborhood=settings['parallel_neighborhood']
+    )
+
+
+def _run_walker_epoch(state: Optional[WalkerState], elite_pool: List[Genome],
+                      first_iteration: int, iterations: int, seed: np.random.SeedSequence) -> WalkerState:
+    """Runs one walker for an epoch with the current elite pool (state None: new walker)"""
+    walker = _walker
+    walker.set_random_stream(RandomStream(seed))
+
+    if state is None:
+        walker.current_solution = walker.create_initial_solution()
+        walker.best_solution = walker.current_solution.copy()
+        walker.tabu_list = TabuList(max_size=walker.tabu_tenure)
+        walker.iterations_without_improvement = 0
+    else:
+        walker.current_solution = state.current_solution
+        walker.best_solution = state.best_solution
+        walker.tabu_list = state.tabu_list
+        walker.iterations_without_improvement = state.iterations_without_improvement
+    walker.elite_pool = elite_pool
+    walker.history = []
+
+    for iteration in range(first_iteration, first_iteration + iterations):
+        walker.iterate(iteration)
+
+    return WalkerState(walker.current_solution, walker.best_solution, walker.tabu_list,
+                       walker.iterations_without_improvement, walker.history)
+
+
+# ============================================================================
+# 2. ELITE POOL
+# ============================================================================
+
+def update_elite_pool(elite_pool: List[Genome], candidates: List[Genome], size: int) -> List[Genome]:
+    """The size best distinct solutions among the current elite pool and the candidates"""
+    pool, seen = [], set()
+    for genome in sorted(elite_pool + candidates, key=lambda genome: genome.fitness, reverse=True):
+        signature = genome.signature()
+        if signature not in seen:
+            seen.add(signature)
+            pool.append(genome)
+        if len(pool) >= size:
+            break
+    return pool
+
+
+def _merge_history(histories: List[List[dict]]) -> List[dict]:
+    """One entry per iteration: the entry of the walker with the best solution, plus its index"""
+    merged = []
+    for entries in zip(*histories):
+        best = max(entries, key=lambda entry: entry['best_fitness'])
+        merged.append({**best, 'best_walker': entries.index(best)})
+    return merged
+
+
+# ============================================================================
+# 3. ORQUESTRAÇÃO
+# ============================================================================
+
+def run_multi_walker_search(
+    campaigns: List[Campaign],
+    ads: List[Ad],
+    walkers: int,
+    max_iterations: int,
+    tabu_tenure: int,
+    neighborhood_size: int,
+    total_budget: float,
+    risk_factor: float,
+    use_aspiration: bool = True,
+    intensification_threshold: int = 50,
+    diversification_threshold: int = 100,
+    parallel_neighborhood: bool = False,
+    sync_interval: int = 20,
+    elite_size: int = 5,
+    verbose: bool = True,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    max_workers: int = TABU_WALKER_WORKERS,
+    seed: Union[None, int, np.random.SeedSequence] = None
+) -> Optional[Genome]:
+    """
+    Runs `walkers` Tabu Search walkers for max_iterations each in a dedicated process pool,
+    sharing an elite pool of elite_size solutions every sync_interval iterations.
+    Returns the best Genome over all walkers.
+    progress_callback receives one merged history entry per iteration, after each epoch;
+    should_stop is checked between epochs. Each walker draws from its own child stream of
+    seed, so a seeded search is reproducible whatever the number of worker processes.
+    """
+    if walkers < 1:
+        raise ValueError("walkers must be at least 1")
+    if sync_interval < 1:
+        raise ValueError("sync_interval must be at least 1")
+    if elite_size < 1:
+        raise ValueError("elite_size must be at least 1")
+
+    settings = dict(max_iterations=max_iterations, tabu_tenure=tabu_tenure,
+                    neighborhood_size=neighborhood_size, total_budget=total_budget,
+                    risk_factor=risk_factor, use_aspiration=use_aspiration,
+                    intensification_threshold=intensification_threshold,
+                    diversification_threshold=diversification_threshold,
+                    parallel_neighborhood=parallel_neighborhood)
+    walker_seeds = RandomStream(seed).spawn(walkers)
+
+    states: List[Optional[WalkerState]] = [None] * walkers
+    elite_pool: List[Genome] = []
+
+    if verbose:
+        print(f"Tabu Search com {walkers} walkers, elite pool de {elite_size} "
+              f"partilhado a cada {sync_interval} iterações")
+
+    with ProcessPoolExecutor(max_workers=min(walkers, max_workers), initializer=_init_walker_worker,
+                             initargs=(pack_problem(campaigns, ads), settings)) as executor:
+        for first_iteration in range(0, max_iterations, sync_interval):
+            if should_stop is not None and should_stop():
+                print(f"Tabu Search interrompido na iteração {first_iteration}.")
+                break
+
+            iterations = min(sync_interval, max_iterations - first_iteration)
+            # Every walker / epoch gets its own random state
+            futures = [
+                executor.submit(_run_walker_epoch, states[i], elite_pool, first_iteration, iterations,
+                                walker_seeds[i].spawn(1)[0])
+                for i in range(walkers)
+            ]
+            try:
+                states = [future.result() for future in futures]
+            except ValueError as e:
+                print(f"FATAL TABU SEARCH ERROR: {e}")
+                return None
+
+            elite_pool = update_elite_pool(elite_pool, [state.best_solution for state in states], elite_size)
+
+            history = _merge_history([state.history for state in states])
+            if progress_callback is not None:
+                for entry in history:
+                    progress_callback(entry)
+
+            if verbose and history:
+                entry = history[-1]
+                print(f"Iter {entry['iteration']:3d} | "
+                      f"Best ROI: {elite_pool[0].total_roi:7.2%} | "
+                      f"Fitness: {elite_pool[0].fitness:8.3f} | "
+                      f"Cost: ${elite_pool[0].total_cost:,.0f} | "
+                      f"Walker: {entry['best_walker']}")
+
+    return elite_pool[0] if elite_pool else None
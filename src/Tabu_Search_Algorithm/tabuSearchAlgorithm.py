@@ -1,12 +1,41 @@
 # tabu_search_core.py
+import os
 import numpy as np
 import random
-from copy import deepcopy
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Callable, Union
 from collections import deque
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 from src.Classes.models import Campaign, Ad
-from src.Genetic_Algorithm.geneticAlgorithm import Individual, DataManager, FitnessEvaluator, print_solution_details
+from src.Genetic_Algorithm.geneticAlgorithm import (Individual, Genome, DataManager, FitnessEvaluator, RandomStream,
+                                                   create_random_genome, print_solution_details)
+
+# Threads scoring neighbourhood chunks in parallel mode (env: NEIGHBORHOOD_THREADS)
+NEIGHBORHOOD_THREADS = max(1, int(os.getenv("NEIGHBORHOOD_THREADS", min(4, os.cpu_count() or 1))))
+
+# Candidate moves per vectorized scoring call in parallel mode (env: NEIGHBORHOOD_CHUNK_SIZE)
+NEIGHBORHOOD_CHUNK_SIZE = max(1, int(os.getenv("NEIGHBORHOOD_CHUNK_SIZE", 512)))
+
+_neighborhood_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_neighborhood_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by the parallel neighbourhood evaluations of this process"""
+    global _neighborhood_executor
+    if _neighborhood_executor is None:
+        _neighborhood_executor = ThreadPoolExecutor(max_workers=NEIGHBORHOOD_THREADS,
+                                                    thread_name_prefix="tabu-neighborhood")
+    return _neighborhood_executor
+
+
+def _reset_neighborhood_executor():
+    # Threads are not inherited by forked workers: they create their own pool on first use
+    global _neighborhood_executor
+    _neighborhood_executor = None
+
+
+os.register_at_fork(after_in_child=_reset_neighborhood_executor)
 
 
 # ============================================================================
@@ -27,11 +56,11 @@ class TabuList:
     def add_move(self, move: Tuple):
         """
         Add a move to the tabu list.
-        Move format: (ad_id, from_campaign, to_campaign)
+        Move format: (ad_idx, from_campaign_idx, to_campaign_idx)
         """
         self.tabu_moves.append(move)
         
-    def add_solution(self, individual: Individual):
+    def add_solution(self, individual: Genome):
         """Add a solution signature to prevent revisiting"""
         signature = self._get_solution_signature(individual)
         self.tabu_solutions.add(signature)
@@ -45,17 +74,14 @@ class TabuList:
         """Check if a move is in the tabu list"""
         return move in self.tabu_moves
     
-    def is_tabu_solution(self, individual: Individual) -> bool:
+    def is_tabu_solution(self, individual: Genome) -> bool:
         """Check if a solution has been visited recently"""
         signature = self._get_solution_signature(individual)
         return signature in self.tabu_solutions
     
-    def _get_solution_signature(self, individual: Individual) -> Tuple:
+    def _get_solution_signature(self, individual: Genome) -> bytes:
         """Create a hashable signature for a solution"""
-        return tuple(sorted(
-            (cid, tuple(sorted(ad_ids))) 
-            for cid, ad_ids in individual.allocation.items()
-        ))
+        return individual.signature()
     
     def clear(self):
         """Clear the tabu list"""
@@ -63,142 +89,478 @@ class TabuList:
         self.tabu_solutions.clear()
 
 
+# ============================================================================
+# INCREMENTAL (DELTA) FITNESS EVALUATION
+# ============================================================================
+
+class DeltaEvaluator:
+    """
+    Incremental fitness evaluation for Tabu Search moves.
+    
+    Keeps the per-campaign aggregates (number of ads, CPC sum, revenue-per-click sum)
+    and their fitness contributions for the current solution. A move only touches
+    the campaigns it takes ads from / gives ads to, so its fitness is obtained by
+    swapping the old contributions of those campaigns for the new ones, without
+    re-evaluating the whole allocation.
+    
+    Also keeps the ads of every campaign (members) so moves can pick an ad of a
+    given campaign without scanning the assignment vector.
+    
+    Changes are lists of (ad_idx, from_campaign_idx, to_campaign_idx) applied in order.
+    """
+    
+    def __init__(self, fitness_evaluator: FitnessEvaluator):
+        self.fitness_evaluator = fitness_evaluator
+        self.data_manager = fitness_evaluator.data_manager
+        
+        dm = self.data_manager
+        self.num_campaigns = len(dm.campaign_ids)
+        self.mean_size = len(dm.ad_ids) / self.num_campaigns if self.num_campaigns else 0.0
+        
+        # Plain Python lists: scalar updates are cheaper than on numpy arrays
+        self.campaign_clicks = dm.campaign_clicks.tolist()
+        self.campaign_media_cost = dm.campaign_media_cost.tolist()
+        self.campaign_budget_cost = (dm.campaign_approved_budget + dm.campaign_overcost).tolist()
+        self.ad_cost_per_click = dm.ad_cost_per_click.tolist()
+        self.ad_revenue_per_click = dm.ad_revenue_per_click.tolist()
+        
+        # Array versions for the vectorized scoring of whole neighbourhoods
+        self._campaign_clicks = np.asarray(dm.campaign_clicks, dtype=np.float64)
+        self._campaign_media_cost = np.asarray(dm.campaign_media_cost, dtype=np.float64)
+        self._campaign_budget_cost = np.asarray(self.campaign_budget_cost, dtype=np.float64)
+        self._ad_cost_per_click = np.asarray(dm.ad_cost_per_click, dtype=np.float64)
+        self._ad_revenue_per_click = np.asarray(dm.ad_revenue_per_click, dtype=np.float64)
+        
+        self.solution: Genome = None
+    
+    def reset(self, genome: Genome):
+        """Loads the aggregates of a (new) current solution"""
+        counts, cpc_sums, revenue_sums, _ = self.fitness_evaluator._campaign_aggregates(genome.assignment)
+        
+        self.counts = counts.tolist()
+        self.cpc_sums = cpc_sums.tolist()
+        self.revenue_sums = revenue_sums.tolist()
+        self.contributions = [self._contribution(c, self.counts[c], self.cpc_sums[c], self.revenue_sums[c])
+                              for c in range(self.num_campaigns)]
+        
+        self.members = [[] for _ in range(self.num_campaigns)]
+        for ad_idx, campaign_idx in enumerate(genome.assignment.tolist()):
+            self.members[campaign_idx].append(ad_idx)
+        
+        self._refresh_totals()
+        self.solution = genome
+    
+    def _contribution(self, c: int, n_ads: int, cpc_sum: float, revenue_sum: float) -> Tuple[float, float, float, float]:
+        """(budget_cost, media_cost, revenue, roi) of campaign index c; zeros when it has no ads"""
+        if n_ads == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        
+        expected_clicks = max(self.campaign_clicks[c] / n_ads, 1.0)
+        media_cost = self.campaign_media_cost[c] + expected_clicks * cpc_sum
+        revenue = expected_clicks * revenue_sum
+        roi = (revenue - media_cost) / media_cost if media_cost > 0 else 0.0
+        
+        return self.campaign_budget_cost[c], media_cost, revenue, roi
+    
+    def _refresh_totals(self):
+        """Recomputes the solution totals from the per-campaign contributions"""
+        self.total_cost = sum(contribution[0] for contribution in self.contributions)
+        self.total_media_cost = sum(contribution[1] for contribution in self.contributions)
+        self.total_media_revenue = sum(contribution[2] for contribution in self.contributions)
+        self.roi_sum = sum(contribution[3] for contribution in self.contributions)
+        self.n_active = sum(1 for n_ads in self.counts if n_ads > 0)
+        self.sum_sq_sizes = float(sum(n_ads * n_ads for n_ads in self.counts))
+    
+    def _touched_aggregates(self, changes: List[Tuple]) -> Optional[Dict[int, List]]:
+        """New [n_ads, cpc_sum, revenue_sum] of every campaign touched by the changes, or None if one ends up empty"""
+        touched = {}
+        
+        for ad, from_c, to_c in changes:
+            for c, sign in ((from_c, -1), (to_c, 1)):
+                aggregate = touched.get(c)
+                if aggregate is None:
+                    aggregate = touched[c] = [self.counts[c], self.cpc_sums[c], self.revenue_sums[c]]
+                aggregate[0] += sign
+                aggregate[1] += sign * self.ad_cost_per_click[ad]
+                aggregate[2] += sign * self.ad_revenue_per_click[ad]
+        
+        # Each campaign must keep at least 1 ad
+        if any(aggregate[0] <= 0 for aggregate in touched.values()):
+            return None
+        
+        return touched
+    
+    def move_metrics(self, changes: List[Tuple]) -> Optional[Tuple[float, float, float, float, float]]:
+        """
+        Evaluates the solution obtained by applying the changes, without committing them.
+        Returns (fitness, total_roi, total_cost, total_media_cost, total_media_revenue),
+        or None if the move would leave a campaign without ads.
+        """
+        touched = self._touched_aggregates(changes)
+        if touched is None:
+            return None
+        
+        total_cost = self.total_cost
+        total_media_cost = self.total_media_cost
+        total_media_revenue = self.total_media_revenue
+        roi_sum = self.roi_sum
+        n_active = self.n_active
+        sum_sq_sizes = self.sum_sq_sizes
+        
+        for c, (n_ads, cpc_sum, revenue_sum) in touched.items():
+            old = self.contributions[c]
+            new = self._contribution(c, n_ads, cpc_sum, revenue_sum)
+            total_cost += new[0] - old[0]
+            total_media_cost += new[1] - old[1]
+            total_media_revenue += new[2] - old[2]
+            roi_sum += new[3] - old[3]
+            n_active += (n_ads > 0) - (self.counts[c] > 0)
+            sum_sq_sizes += n_ads * n_ads - self.counts[c] * self.counts[c]
+        
+        return self._fitness(total_cost, total_media_cost, total_media_revenue, roi_sum, n_active, sum_sq_sizes)
+    
+    def move_fitness(self, changes: List[Tuple]) -> Optional[float]:
+        """Fitness of the solution obtained by applying the changes (None if invalid)"""
+        metrics = self.move_metrics(changes)
+        return metrics[0] if metrics is not None else None
+    
+    def batch_move_fitness(self, candidates: List[List[Tuple]]) -> np.ndarray:
+        """
+        Vectorized move_fitness over many candidate moves of the current solution.
+        Returns one fitness per candidate, -inf for moves that leave a campaign without ads.
+        
+        Every change contributes a -1 / +1 entry to its (candidate, campaign) pairs; the
+        entries are summed per pair with bincount, and the new minus old contributions of
+        the touched campaigns are summed per candidate.
+        """
+        n = len(candidates)
+        if n == 0:
+            return np.empty(0, dtype=np.float64)
+        
+        lengths = np.fromiter(map(len, candidates), dtype=np.int64, count=n)
+        changes = np.fromiter(chain.from_iterable(chain.from_iterable(candidates)), dtype=np.int64,
+                              count=3 * int(lengths.sum())).reshape(-1, 3)
+        candidate = np.repeat(np.arange(n), lengths)
+        ad, from_c, to_c = changes.T
+        
+        # Two entries per change: the ad leaves from_c and joins to_c
+        pair_candidate = np.concatenate([candidate, candidate])
+        pair_campaign = np.concatenate([from_c, to_c])
+        sign = np.concatenate([-np.ones(len(ad)), np.ones(len(ad))])
+        pair_ad = np.concatenate([ad, ad])
+        
+        keys, group = np.unique(pair_candidate * self.num_campaigns + pair_campaign, return_inverse=True)
+        group_candidate = keys // self.num_campaigns
+        c = keys % self.num_campaigns
+        
+        counts = np.asarray(self.counts, dtype=np.float64)
+        old_n = counts[c]
+        new_n = old_n + np.bincount(group, weights=sign, minlength=len(keys))
+        new_cpc = np.asarray(self.cpc_sums)[c] + np.bincount(
+            group, weights=sign * self._ad_cost_per_click[pair_ad], minlength=len(keys))
+        new_revenue = np.asarray(self.revenue_sums)[c] + np.bincount(
+            group, weights=sign * self._ad_revenue_per_click[pair_ad], minlength=len(keys))
+        
+        # Same formula as _contribution, zero for campaigns left without ads
+        active = new_n > 0
+        expected_clicks = np.maximum(self._campaign_clicks[c] / np.where(active, new_n, 1.0), 1.0)
+        media_cost = np.where(active, self._campaign_media_cost[c] + expected_clicks * new_cpc, 0.0)
+        revenue = np.where(active, expected_clicks * new_revenue, 0.0)
+        roi = np.divide(revenue - media_cost, media_cost, out=np.zeros_like(media_cost), where=media_cost > 0)
+        budget_cost = np.where(active, self._campaign_budget_cost[c], 0.0)
+        
+        old = np.asarray(self.contributions, dtype=np.float64)[c]
+        
+        def per_candidate(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(group_candidate, weights=weights, minlength=n)
+        
+        fitness = self._batch_fitness(
+            self.total_cost + per_candidate(budget_cost - old[:, 0]),
+            self.total_media_cost + per_candidate(media_cost - old[:, 1]),
+            self.total_media_revenue + per_candidate(revenue - old[:, 2]),
+            self.roi_sum + per_candidate(roi - old[:, 3]),
+            self.n_active + per_candidate(active.astype(np.float64) - (old_n > 0)),
+            self.sum_sq_sizes + per_candidate(new_n * new_n - old_n * old_n)
+        )
+        
+        # Each campaign must keep at least 1 ad
+        invalid = per_candidate((~active).astype(np.float64)) > 0
+        fitness[invalid] = -np.inf
+        return fitness
+    
+    def _batch_fitness(self, total_cost, total_media_cost, total_media_revenue, roi_sum, n_active, sum_sq_sizes):
+        """_fitness on arrays of running totals (one entry per candidate move)"""
+        total_roi = np.divide(total_media_revenue - total_media_cost, total_media_cost,
+                              out=np.zeros_like(total_media_cost), where=total_media_cost > 0)
+        avg_campaign_roi = np.divide(roi_sum, n_active, out=np.zeros_like(roi_sum), where=n_active > 0)
+        
+        if self.num_campaigns > 1 and self.mean_size > 0:
+            variance = np.maximum(sum_sq_sizes / self.num_campaigns - self.mean_size ** 2, 0.0)
+            balance_penalty = -self.fitness_evaluator.risk_factor * (np.sqrt(variance) / self.mean_size)
+        else:
+            balance_penalty = 0.0
+        
+        total_budget = self.fitness_evaluator.total_budget
+        budget_penalty = np.where(total_cost > total_budget, -10.0 * (total_cost - total_budget) / total_budget, 0.0)
+        
+        return 0.7 * total_roi + 0.3 * avg_campaign_roi + balance_penalty + budget_penalty
+    
+    def _fitness(self, total_cost, total_media_cost, total_media_revenue, roi_sum, n_active, sum_sq_sizes):
+        """Same formula as FitnessEvaluator, expressed on the running totals"""
+        total_roi = ((total_media_revenue - total_media_cost) / total_media_cost
+                     if total_media_cost > 0 else 0.0)
+        avg_campaign_roi = roi_sum / n_active if n_active > 0 else 0.0
+        
+        # Balance penalty: std/mean of campaign sizes (the mean is fixed, only the sum of squares moves)
+        if self.num_campaigns > 1 and self.mean_size > 0:
+            variance = max(sum_sq_sizes / self.num_campaigns - self.mean_size ** 2, 0.0)
+            balance_penalty = -self.fitness_evaluator.risk_factor * (np.sqrt(variance) / self.mean_size)
+        else:
+            balance_penalty = 0.0
+        
+        total_budget = self.fitness_evaluator.total_budget
+        budget_penalty = 0.0
+        if total_cost > total_budget:
+            budget_penalty = -10.0 * (total_cost - total_budget) / total_budget
+        
+        fitness = 0.7 * total_roi + 0.3 * avg_campaign_roi + balance_penalty + budget_penalty
+        
+        return fitness, total_roi, total_cost, total_media_cost, total_media_revenue
+    
+    def commit(self, changes: List[Tuple], genome: Genome):
+        """
+        Applies the changes to the stored aggregates; `genome` is the solution they
+        produce and becomes the tracked current solution (its global metrics are filled in).
+        """
+        touched = self._touched_aggregates(changes)
+        if touched is None:
+            raise ValueError("Cannot commit a move that leaves a campaign without ads.")
+        
+        for c, (n_ads, cpc_sum, revenue_sum) in touched.items():
+            self.counts[c] = n_ads
+            self.cpc_sums[c] = cpc_sum
+            self.revenue_sums[c] = revenue_sum
+            self.contributions[c] = self._contribution(c, n_ads, cpc_sum, revenue_sum)
+        
+        for ad, from_c, to_c in changes:
+            self.members[from_c].remove(ad)
+            self.members[to_c].append(ad)
+        
+        # O(campaigns) refresh keeps the running totals free of drift
+        self._refresh_totals()
+        self.solution = genome
+        
+        (genome.fitness, genome.total_roi, genome.total_cost,
+         genome.total_media_cost, genome.total_media_revenue) = self._fitness(
+            self.total_cost, self.total_media_cost, self.total_media_revenue,
+            self.roi_sum, self.n_active, self.sum_sq_sizes)
+
+
 # ============================================================================
 # NEIGHBORHOOD GENERATION
 # ============================================================================
 
 class NeighborhoodGenerator:
     """
-    Generates neighbor solutions through various move strategies.
+    Generates neighbor moves through various move strategies.
+    
+    Neighbors are not materialized: each one is a list of (ad_idx, from_campaign_idx,
+    to_campaign_idx) changes over the current solution tracked by the DeltaEvaluator,
+    which also scores them. Only the move that gets selected is applied
+    (see TabuSearch._commit_move).
     """
     
-    def __init__(self, data_manager: DataManager):
+    MOVE_STRATEGIES = ('single_move', 'swap', 'multi_move')
+    
+    def __init__(self, data_manager: DataManager, delta_evaluator: DeltaEvaluator,
+                 rng: Optional[random.Random] = None):
         self.data_manager = data_manager
-        self.campaign_ids = data_manager.campaign_ids
-        self.ad_ids = data_manager.ad_ids
+        self.delta_evaluator = delta_evaluator
+        self.num_campaigns = len(data_manager.campaign_ids)
+        # Scalar random draws of the moves (the search's RandomStream.random)
+        self.random = rng or random.Random()
     
     def generate_neighbors(self, 
-                          current: Individual, 
                           tabu_list: TabuList,
                           num_neighbors: int = 20,
                           use_aspiration: bool = True,
-                          best_fitness: float = float('-inf')) -> List[Tuple[Individual, Tuple]]:
+                          best_fitness: float = float('-inf')) -> List[Tuple[List[Tuple], Tuple, float]]:
         """
-        Generate neighbor solutions using different move strategies.
-        Returns list of (neighbor, move) tuples.
+        Generate and score neighbor moves of the current solution using different move strategies.
+        Returns list of (changes, move, fitness) tuples.
         """
         neighbors = []
-        move_strategies = ['single_move', 'swap', 'multi_move']
         
         attempts = 0
         max_attempts = num_neighbors * 3
         
         while len(neighbors) < num_neighbors and attempts < max_attempts:
             attempts += 1
-            strategy = random.choice(move_strategies)
+            changes, move = self._draw_move()
             
-            if strategy == 'single_move':
-                neighbor, move = self._single_ad_move(current)
-            elif strategy == 'swap':
-                neighbor, move = self._swap_ads(current)
-            else:  # multi_move
-                neighbor, move = self._multi_ad_move(current)
+            if changes is None:
+                continue
             
-            if neighbor is None:
+            fitness = self.delta_evaluator.move_fitness(changes)
+            if fitness is None:
                 continue
             
             # Check if move is tabu
             if tabu_list.is_tabu_move(move):
                 # Aspiration criterion: accept tabu move if it's better than best known
-                if use_aspiration and neighbor.fitness > best_fitness:
-                    neighbors.append((neighbor, move))
+                if use_aspiration and fitness > best_fitness:
+                    neighbors.append((changes, move, fitness))
                 # Otherwise skip this tabu move
                 continue
             else:
-                neighbors.append((neighbor, move))
+                neighbors.append((changes, move, fitness))
         
         return neighbors
     
-    def _single_ad_move(self, current: Individual) -> Tuple[Optional[Individual], Optional[Tuple]]:
+    def best_neighbor(self,
+                      tabu_list: TabuList,
+                      num_neighbors: int = 20,
+                      use_aspiration: bool = True,
+                      best_fitness: float = float('-inf'),
+                      chunk_size: int = NEIGHBORHOOD_CHUNK_SIZE) -> Optional[Tuple[List[Tuple], Tuple, float]]:
+        """
+        Parallel counterpart of generate_neighbors followed by the choice of the best move.
+        Candidates are drawn and admitted with the same rules, but scored in chunks by
+        DeltaEvaluator.batch_move_fitness on the neighbourhood thread pool (each candidate is
+        checked and scored once), then reduced to the best admissible move.
+        Returns (changes, move, fitness), or None when no move was admitted.
+        """
+        best = None
+        admitted = 0
+        attempts = 0
+        max_attempts = num_neighbors * 3
+        
+        while admitted < num_neighbors and attempts < max_attempts:
+            # Draw as many candidates as moves are still missing
+            batch = []
+            while len(batch) < num_neighbors - admitted and attempts < max_attempts:
+                attempts += 1
+                changes, move = self._draw_move()
+                if changes is not None:
+                    batch.append((changes, move))
+            if not batch:
+                continue
+            
+            candidates = [changes for changes, _ in batch]
+            chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+            if len(chunks) == 1:
+                fitness = self.delta_evaluator.batch_move_fitness(candidates)
+            else:
+                fitness = np.concatenate(list(get_neighborhood_executor().map(
+                    self.delta_evaluator.batch_move_fitness, chunks)))
+            
+            # Admissible: valid, and not tabu unless the aspiration criterion is met
+            tabu = np.fromiter((tabu_list.is_tabu_move(move) for _, move in batch), dtype=bool, count=len(batch))
+            admissible = np.isfinite(fitness) & (~tabu | (use_aspiration & (fitness > best_fitness)))
+            
+            # The first admissible candidates (draw order) fill the neighbourhood, as in generate_neighbors
+            positions = np.flatnonzero(admissible)[:num_neighbors - admitted]
+            admitted += len(positions)
+            if len(positions):
+                winner = positions[np.argmax(fitness[positions])]
+                if best is None or fitness[winner] > best[2]:
+                    best = (batch[winner][0], batch[winner][1], float(fitness[winner]))
+        
+        return best
+    
+    def _draw_move(self) -> Tuple[Optional[List[Tuple]], Optional[Tuple]]:
+        """Draws a candidate move with a random strategy: (changes, move), or (None, None)"""
+        strategy = self.random.choice(self.MOVE_STRATEGIES)
+        
+        if strategy == 'single_move':
+            return self._single_ad_move()
+        elif strategy == 'swap':
+            return self._swap_ads()
+        else:  # multi_move
+            return self._multi_ad_move()
+    
+    def _random_other_campaign(self, campaign_idx: int) -> int:
+        """Random campaign index different from campaign_idx"""
+        other = self.random.randrange(self.num_campaigns - 1)
+        return other + 1 if other >= campaign_idx else other
+    
+    def _single_ad_move(self) -> Tuple[Optional[List[Tuple]], Optional[Tuple]]:
         """Move a single ad from one campaign to another"""
-        allocation = deepcopy(current.allocation)
+        counts = self.delta_evaluator.counts
+        members = self.delta_evaluator.members
         
         # Find campaigns with more than 1 ad (can donate)
-        source_campaigns = [cid for cid in self.campaign_ids if len(allocation[cid]) > 1]
+        source_campaigns = [c for c in range(self.num_campaigns) if counts[c] > 1]
         
         if not source_campaigns:
             return None, None
         
-        source_cid = random.choice(source_campaigns)
-        target_cid = random.choice([c for c in self.campaign_ids if c != source_cid])
+        source_idx = self.random.choice(source_campaigns)
+        target_idx = self._random_other_campaign(source_idx)
         
-        ad_to_move = random.choice(allocation[source_cid])
+        ad_to_move = self.random.choice(members[source_idx])
         
-        # Perform move
-        allocation[source_cid].remove(ad_to_move)
-        allocation[target_cid].append(ad_to_move)
+        move = (ad_to_move, source_idx, target_idx)
         
-        neighbor = Individual(allocation=allocation)
-        move = (ad_to_move, source_cid, target_cid)
-        
-        return neighbor, move
+        return [move], move
     
-    def _swap_ads(self, current: Individual) -> Tuple[Optional[Individual], Optional[Tuple]]:
+    def _swap_ads(self) -> Tuple[Optional[List[Tuple]], Optional[Tuple]]:
         """Swap ads between two campaigns"""
-        allocation = deepcopy(current.allocation)
+        counts = self.delta_evaluator.counts
+        members = self.delta_evaluator.members
         
         # Select two different campaigns with ads
-        campaigns_with_ads = [cid for cid in self.campaign_ids if allocation[cid]]
+        campaigns_with_ads = [c for c in range(self.num_campaigns) if counts[c] > 0]
         
         if len(campaigns_with_ads) < 2:
             return None, None
         
-        camp1, camp2 = random.sample(campaigns_with_ads, 2)
-        
-        ad1 = random.choice(allocation[camp1])
-        ad2 = random.choice(allocation[camp2])
+        camp1, camp2 = self.random.sample(campaigns_with_ads, 2)
         
-        # Perform swap
-        allocation[camp1].remove(ad1)
-        allocation[camp2].remove(ad2)
-        allocation[camp1].append(ad2)
-        allocation[camp2].append(ad1)
+        ad1 = self.random.choice(members[camp1])
+        ad2 = self.random.choice(members[camp2])
         
-        neighbor = Individual(allocation=allocation)
+        changes = [(ad1, camp1, camp2), (ad2, camp2, camp1)]
         move = ('swap', ad1, camp1, ad2, camp2)
         
-        return neighbor, move
+        return changes, move
     
-    def _multi_ad_move(self, current: Individual) -> Tuple[Optional[Individual], Optional[Tuple]]:
+    def _multi_ad_move(self) -> Tuple[Optional[List[Tuple]], Optional[Tuple]]:
         """Move multiple ads (2-3) in a single move"""
-        allocation = deepcopy(current.allocation)
+        members = self.delta_evaluator.members
         
-        num_moves = random.randint(2, 3)
+        # Track the moves made so far without copying the solution
+        sizes = list(self.delta_evaluator.counts)
+        moved_to = {}  # ad_idx -> campaign it was moved to
+        
+        num_moves = self.random.randint(2, 3)
         moves_made = []
         
         for _ in range(num_moves):
-            source_campaigns = [cid for cid in self.campaign_ids if len(allocation[cid]) > 1]
+            source_campaigns = [c for c in range(self.num_campaigns) if sizes[c] > 1]
             
             if not source_campaigns:
                 break
             
-            source_cid = random.choice(source_campaigns)
-            target_cid = random.choice([c for c in self.campaign_ids if c != source_cid])
+            source_idx = self.random.choice(source_campaigns)
+            target_idx = self._random_other_campaign(source_idx)
             
-            ad_to_move = random.choice(allocation[source_cid])
+            source_ads = [ad for ad in members[source_idx] if ad not in moved_to]
+            source_ads.extend(ad for ad, c in moved_to.items() if c == source_idx)
+            ad_to_move = self.random.choice(source_ads)
             
-            allocation[source_cid].remove(ad_to_move)
-            allocation[target_cid].append(ad_to_move)
+            moved_to[ad_to_move] = target_idx
+            sizes[source_idx] -= 1
+            sizes[target_idx] += 1
             
-            moves_made.append((ad_to_move, source_cid, target_cid))
+            moves_made.append((ad_to_move, source_idx, target_idx))
         
         if not moves_made:
             return None, None
         
-        neighbor = Individual(allocation=allocation)
         move = ('multi', tuple(moves_made))
         
-        return neighbor, move
+        return moves_made, move
 
 
 # ============================================================================
@@ -218,7 +580,9 @@ class TabuSearch:
                  data_manager: DataManager,
                  use_aspiration: bool = True,
                  intensification_threshold: int = 50,
-                 diversification_threshold: int = 100):
+                 diversification_threshold: int = 100,
+                 parallel_neighborhood: bool = False,
+                 stream: Optional[RandomStream] = None):
         
         self.max_iterations = max_iterations
         self.tabu_tenure = tabu_tenure
@@ -228,6 +592,8 @@ class TabuSearch:
         self.use_aspiration = use_aspiration
         self.intensification_threshold = intensification_threshold
         self.diversification_threshold = diversification_threshold
+        # Score the neighbourhood in vectorized chunks on a thread pool (see NeighborhoodGenerator.best_neighbor)
+        self.parallel_neighborhood = parallel_neighborhood
         
         self.campaign_ids = data_manager.campaign_ids
         self.ad_ids = data_manager.ad_ids
@@ -235,41 +601,30 @@ class TabuSearch:
         self.num_ads = len(self.ad_ids)
         
         self.tabu_list = TabuList(max_size=tabu_tenure)
-        self.neighborhood_gen = NeighborhoodGenerator(data_manager)
+        self.delta_evaluator = DeltaEvaluator(fitness_evaluator)
+        self.neighborhood_gen = NeighborhoodGenerator(data_manager, self.delta_evaluator)
+        self.set_random_stream(stream or RandomStream())
         
-        self.current_solution: Individual = None
-        self.best_solution: Individual = None
+        self.current_solution: Genome = None
+        self.best_solution: Genome = None
         self.history = []
         self.iterations_without_improvement = 0
+        
+        # Best solutions shared by parallel walkers (see multiWalker); when not empty,
+        # diversification restarts from one of them instead of a random kick
+        self.elite_pool: List[Genome] = []
     
-    def create_initial_solution(self) -> Individual:
+    def set_random_stream(self, stream: RandomStream):
+        """Draws every random decision of the search (moves included) from stream"""
+        self.stream = stream
+        self.random = self.neighborhood_gen.random = stream.random
+    
+    def create_initial_solution(self) -> Genome:
         """Create an initial random solution"""
-        allocation = {cid: [] for cid in self.campaign_ids}
-        available_ads = self.ad_ids.copy()
-        random.shuffle(available_ads)
-        
-        if not self.campaign_ids or not self.ad_ids:
-            raise ValueError("Cannot create allocation with no campaigns or ads.")
-        
-        if len(self.campaign_ids) > len(available_ads):
-            raise ValueError(f"Not enough ads ({len(available_ads)}) to assign at least one to each campaign ({len(self.campaign_ids)}).")
+        genome = create_random_genome(self.num_campaigns, self.num_ads, self.stream)
+        self.fitness_evaluator.evaluate_genome(genome)
         
-        # Assign one ad to each campaign first
-        temp_ads_for_init = available_ads[:self.num_campaigns]
-        remaining_ads = available_ads[self.num_campaigns:]
-        
-        for i, cid in enumerate(self.campaign_ids):
-            allocation[cid].append(temp_ads_for_init[i])
-        
-        # Distribute remaining ads randomly
-        for ad_id in remaining_ads:
-            random_campaign = random.choice(self.campaign_ids)
-            allocation[random_campaign].append(ad_id)
-        
-        individual = Individual(allocation=allocation)
-        self.fitness_evaluator.evaluate(individual)
-        
-        return individual
+        return genome
     
     def intensification(self):
         """
@@ -279,7 +634,7 @@ class TabuSearch:
         print(f"  [Intensification triggered at iteration {len(self.history)}]")
         
         # Start from best solution
-        self.current_solution = deepcopy(self.best_solution)
+        self.current_solution = self.best_solution.copy()
         
         # Reduce parameters for focused search
         original_neighborhood = self.neighborhood_size
@@ -300,30 +655,39 @@ class TabuSearch:
     def diversification(self):
         """
         Diversification: jump to a different region of the solution space.
-        Perform significant random modifications to current solution.
+        Perform significant random modifications to current solution, or restart from
+        a member of the elite pool when there is one.
         """
         print(f"  [Diversification triggered at iteration {len(self.history)}]")
         
-        allocation = deepcopy(self.current_solution.allocation)
+        if self.elite_pool:
+            self.restart_from_elite()
+            return
+        
+        genome = self.current_solution.copy()
+        members = [[] for _ in range(self.num_campaigns)]
+        for ad_idx, campaign_idx in enumerate(genome.assignment.tolist()):
+            members[campaign_idx].append(ad_idx)
         
         # Randomly move 20-30% of ads to different campaigns
-        num_moves = int(0.2 * self.num_ads) + random.randint(0, int(0.1 * self.num_ads))
+        num_moves = int(0.2 * self.num_ads) + self.random.randint(0, int(0.1 * self.num_ads))
         
         for _ in range(num_moves):
-            source_campaigns = [cid for cid in self.campaign_ids if len(allocation[cid]) > 1]
+            source_campaigns = [c for c in range(self.num_campaigns) if len(members[c]) > 1]
             
             if not source_campaigns:
                 break
             
-            source_cid = random.choice(source_campaigns)
-            target_cid = random.choice([c for c in self.campaign_ids if c != source_cid])
+            source_idx = self.random.choice(source_campaigns)
+            target_idx = self.random.choice([c for c in range(self.num_campaigns) if c != source_idx])
             
-            ad_to_move = random.choice(allocation[source_cid])
-            allocation[source_cid].remove(ad_to_move)
-            allocation[target_cid].append(ad_to_move)
+            ad_to_move = self.random.choice(members[source_idx])
+            members[source_idx].remove(ad_to_move)
+            members[target_idx].append(ad_to_move)
+            genome.move(ad_to_move, target_idx)
         
-        self.current_solution = Individual(allocation=allocation)
-        self.fitness_evaluator.evaluate(self.current_solution)
+        self.fitness_evaluator.evaluate_genome(genome)
+        self.current_solution = genome
         
         # Clear tabu list to allow fresh exploration
         self.tabu_list.clear()
@@ -331,36 +695,63 @@ class TabuSearch:
         # Reset stagnation counter
         self.iterations_without_improvement = 0
     
+    def restart_from_elite(self):
+        """Restarts the walk from a random member of the elite pool, with a clear tabu list"""
+        self.current_solution = self.random.choice(self.elite_pool).copy()
+        self.tabu_list.clear()
+        self.iterations_without_improvement = 0
+    
+    def _commit_move(self, changes: List[Tuple]) -> Genome:
+        """
+        Applies the selected move to the current solution in place. The current solution
+        only shares its arrays with best_solution (copy-on-write), so they are copied
+        only on the first move after an improvement.
+        """
+        neighbor = self.current_solution
+        
+        for ad_idx, _, target_idx in changes:
+            neighbor.move(ad_idx, target_idx)
+        
+        self.delta_evaluator.commit(changes, neighbor)
+        
+        return neighbor
+    
     def _perform_iteration(self):
         """Perform a single iteration of tabu search"""
-        # Generate neighbors
-        neighbors = self.neighborhood_gen.generate_neighbors(
-            current=self.current_solution,
-            tabu_list=self.tabu_list,
-            num_neighbors=self.neighborhood_size,
-            use_aspiration=self.use_aspiration,
-            best_fitness=self.best_solution.fitness if self.best_solution else float('-inf')
-        )
-        
-        if not neighbors:
+        # Keep the delta evaluator in sync when the current solution was replaced
+        # (initial solution, intensification, diversification, restart)
+        if self.delta_evaluator.solution is not self.current_solution:
+            self.delta_evaluator.reset(self.current_solution)
+        
+        # Generate and score neighbor moves, and select the best non-tabu neighbor
+        # (or best tabu if aspiration criterion met)
+        best_fitness = self.best_solution.fitness if self.best_solution else float('-inf')
+        if self.parallel_neighborhood:
+            best = self.neighborhood_gen.best_neighbor(
+                tabu_list=self.tabu_list,
+                num_neighbors=self.neighborhood_size,
+                use_aspiration=self.use_aspiration,
+                best_fitness=best_fitness
+            )
+        else:
+            neighbors = self.neighborhood_gen.generate_neighbors(
+                tabu_list=self.tabu_list,
+                num_neighbors=self.neighborhood_size,
+                use_aspiration=self.use_aspiration,
+                best_fitness=best_fitness
+            )
+            best = max(neighbors, key=lambda x: x[2]) if neighbors else None
+        
+        if best is None:
             # If no neighbors generated, do a random restart
             print("  [No valid neighbors, performing random restart]")
             self.current_solution = self.create_initial_solution()
             return
         
-        # Evaluate all neighbors
-        for neighbor, move in neighbors:
-            if neighbor.validate(self.campaign_ids, self.ad_ids):
-                self.fitness_evaluator.evaluate(neighbor)
-        
-        # Select best non-tabu neighbor (or best tabu if aspiration criterion met)
-        valid_neighbors = [(n, m) for n, m in neighbors 
-                          if n.validate(self.campaign_ids, self.ad_ids)]
-        
-        if not valid_neighbors:
-            return
+        best_changes, best_move, _ = best
         
-        best_neighbor, best_move = max(valid_neighbors, key=lambda x: x[0].fitness)
+        # Commit only the selected move
+        best_neighbor = self._commit_move(best_changes)
         
         # Update current solution
         self.current_solution = best_neighbor
@@ -371,18 +762,60 @@ class TabuSearch:
         
         # Update best solution if improved
         if self.best_solution is None or best_neighbor.fitness > self.best_solution.fitness:
-            self.best_solution = deepcopy(best_neighbor)
+            self.best_solution = best_neighbor.copy()
             self.iterations_without_improvement = 0
         else:
             self.iterations_without_improvement += 1
     
-    def run(self, verbose: bool = True):
-        """Execute the complete tabu search optimization process"""
+    def iterate(self, iteration: int) -> dict:
+        """
+        One iteration of the search (move, history entry, intensification / diversification
+        when due). Returns the history entry of the iteration.
+        """
+        self._perform_iteration()
+        
+        # Record history
+        self.history.append({
+            'iteration': iteration,
+            'best_fitness': self.best_solution.fitness,
+            'best_roi': self.best_solution.total_roi,
+            'best_cost': self.best_solution.total_cost,
+            'current_fitness': self.current_solution.fitness,
+            'current_roi': self.current_solution.total_roi,
+            'iterations_without_improvement': self.iterations_without_improvement
+        })
+        entry = self.history[-1]
+        
+        # Intensification: if making good progress, focus search
+        if (self.iterations_without_improvement > 0 and 
+            self.iterations_without_improvement % self.intensification_threshold == 0):
+            self.intensification()
+        
+        # Diversification: if stuck, jump to new region
+        if self.iterations_without_improvement >= self.diversification_threshold:
+            self.diversification()
+        
+        return entry
+    
+    def run(self,
+            verbose: bool = True,
+            progress_callback: Optional[Callable[[dict], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> Optional[Genome]:
+        """
+        Execute the complete tabu search optimization process.
+        Returns the best Genome; use FitnessEvaluator.to_individual for the API model.
+        
+        Args:
+            verbose: Whether to print progress
+            progress_callback: Called with each iteration's history entry
+            should_stop: Checked before every iteration; when it returns True the search
+                         stops early and returns the best solution found so far
+        """
         print("Inicializando solução inicial para Tabu Search...")
         
         try:
             self.current_solution = self.create_initial_solution()
-            self.best_solution = deepcopy(self.current_solution)
+            self.best_solution = self.current_solution.copy()
         except ValueError as e:
             print(f"FATAL TABU SEARCH ERROR: {e}")
             return None
@@ -394,27 +827,14 @@ class TabuSearch:
             print("-" * 70)
         
         for iteration in range(self.max_iterations):
-            self._perform_iteration()
-            
-            # Record history
-            self.history.append({
-                'iteration': iteration,
-                'best_fitness': self.best_solution.fitness,
-                'best_roi': self.best_solution.total_roi,
-                'best_cost': self.best_solution.total_cost,
-                'current_fitness': self.current_solution.fitness,
-                'current_roi': self.current_solution.total_roi,
-                'iterations_without_improvement': self.iterations_without_improvement
-            })
+            if should_stop is not None and should_stop():
+                print(f"Tabu Search interrompido na iteração {iteration}.")
+                break
             
-            # Intensification: if making good progress, focus search
-            if (self.iterations_without_improvement > 0 and 
-                self.iterations_without_improvement % self.intensification_threshold == 0):
-                self.intensification()
+            entry = self.iterate(iteration)
             
-            # Diversification: if stuck, jump to new region
-            if self.iterations_without_improvement >= self.diversification_threshold:
-                self.diversification()
+            if progress_callback is not None:
+                progress_callback(entry)
             
             if verbose and (iteration % 10 == 0 or iteration == self.max_iterations - 1):
                 print(f"Iter {iteration:3d} | "
@@ -445,7 +865,14 @@ def run_tabu_search_optimization(
     use_aspiration: bool = True,
     intensification_threshold: int = 50,
     diversification_threshold: int = 100,
-    verbose: bool = True
+    verbose: bool = True,
+    progress_callback: Optional[Callable[[dict], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    walkers: int = 1,
+    sync_interval: int = 20,
+    elite_size: int = 5,
+    parallel_neighborhood: bool = False,
+    seed: Union[None, int, np.random.SeedSequence] = None
 ) -> Optional[Individual]:
     """
     Orchestrates the entire Tabu Search optimization process.
@@ -462,6 +889,13 @@ def run_tabu_search_optimization(
         intensification_threshold: Iterations before intensification
         diversification_threshold: Iterations before diversification
         verbose: Whether to print progress
+        progress_callback: Called with each iteration's history entry
+        should_stop: Cooperative cancellation check, evaluated before every iteration
+        walkers: Parallel walkers; above 1 runs the multi-walker search (see multiWalker)
+        sync_interval: Iterations between elite pool exchanges of the walkers
+        elite_size: Number of best solutions kept in the shared elite pool
+        parallel_neighborhood: Score each neighbourhood in vectorized chunks on a thread pool
+        seed: Makes the search reproducible (None: fresh entropy)
     
     Returns:
         Best solution found (Individual) or None if failed
@@ -483,20 +917,40 @@ def run_tabu_search_optimization(
         risk_factor=risk_factor
     )
     
-    tabu_search = TabuSearch(
-        max_iterations=max_iterations,
-        tabu_tenure=tabu_tenure,
-        neighborhood_size=neighborhood_size,
-        fitness_evaluator=fitness_evaluator,
-        data_manager=data_manager,
-        use_aspiration=use_aspiration,
-        intensification_threshold=intensification_threshold,
-        diversification_threshold=diversification_threshold
-    )
+    stream = RandomStream(seed)
     
     # Run Tabu Search
     print("\n--- Tabu Search Orchestrator: Running Tabu Search ---")
-    best_solution = tabu_search.run(verbose=verbose)
+    if walkers > 1:
+        # Imported here: multiWalker depends on this module
+        from src.Tabu_Search_Algorithm.multiWalker import run_multi_walker_search
+        best_genome = run_multi_walker_search(
+            campaigns=campaigns, ads=ads, walkers=walkers,
+            max_iterations=max_iterations, tabu_tenure=tabu_tenure,
+            neighborhood_size=neighborhood_size, total_budget=total_budget, risk_factor=risk_factor,
+            use_aspiration=use_aspiration, intensification_threshold=intensification_threshold,
+            diversification_threshold=diversification_threshold,
+            sync_interval=sync_interval, elite_size=elite_size,
+            parallel_neighborhood=parallel_neighborhood,
+            seed=stream.seed_sequence, verbose=verbose, progress_callback=progress_callback, should_stop=should_stop
+        )
+    else:
+        tabu_search = TabuSearch(
+            max_iterations=max_iterations,
+            tabu_tenure=tabu_tenure,
+            neighborhood_size=neighborhood_size,
+            fitness_evaluator=fitness_evaluator,
+            data_manager=data_manager,
+            use_aspiration=use_aspiration,
+            intensification_threshold=intensification_threshold,
+            diversification_threshold=diversification_threshold,
+            parallel_neighborhood=parallel_neighborhood,
+            stream=stream
+        )
+        best_genome = tabu_search.run(verbose=verbose, progress_callback=progress_callback, should_stop=should_stop)
+    
+    # Materialize the API model only for the returned solution
+    best_solution = fitness_evaluator.to_individual(best_genome) if best_genome else None
     
     if best_solution:
         print("\n--- Tabu Search Orchestrator: Best solution details ---")
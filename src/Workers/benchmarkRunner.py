@@ -0,0 +1,489 @@
+# benchmarkRunner.py
+"""
+Parallel, resumable GA vs Tabu Search benchmark (the /multiple_comparisons workload).
+
+Iterations are spread over a process pool. Each one draws its campaign / ad subset,
+its parameters and the solvers' random state from its own seed, so any iteration can be
+re-run on its own. Rows are appended to the parameters / results CSV files as soon as
+an iteration completes, and an interrupted run can be resumed from its run id.
+
+CLI:
+    python -m src.Workers.benchmarkRunner --iterations 1000 --min-campaigns 1 --max-campaigns 10 \\
+        --min-ads 1 --max-ads 40 --seed 42
+    python -m src.Workers.benchmarkRunner --resume 20260118_182223_1a2b3c
+"""
+import os
+import csv
+import json
+import time
+import uuid
+import pickle
+import random
+import asyncio
+import argparse
+import numpy as np
+from datetime import datetime
+from dataclasses import dataclass, asdict
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Optional
+
+from src.Classes.models import Campaign, Ad
+from src.Genetic_Algorithm.geneticAlgorithm import run_genetic_optimization
+from src.Tabu_Search_Algorithm.tabuSearchAlgorithm import run_tabu_search_optimization
+from src.Predictors.AdsPredictor import predict_ads_conversion_rates_ml
+from src.Predictors.CampaignsPredictor import predict_campaigns_overcosts_ml
+from src.Workers.optimizationPool import OPTIMIZATION_WORKERS, get_executor, pack_problem, unpack_problem
+from src.Data_Store.columnarStore import load_catalogue
+
+BENCHMARK_DIRECTORY = "src/Algorithm_Comparisons/"
+
+PARAMETER_FIELDS = [
+    "iteration", "n_campaigns", "n_ads", "total_budget", "risk_factor",
+    "ga_population_size", "ga_max_generations", "ga_mutation_rate", "ga_crossover_rate",
+    "tabu_max_iterations", "tabu_tenure", "tabu_neighborhood_size", "tabu_use_aspiration",
+    "tabu_intensification_threshold", "tabu_diversification_threshold", "seed", "error",
+]
+
+# The first columns keep the historical layout (read by position in /best_runs)
+RESULT_FIELDS = [
+    "ga_fitness", "ga_total_roi", "ga_execution_time",
+    "tabu_fitness", "tabu_total_roi", "tabu_execution_time",
+    "roi_difference", "time_difference", "winner", "iteration", "error",
+]
+
+# Packed catalogues kept per worker process (see _run_iteration_from_file)
+PROBLEM_CACHE_SIZE = 4
+
+
+# ============================================================================
+# 1. GERAÇÃO DE INSTÂNCIAS
+# ============================================================================
+
+@dataclass
+class BenchmarkConfig:
+    """Settings of a benchmark run, stored next to its CSV files so it can be resumed"""
+    n_iterations: int
+    min_campaigns: int
+    max_campaigns: int
+    min_ads: int
+    max_ads: int
+    seed: int
+
+
+def iteration_seed(base_seed: int, iteration: int) -> int:
+    """Deterministic, well-mixed seed of one iteration (independent of execution order)"""
+    return int(np.random.SeedSequence([base_seed, iteration]).generate_state(1)[0])
+
+
+def generate_random_subset_campaigns_ads(
+    campaigns: List[Campaign],
+    ads: List[Ad],
+    min_campaigns: int,
+    max_campaigns: int,
+    min_ads: int,
+    max_ads: int,
+    rng: random.Random = random
+) -> Tuple[List[Campaign], List[Ad]]:
+    """Generate random subsets of campaigns and ads (objects or packed rows) from the database"""
+
+    # Determine random counts
+    n_campaigns = rng.randint(min_campaigns, min(max_campaigns, len(campaigns)))
+    n_ads = rng.randint(min_ads, min(max_ads, len(ads)))
+
+    # Ensure we dont have more campaings that ads
+    n_campaigns = min(n_campaigns, n_ads)
+
+    # Ensure we have enough data
+    if len(campaigns) < n_campaigns or len(ads) < n_ads:
+        raise ValueError(f"Not enough data in database. Have {len(campaigns)} campaigns and {len(ads)} ads.")
+
+    # Select random subsets
+    selected_campaigns = rng.sample(campaigns, n_campaigns)
+    selected_ads = rng.sample(ads, n_ads)
+
+    return selected_campaigns, selected_ads
+
+
+def generate_params(campaigns: List[Campaign], rng: random.Random = random) -> dict:
+    #Total budget should be at least the sum of approved budgets
+    total_approved_budgets = sum(c.approved_budget for c in campaigns)
+    total_budget = rng.uniform(total_approved_budgets * 1.1, total_approved_budgets * 1.5)
+
+    risk_factor = round(rng.uniform(0, 2.0), 2)
+    pop_size = rng.randint(10, 100)
+    max_gens = rng.randint(20, 200)
+
+    mutation_rate = round(rng.uniform(0.05, 0.3), 2)
+    crossover_rate = round(rng.uniform(0.7, 0.95), 2)
+
+    tabu_tenure = rng.randint(5, 30)
+    intensification_threshold = rng.randint(20, 100)
+    diversification_threshold = rng.randint(50, 200)
+
+    return {
+        "total_budget": total_budget,
+        "risk_factor": risk_factor,
+        "population_size": pop_size,
+        "max_generations": max_gens,
+        "mutation_rate": mutation_rate,
+        "crossover_rate": crossover_rate,
+        "tabu_tenure": tabu_tenure,
+        "intensification_threshold": intensification_threshold,
+        "diversification_threshold": diversification_threshold,
+        "ga_verbose": False,
+        "max_iterations": max_gens,
+        "neighborhood_size": pop_size,
+        "use_aspiration": True,
+        "ts_verbose": False
+    }
+
+
+# ============================================================================
+# 2. ITERAÇÃO (EXECUTADA NOS WORKERS)
+# ============================================================================
+
+def run_iteration(iteration: int, seed: int, config: BenchmarkConfig,
+                  problem: Tuple[List[tuple], List[tuple]]) -> Tuple[dict, dict]:
+    """
+    Runs one GA vs Tabu Search comparison and returns its (parameters, results) rows.
+    Everything random in the iteration, solvers included, derives from seed.
+    """
+    rng = random.Random(seed)
+    # Own streams for each solver, independent of the draws of the subset / parameters
+    ga_seed, ts_seed = np.random.SeedSequence(seed).spawn(2)
+
+    try:
+        # Sampled on the packed rows: only the selected campaigns / ads are rebuilt
+        campaign_rows, ad_rows = generate_random_subset_campaigns_ads(
+            *problem,
+            config.min_campaigns, config.max_campaigns,
+            config.min_ads, config.max_ads,
+            rng=rng
+        )
+        campaigns, ads = unpack_problem((campaign_rows, ad_rows))
+        params = generate_params(campaigns, rng=rng)
+
+        # Predict values once for both algorithms
+        predicted_ads = predict_ads_conversion_rates_ml(ads)
+        predicted_campaigns = predict_campaigns_overcosts_ml(campaigns)
+
+        ga_start = time.time()
+        ga_solution = None
+        try:
+            ga_solution = run_genetic_optimization(
+                campaigns=predicted_campaigns,
+                ads=predicted_ads,
+                population_size=params["population_size"],
+                max_generations=params["max_generations"],
+                mutation_rate=params["mutation_rate"],
+                crossover_rate=params["crossover_rate"],
+                total_budget=params["total_budget"],
+                risk_factor=params["risk_factor"],
+                verbose=params["ga_verbose"],
+                seed=ga_seed
+            )
+        except Exception as e:
+            print(f"[Iteration {iteration}] GA Error: {e}")
+        ga_time = time.time() - ga_start
+
+        ts_start = time.time()
+        ts_solution = None
+        try:
+            ts_solution = run_tabu_search_optimization(
+                campaigns=predicted_campaigns,
+                ads=predicted_ads,
+                max_iterations=params["max_iterations"],
+                tabu_tenure=params["tabu_tenure"],
+                neighborhood_size=params["neighborhood_size"],
+                total_budget=params["total_budget"],
+                risk_factor=params["risk_factor"],
+                use_aspiration=params["use_aspiration"],
+                intensification_threshold=params["intensification_threshold"],
+                diversification_threshold=params["diversification_threshold"],
+                verbose=params["ts_verbose"],
+                seed=ts_seed
+            )
+        except Exception as e:
+            print(f"[Iteration {iteration}] Tabu Search Error: {e}")
+        ts_time = time.time() - ts_start
+
+    except Exception as e:
+        print(f"Error in iteration {iteration}: {e}")
+        return ({"iteration": iteration, "seed": seed, "error": str(e)},
+                {"iteration": iteration, "error": str(e), "winner": "Error"})
+
+    # Determine winner
+    winner = "Error"
+    roi_diff = 0
+    time_diff = 0
+
+    if ga_solution and ts_solution:
+        ga_roi = ga_solution.total_roi
+        ts_roi = ts_solution.total_roi
+        roi_diff = ga_roi - ts_roi
+        time_diff = ga_time - ts_time
+
+        if ga_roi > ts_roi:
+            winner = "GA"
+        elif ts_roi > ga_roi:
+            winner = "Tabu"
+        else:  # ROI is equal
+            if ga_time < ts_time:
+                winner = "GA"
+            elif ts_time < ga_time:
+                winner = "Tabu"
+            else:
+                winner = "Tie"
+    elif ga_solution:
+        winner = "GA"
+    elif ts_solution:
+        winner = "Tabu"
+
+    parameters_record = {
+        "iteration": iteration,
+        "n_campaigns": len(campaigns),
+        "n_ads": len(ads),
+        "total_budget": params["total_budget"],
+        "risk_factor": params["risk_factor"],
+        "ga_population_size": params["population_size"],
+        "ga_max_generations": params["max_generations"],
+        "ga_mutation_rate": params["mutation_rate"],
+        "ga_crossover_rate": params["crossover_rate"],
+        "tabu_max_iterations": params["max_iterations"],
+        "tabu_tenure": params["tabu_tenure"],
+        "tabu_neighborhood_size": params["neighborhood_size"],
+        "tabu_use_aspiration": params["use_aspiration"],
+        "tabu_intensification_threshold": params["intensification_threshold"],
+        "tabu_diversification_threshold": params["diversification_threshold"],
+        "seed": seed,
+    }
+
+    result_row = {
+        "ga_fitness": ga_solution.fitness if ga_solution else None,
+        "ga_total_roi": ga_solution.total_roi if ga_solution else None,
+        "ga_execution_time": ga_time,
+        "tabu_fitness": ts_solution.fitness if ts_solution else None,
+        "tabu_total_roi": ts_solution.total_roi if ts_solution else None,
+        "tabu_execution_time": ts_time,
+        "roi_difference": roi_diff,
+        "time_difference": time_diff,
+        "winner": winner,
+        "iteration": iteration,
+    }
+
+    return parameters_record, result_row
+
+
+_problems: Dict[str, Tuple[List[tuple], List[tuple]]] = {}
+
+
+def _run_iteration_from_file(iteration: int, seed: int, config: BenchmarkConfig,
+                             problem_filename: str) -> Tuple[dict, dict]:
+    """
+    run_iteration on the packed catalogue saved by BenchmarkRunner. The file is read once
+    per worker process, so only its name goes through the pool queue for each iteration.
+    """
+    problem = _problems.get(problem_filename)
+    if problem is None:
+        with open(problem_filename, "rb") as f:
+            problem = pickle.load(f)
+        if len(_problems) >= PROBLEM_CACHE_SIZE:
+            _problems.pop(next(iter(_problems)))
+        _problems[problem_filename] = problem
+    return run_iteration(iteration, seed, config, problem)
+
+
+# ============================================================================
+# 3. EXECUÇÃO E RETOMA
+# ============================================================================
+
+class BenchmarkRunner:
+    """
+    Runs (or resumes) a benchmark identified by run_id. The files of a run are
+    multiple_comparisons_{config,parameters,results}_{run_id}.{json,csv}; an iteration
+    counts as completed once its results row is written. New run ids are the start time
+    plus a random suffix, so runs started in the same second get their own files.
+    """
+
+    def __init__(self, config: BenchmarkConfig, campaigns: List[Campaign], ads: List[Ad],
+                 run_id: Optional[str] = None, directory: str = BENCHMARK_DIRECTORY):
+        self.config = config
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.directory = directory
+        self.problem = pack_problem(campaigns, ads)
+
+        self.config_filename = os.path.join(directory, f"multiple_comparisons_config_{self.run_id}.json")
+        self.parameters_filename = os.path.join(directory, f"multiple_comparisons_parameters_{self.run_id}.csv")
+        self.results_filename = os.path.join(directory, f"multiple_comparisons_results_{self.run_id}.csv")
+        # Catalogue handed to the workers while the run is in progress
+        self.problem_filename = os.path.join(directory, f"multiple_comparisons_problem_{self.run_id}.pkl")
+
+        os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self.config_filename):
+            with open(self.config_filename, "w", encoding="utf-8") as f:
+                json.dump(asdict(config), f, indent=2)
+
+        self.results: Dict[int, dict] = {}
+        self._load_completed()
+
+    @classmethod
+    def resume(cls, run_id: str, campaigns: List[Campaign], ads: List[Ad],
+               directory: str = BENCHMARK_DIRECTORY) -> "BenchmarkRunner":
+        """Reopens an interrupted run; only the iterations without a results row are run"""
+        config_filename = os.path.join(directory, f"multiple_comparisons_config_{run_id}.json")
+        if not os.path.exists(config_filename):
+            raise FileNotFoundError(f"No benchmark run found with id '{run_id}'.")
+        with open(config_filename, "r", encoding="utf-8") as f:
+            config = BenchmarkConfig(**json.load(f))
+        return cls(config, campaigns, ads, run_id=run_id, directory=directory)
+
+    def _load_completed(self):
+        """Reads the results already on disk and drops parameter rows of unfinished iterations"""
+        if os.path.exists(self.results_filename):
+            with open(self.results_filename, "r", newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    if row.get("iteration", "").isdigit():
+                        self.results[int(row["iteration"])] = row
+
+        if os.path.exists(self.parameters_filename):
+            with open(self.parameters_filename, "r", newline="", encoding="utf-8") as f:
+                rows = [row for row in csv.DictReader(f)
+                        if row.get("iteration", "").isdigit() and int(row["iteration"]) in self.results]
+            self._write_rows(self.parameters_filename, PARAMETER_FIELDS, rows, mode="w")
+
+    @staticmethod
+    def _write_rows(filename: str, fieldnames: List[str], rows: List[dict], mode: str = "a"):
+        write_header = mode == "w" or not os.path.exists(filename) or os.path.getsize(filename) == 0
+        with open(filename, mode, newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", extrasaction="ignore")
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def pending_iterations(self) -> List[int]:
+        return [i for i in range(1, self.config.n_iterations + 1) if i not in self.results]
+
+    def _submit_all(self, executor: Executor) -> list:
+        with open(self.problem_filename, "wb") as f:
+            pickle.dump(self.problem, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return [executor.submit(_run_iteration_from_file, i, iteration_seed(self.config.seed, i),
+                                self.config, self.problem_filename)
+                for i in self.pending_iterations()]
+
+    def _remove_problem_file(self):
+        if os.path.exists(self.problem_filename):
+            os.remove(self.problem_filename)
+
+    def record(self, parameters_record: dict, result_row: dict):
+        """Appends one completed iteration (results last, so it marks completion)"""
+        self._write_rows(self.parameters_filename, PARAMETER_FIELDS, [parameters_record])
+        self._write_rows(self.results_filename, RESULT_FIELDS, [result_row])
+        self.results[result_row["iteration"]] = result_row
+
+        print(f"[{len(self.results)}/{self.config.n_iterations}] Iteration {result_row['iteration']}: "
+              f"winner={result_row['winner']}")
+
+    def run(self, executor: Optional[Executor] = None) -> dict:
+        """Blocking run (CLI). Uses the shared optimization pool unless an executor is given."""
+        futures = self._submit_all(executor or get_executor())
+        try:
+            for future in as_completed(futures):
+                self.record(*future.result())
+        finally:
+            self._remove_problem_file()
+        return self.summary()
+
+    async def run_async(self) -> dict:
+        """Same as run, without blocking the event loop (API)"""
+        futures = [asyncio.wrap_future(f) for f in self._submit_all(get_executor())]
+        try:
+            for future in asyncio.as_completed(futures):
+                self.record(*await future)
+        finally:
+            self._remove_problem_file()
+        return self.summary()
+
+    def summary(self) -> dict:
+        successful_runs = [r for r in self.results.values() if r.get("winner") not in ["Error", None]]
+        ga_wins = sum(1 for r in successful_runs if r["winner"] == "GA")
+        tabu_wins = sum(1 for r in successful_runs if r["winner"] == "Tabu")
+        ties = sum(1 for r in successful_runs if r["winner"] == "Tie")
+
+        print(f"\n{'='*80}")
+        print("BENCHMARK COMPLETE")
+        print(f"{'='*80}")
+        print(f"Total iterations: {self.config.n_iterations}")
+        print(f"Successful runs: {len(successful_runs)}")
+        print(f"GA wins: {ga_wins}")
+        print(f"Tabu wins: {tabu_wins}")
+        print(f"Ties: {ties}")
+        print(f"Parameters saved to: {self.parameters_filename}")
+        print(f"Results saved to: {self.results_filename}")
+        print(f"{'='*80}\n")
+
+        return {
+            "run_id": self.run_id,
+            "total_iterations": self.config.n_iterations,
+            "completed_iterations": len(self.results),
+            "successful_runs": len(successful_runs),
+            "ga_wins": ga_wins,
+            "tabu_wins": tabu_wins,
+            "ties": ties,
+            "parameters_filename": self.parameters_filename,
+            "results_filename": self.results_filename,
+            "message": "Benchmark completed successfully"
+        }
+
+
+# ============================================================================
+# 4. LINHA DE COMANDOS
+# ============================================================================
+
+def load_database(directory: str = "src/DB") -> Tuple[List[Campaign], List[Ad]]:
+    """Loads the campaigns / ads catalogue used by the API (see load_catalogue)"""
+    campaigns, _ = load_catalogue(directory, "campaigns", Campaign)
+    ads, _ = load_catalogue(directory, "ads", Ad)
+    return campaigns, ads
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel GA vs Tabu Search benchmark")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--min-campaigns", type=int, default=1)
+    parser.add_argument("--max-campaigns", type=int, default=10)
+    parser.add_argument("--min-ads", type=int, default=1)
+    parser.add_argument("--max-ads", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=None, help="Base seed (random when omitted)")
+    parser.add_argument("--workers", type=int, default=OPTIMIZATION_WORKERS)
+    parser.add_argument("--resume", metavar="RUN_ID", default=None, help="Resume an interrupted run")
+    parser.add_argument("--directory", default=BENCHMARK_DIRECTORY)
+    args = parser.parse_args()
+
+    campaigns, ads = load_database()
+
+    if args.resume:
+        runner = BenchmarkRunner.resume(args.resume, campaigns, ads, directory=args.directory)
+    else:
+        if args.iterations <= 0:
+            parser.error("--iterations must be positive")
+        config = BenchmarkConfig(
+            n_iterations=args.iterations,
+            min_campaigns=args.min_campaigns,
+            max_campaigns=args.max_campaigns,
+            min_ads=args.min_ads,
+            max_ads=args.max_ads,
+            seed=args.seed if args.seed is not None else random.randrange(2**32)
+        )
+        runner = BenchmarkRunner(config, campaigns, ads, directory=args.directory)
+
+    print(f"Run {runner.run_id}: {len(runner.pending_iterations())} of {runner.config.n_iterations} "
+          f"iterations to run on {args.workers} workers")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        runner.run(executor)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# jobManager.py
+import time
+import uuid
+import queue
+import asyncio
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Dict, Optional, Any, Literal
+
+from src.Classes.models import Campaign, Ad
+from src.Genetic_Algorithm.geneticAlgorithm import Individual
+from src.Workers.optimizationPool import get_executor, pack_problem, _solve_genetic, _solve_tabu
+
+JobStatus = Literal['pending', 'running', 'completed', 'cancelled', 'failed']
+
+# Finished jobs kept in memory for polling before the oldest are discarded
+MAX_FINISHED_JOBS = 100
+
+# How often the parent process drains the progress queue of a running job (seconds)
+PROGRESS_POLL_INTERVAL = 0.2
+
+
+# ============================================================================
+# 1. FUNÇÃO EXECUTADA NO WORKER
+# ============================================================================
+
+def _run_job(algorithm: str, problem, params: dict, progress_queue, cancel_event) -> Optional[Individual]:
+    """
+    Worker-side entry point: runs the solver with its progress reported through a
+    manager queue and cooperative cancellation driven by a manager event.
+    """
+    params = dict(params,
+                  progress_callback=progress_queue.put,
+                  should_stop=cancel_event.is_set)
+
+    if algorithm == 'genetic':
+        return _solve_genetic(problem, params)
+    return _solve_tabu(problem, params)
+
+
+# ============================================================================
+# 2. ESTRUTURAS DE DADOS
+# ============================================================================
+
+class OptimizationJob:
+    """
+    State of one asynchronous optimization run.
+
+    progress holds the GA / Tabu history entries streamed from the worker; result is
+    the best solution (also set when the job is cancelled mid-run).
+    """
+
+    def __init__(self, algorithm: str, progress_queue, cancel_event):
+        self.id = uuid.uuid4().hex
+        self.algorithm = algorithm
+        self.status: JobStatus = 'pending'
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.progress: List[dict] = []
+        self.result: Optional[Individual] = None
+        self.error: Optional[str] = None
+
+        self.progress_queue = progress_queue
+        self.cancel_event = cancel_event
+        self.future: Optional[Future] = None
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('completed', 'cancelled', 'failed')
+
+    def drain_progress(self):
+        """Moves the progress entries sent by the worker into self.progress"""
+        while True:
+            try:
+                entry = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.progress.append(entry)
+            if self.status == 'pending':
+                self.status = 'running'
+
+    def snapshot(self, include_result: bool = True) -> Dict[str, Any]:
+        """Status summary returned by the API"""
+        return {
+            'job_id': self.id,
+            'algorithm': self.algorithm,
+            'status': self.status,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+            'progress_count': len(self.progress),
+            'latest_progress': self.progress[-1] if self.progress else None,
+            'result': self.result if include_result else None,
+            'error': self.error,
+        }
+
+
+# ============================================================================
+# 3. GESTOR DE JOBS
+# ============================================================================
+
+class JobManager:
+    """
+    Runs optimizations as background jobs on the shared worker pool.
+    Jobs can be polled, cancelled and followed through their progress entries.
+    """
+
+    def __init__(self, max_finished_jobs: int = MAX_FINISHED_JOBS):
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: "OrderedDict[str, OptimizationJob]" = OrderedDict()
+        self._manager = None
+
+    def _get_manager(self):
+        """Process manager providing the queues / events shared with the workers"""
+        if self._manager is None:
+            self._manager = multiprocessing.Manager()
+        return self._manager
+
+    def submit(self, algorithm: str, campaigns: List[Campaign], ads: List[Ad], params: dict) -> OptimizationJob:
+        """Schedules a GA ('genetic') or Tabu Search ('tabu') run and returns its job"""
+        manager = self._get_manager()
+        job = OptimizationJob(algorithm, manager.Queue(), manager.Event())
+        self.jobs[job.id] = job
+        self._discard_old_jobs()
+
+        job.task = asyncio.get_running_loop().create_task(
+            self._run(job, pack_problem(campaigns, ads), params))
+        return job
+
+    async def _run(self, job: OptimizationJob, problem, params: dict):
+        job.future = get_executor().submit(_run_job, job.algorithm, problem, params,
+                                           job.progress_queue, job.cancel_event)
+        waiter = asyncio.wrap_future(job.future)
+        try:
+            while not waiter.done():
+                await asyncio.wait({waiter}, timeout=PROGRESS_POLL_INTERVAL)
+                job.drain_progress()
+
+            job.drain_progress()
+            job.result = waiter.result()
+
+            if job.cancel_event.is_set():
+                job.status = 'cancelled'
+            elif job.result is None:
+                job.status = 'failed'
+                job.error = "Optimization failed to find a solution."
+            else:
+                job.status = 'completed'
+        except asyncio.CancelledError:
+            # Cancelled before a worker picked it up
+            job.status = 'cancelled'
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Optional[OptimizationJob]:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[OptimizationJob]:
+        """Requests cancellation; a running solver stops at its next generation / iteration"""
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        job.cancel_event.set()
+        if job.future is not None:
+            job.future.cancel()  # Only succeeds while the job is still queued
+        return job
+
+    def _discard_old_jobs(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    def shutdown(self):
+        """Cancels pending jobs and stops the process manager"""
+        for job in self.jobs.values():
+            if not job.finished:
+                self.cancel(job.id)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+
+job_manager = JobManager()
@@ -0,0 +1,122 @@
+# optimizationPool.py
+import os
+import time
+import asyncio
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Union
+
+from src.Classes.models import Campaign, Ad
+from src.Genetic_Algorithm.geneticAlgorithm import Individual, run_genetic_optimization
+from src.Tabu_Search_Algorithm.tabuSearchAlgorithm import run_tabu_search_optimization
+
+# ============================================================================
+# 1. CONFIGURAÇÃO DO POOL
+# ============================================================================
+
+# Number of worker processes for GA / Tabu Search runs (env: OPTIMIZATION_WORKERS)
+OPTIMIZATION_WORKERS = max(1, int(os.getenv("OPTIMIZATION_WORKERS", os.cpu_count() or 1)))
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Returns the shared process pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=OPTIMIZATION_WORKERS)
+    return _executor
+
+
+def shutdown_executor():
+    """Stops the worker processes (called on application shutdown)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+# ============================================================================
+# 2. SERIALIZAÇÃO COMPACTA
+# ============================================================================
+
+def pack_problem(campaigns: List[Campaign], ads: List[Ad]) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Packs campaigns and ads as plain field tuples. They pickle much smaller than the
+    pydantic dataclasses and are rebuilt in the worker with unpack_problem.
+    """
+    return ([dataclasses.astuple(c) for c in campaigns],
+            [dataclasses.astuple(a) for a in ads])
+
+
+def unpack_problem(problem: Tuple[List[tuple], List[tuple]]) -> Tuple[List[Campaign], List[Ad]]:
+    """Rebuilds the Campaign / Ad objects packed by pack_problem"""
+    campaign_rows, ad_rows = problem
+    return [Campaign(*row) for row in campaign_rows], [Ad(*row) for row in ad_rows]
+
+
+# ============================================================================
+# 3. FUNÇÕES EXECUTADAS NOS WORKERS
+# ============================================================================
+
+def _solve_genetic(problem: Tuple[List[tuple], List[tuple]], params: dict) -> Optional[Individual]:
+    campaigns, ads = unpack_problem(problem)
+    return run_genetic_optimization(campaigns=campaigns, ads=ads, **params)
+
+
+def _solve_tabu(problem: Tuple[List[tuple], List[tuple]], params: dict) -> Optional[Individual]:
+    campaigns, ads = unpack_problem(problem)
+    return run_tabu_search_optimization(campaigns=campaigns, ads=ads, **params)
+
+
+def _solve_timed(algorithm: str, problem: Tuple[List[tuple], List[tuple]],
+                 params: dict) -> Tuple[Optional[Individual], float, float]:
+    """
+    Runs one solver and measures it inside the worker, so queueing time is not counted.
+    Returns (solution, wall time, CPU time) in seconds.
+    """
+    solver = _solve_genetic if algorithm == 'genetic' else _solve_tabu
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    solution = solver(problem, params)
+    return solution, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+# ============================================================================
+# 4. API ASSÍNCRONA
+# ============================================================================
+
+async def run_genetic_in_pool(campaigns: List[Campaign], ads: List[Ad], **params) -> Optional[Individual]:
+    """
+    Runs run_genetic_optimization in a worker process without blocking the event loop.
+    Keyword arguments are forwarded to run_genetic_optimization.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), _solve_genetic, pack_problem(campaigns, ads), params)
+
+
+async def run_tabu_in_pool(campaigns: List[Campaign], ads: List[Ad], **params) -> Optional[Individual]:
+    """
+    Runs run_tabu_search_optimization in a worker process without blocking the event loop.
+    Keyword arguments are forwarded to run_tabu_search_optimization.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), _solve_tabu, pack_problem(campaigns, ads), params)
+
+
+async def run_comparison_in_pool(campaigns: List[Campaign], ads: List[Ad], ga_params: dict, ts_params: dict
+                                 ) -> Tuple[Union[Tuple[Optional[Individual], float, float], BaseException],
+                                            Union[Tuple[Optional[Individual], float, float], BaseException]]:
+    """
+    Runs GA and Tabu Search at the same time on two workers, sharing one packed copy of
+    the problem. Each result is (solution, wall time, CPU time), or the exception raised
+    by that solver so that one failure does not discard the other result.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    problem = pack_problem(campaigns, ads)
+
+    return tuple(await asyncio.gather(
+        loop.run_in_executor(executor, _solve_timed, 'genetic', problem, ga_params),
+        loop.run_in_executor(executor, _solve_timed, 'tabu', problem, ts_params),
+        return_exceptions=True
+    ))
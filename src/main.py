@@ -1,40 +1,55 @@
-from fileinput import filename
+import csv
 import json
+import asyncio
 from datetime import date, datetime
 import os
 import random
 import time
+from copy import deepcopy
+from functools import partial
 from typing import List, Literal, Optional, Dict, Any
 from src.Classes.models import Campaign, Ad, AllMarketingData, OptimizationRequest
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import pandas as pd
 
-# Import the main orchestration function from genetic_algorithm_core
-from src.Genetic_Algorithm.geneticAlgorithm import Individual, run_genetic_optimization
+# Solution model returned by the optimization endpoints
+from src.Genetic_Algorithm.geneticAlgorithm import Individual
+
+# GA / Tabu Search runs are dispatched to a worker process pool
+from src.Workers.optimizationPool import run_genetic_in_pool, run_tabu_in_pool, run_comparison_in_pool, shutdown_executor
+from src.Workers.jobManager import job_manager
+from src.Workers.benchmarkRunner import BenchmarkConfig, BenchmarkRunner
 
-# Import the tabu search orchestration function
-from src.Tabu_Search_Algorithm.tabuSearchAlgorithm import run_tabu_search_optimization
+# Indexed in-memory store behind the campaigns / ads endpoints
+from src.Data_Store.dataStore import data_store
+from src.Data_Store.responseCache import cached_json_response
+from src.Data_Store.columnarStore import load_catalogue
 
 # --- 2. Data Storage (in-memory, loaded from JSON) ---
 campaigns_db: List[Campaign] = []
 ads_db: List[Ad] = []
 
-from src.Predictors.AdsPredictor import predict_ads_conversion_rates_ml 
-from src.Predictors.CampaignsPredictor import predict_campaigns_overcosts_ml
+from src.Predictors.AdsPredictor import predict_ads_conversion_rates_ml, PREDICTION_CACHE as ADS_PREDICTION_CACHE
+from src.Predictors.CampaignsPredictor import predict_campaigns_overcosts_ml, PREDICTION_CACHE as CAMPAIGNS_PREDICTION_CACHE
+from src.Predictors.modelRegistry import model_registry, MODEL_LOADING
+from src.Predictors.microBatcher import MicroBatcher
 
 def load_data_from_json():
-    """Loads campaign and ad data from JSON files into the in-memory databases."""
+    """
+    Loads campaign and ad data into the in-memory databases. A .parquet version of a file
+    is read when present (pyarrow installed), else the JSON is streamed and validated in
+    batches; a .jsonl / .ndjson version of the JSON is used when present.
+    """
     global campaigns_db, ads_db
     
     # Load Campaigns
     try:
-        with open('src/DB/campaigns.json', 'r') as lc:
-            raw_campaigns = json.load(lc)
-            campaigns_db = [Campaign(**c) for c in raw_campaigns]
-        print(f"Loaded {len(campaigns_db)} campaigns successfully.")
+        campaigns_db, stats = load_catalogue('src/DB', 'campaigns', Campaign)
+        print(f"Loaded {len(campaigns_db)} campaigns successfully. ({stats})")
     except FileNotFoundError:
         print("Error: campaigns.json not found. Please generate it first.")
     except Exception as e:
@@ -42,10 +57,8 @@ def load_data_from_json():
 
     # Load Ads
     try:
-        with open('src/DB/ads.json', 'r') as la:
-            raw_ads = json.load(la)
-            ads_db = [Ad(**a) for a in raw_ads]
-        print(f"Loaded {len(ads_db)} ads successfully.")
+        ads_db, stats = load_catalogue('src/DB', 'ads', Ad)
+        print(f"Loaded {len(ads_db)} ads successfully. ({stats})")
     except FileNotFoundError:
         print("Error: ads.json not found. Please generate it first.")
     except Exception as e:
@@ -54,6 +67,12 @@ def load_data_from_json():
 # Load data immediately when the application starts
 load_data_from_json()
 
+# Indexed view of the data for lookups and filtered / paginated lists
+data_store.load(campaigns_db, ads_db)
+
+# Largest page the list endpoints return at once
+MAX_PAGE_SIZE = 1000
+
 # --- 3. Initialize FastAPI App ---
 app = FastAPI(
     title="Marketing Data API",
@@ -68,8 +87,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["X-Total-Count"],  # Total matches of the paginated lists
 )
 
+@app.on_event("startup")
+def start_model_loading():
+    """Loads the prediction models in the background so the server can bind its port right away."""
+    if MODEL_LOADING == "background":
+        model_registry.start_background_loading()
+
+@app.on_event("shutdown")
+def stop_optimization_workers():
+    """Cancels running optimization jobs and stops the worker processes."""
+    job_manager.shutdown()
+    shutdown_executor()
+
 # --- 4. API Endpoints ---
 
 @app.get("/", tags=["Root"])
@@ -77,52 +109,172 @@ async def read_root():
     """Welcome message for the API."""
     return {"message": "Welcome to the Marketing Data API!"}
 
+@app.get("/ready", tags=["Root"])
+async def readiness():
+    """
+    Readiness probe: 200 once every prediction model is loaded and warmed up, 503 before.
+    A 503 starts loading the missing models in the background, so a lazy deployment
+    (MODEL_LOADING=lazy) becomes ready without waiting for a prediction and a failed model
+    is retried (at most every MODEL_RETRY_SECONDS).
+    """
+    ready = model_registry.is_ready()
+    if not ready:
+        model_registry.start_background_loading()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "models": model_registry.status()}
+    )
+
 @app.get("/campaigns", response_model=List[Campaign], tags=["Campaigns"])
-async def get_all_campaigns():
-    """Retrieve a list of all marketing campaigns."""
-    return campaigns_db
+async def get_all_campaigns(
+    request: Request,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    channel_name: Optional[str] = None,
+    ext_service_name: Optional[str] = None,
+    search_tag_cat: Optional[str] = None,
+):
+    """
+    Retrieve the marketing campaigns, optionally filtered and paginated
+    (all of them when no parameter is given). X-Total-Count holds the number of matches.
+    """
+    if offset == 0 and limit is None and not (channel_name or ext_service_name or search_tag_cat):
+        return cached_json_response(request, data_store.encoded('campaigns'))
+
+    campaigns, total = data_store.campaigns.page(
+        offset, limit,
+        channel_name=channel_name, ext_service_name=ext_service_name, search_tag_cat=search_tag_cat
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return campaigns
 
 @app.get("/campaigns/{campaign_id}", response_model=Campaign, tags=["Campaigns"])
 async def get_campaign_by_id(campaign_id: int):
     """Retrieve a single marketing campaign by its ID."""
-    campaign = next((c for c in campaigns_db if c.id == campaign_id), None)
+    campaign = data_store.campaigns.get(campaign_id)
     if campaign is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
     return campaign
 
 @app.get("/ads", response_model=List[Ad], tags=["Ads"])
-async def get_all_ads():
-    """Retrieve a list of all advertisements."""
-    return ads_db
+async def get_all_ads(
+    request: Request,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    ad_topic: Optional[str] = None,
+    location: Optional[str] = None,
+    device_type: Optional[str] = None,
+    age_group: Optional[str] = None,
+    content_type: Optional[str] = None,
+):
+    """
+    Retrieve the advertisements, optionally filtered and paginated
+    (all of them when no parameter is given). X-Total-Count holds the number of matches.
+    """
+    if offset == 0 and limit is None and not (ad_topic or location or device_type or age_group or content_type):
+        return cached_json_response(request, data_store.encoded('ads'))
+
+    ads, total = data_store.ads.page(
+        offset, limit,
+        ad_topic=ad_topic, location=location, device_type=device_type,
+        age_group=age_group, content_type=content_type
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return ads
 
 @app.get("/ads/{ad_id}", response_model=Ad, tags=["Ads"])
 async def get_ad_by_id(ad_id: int):
     """Retrieve a single advertisement by its ID."""
-    ad = next((a for a in ads_db if a.id == ad_id), None)
+    ad = data_store.ads.get(ad_id)
     if ad is None:
         raise HTTPException(status_code=404, detail="Ad not found")
     return ad
 
 @app.get("/allData", response_model=AllMarketingData, tags=["Combined Data"])
-async def get_all_data():
-    """Retrieve all campaigns and all ads in a single response."""
-    return AllMarketingData(campaigns=campaigns_db, ads=ads_db)
+async def get_all_data(request: Request):
+    """Retrieve all campaigns and all ads in a single response (pre-encoded, with ETag)."""
+    return cached_json_response(request, data_store.encoded('allData'))
 
 @app.post("/campaigns/predict_overcosts", response_model=List[Campaign], tags=["Prediction"])
 async def predict_campaign_overcosts_endpoint(campaigns: List[Campaign]):
     """
     Receives a list of campaigns and returns them with predicted overcost values.
     """
-    return predict_campaign_overcosts(campaigns)
+    try:
+        return await campaigns_prediction_batcher.submit(campaigns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Prediction failed: {e}")
 
 @app.post("/ads/predict_conversion_rates", response_model=List[Ad], tags=["Prediction"])
 async def predict_ads_conversion_rates_endpoint(ads: List[Ad]):
     """
     Receives a list of ads and returns them with predicted conversion rates.
     """
-    return predict_ads_conversion_rates(ads)
+    try:
+        return await ads_prediction_batcher.submit(ads)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Prediction failed: {e}")
     #return predict_ads_conversion_rates_ml(ads)
 
+@app.get("/predictions/cache", tags=["Prediction"])
+async def get_prediction_cache_stats():
+    """
+    Hit / miss counters and size of the prediction caches of both models.
+    """
+    return {
+        "ads": ADS_PREDICTION_CACHE.stats(),
+        "campaigns": CAMPAIGNS_PREDICTION_CACHE.stats(),
+    }
+
+@app.delete("/predictions/cache", tags=["Prediction"])
+async def clear_prediction_caches():
+    """
+    Drops every cached prediction (e.g. after retraining a model).
+    """
+    ADS_PREDICTION_CACHE.clear()
+    CAMPAIGNS_PREDICTION_CACHE.clear()
+    return {"message": "Prediction caches cleared"}
+
+@app.get("/predictions/batching", tags=["Prediction"])
+async def get_prediction_batching_stats():
+    """
+    Number of model calls, requests and rows handled by the prediction micro-batchers.
+    """
+    return {
+        "ads": ads_prediction_batcher.stats(),
+        "campaigns": campaigns_prediction_batcher.stats(),
+    }
+
+class ModelActivationRequest(BaseModel):
+    """Artifact file name (see GET /admin/models) to make active"""
+    version: str
+
+@app.get("/admin/models", tags=["Admin"])
+async def list_models():
+    """
+    State, active version (in the worker answering) and available versions of each
+    prediction model; active_marker is the version activated for every process.
+    """
+    return model_registry.status()
+
+@app.post("/admin/models/{model_name}/activate", tags=["Admin"])
+async def activate_model(model_name: str, request: ModelActivationRequest):
+    """
+    Hot-swaps the active version of a prediction model. The new artifact is loaded and
+    warmed up off the event loop; predictions already running finish on the previous model.
+    The version is saved as the model's ACTIVE marker, which the other processes follow.
+    """
+    if model_name not in model_registry.entries:
+        raise HTTPException(status_code=404, detail="Model not found")
+    try:
+        return await asyncio.to_thread(model_registry.activate, model_name, request.version)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load model: {e}")
+
 @app.post("/optimize_marketing_allocation", response_model=Optional[Individual], tags=["Optimization"])
 async def optimize_marketing_allocation(request: OptimizationRequest):
     """
@@ -140,11 +292,10 @@ async def optimize_marketing_allocation(request: OptimizationRequest):
             detail=f"Total budget (${request.total_budget:,.2f}) is less than the sum of approved budgets (${total_approved_budgets:,.2f}). Please increase the total budget to at least ${total_approved_budgets:,.2f}."
         )
     
-    predicted_ads = predict_ads_conversion_rates(request.ads)
-    predicted_campaigns = predict_campaign_overcosts(request.campaigns)
+    predicted_ads, predicted_campaigns = await predict_request_data(request.ads, request.campaigns)
 
     try:
-        best_solution = run_genetic_optimization(
+        best_solution = await run_genetic_in_pool(
         campaigns=predicted_campaigns,
         ads=predicted_ads,
         population_size=request.population_size,
@@ -153,7 +304,12 @@ async def optimize_marketing_allocation(request: OptimizationRequest):
         crossover_rate=request.crossover_rate,
         total_budget=request.total_budget,
         risk_factor=request.risk_factor,
-        verbose=request.ga_verbose 
+        verbose=request.ga_verbose,
+        islands=request.islands,
+        migration_interval=request.migration_interval,
+        migrants=request.migrants,
+        migration_topology=request.migration_topology,
+        seed=request.seed
     )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -179,6 +335,21 @@ def predict_ads_conversion_rates(ads: List[Ad]) -> List[Ad]:
           #ad.conversion_rate = 0.2
     ads = predict_ads_conversion_rates_ml(ads)
     return ads
+
+async def predict_request_data(ads: List[Ad], campaigns: List[Campaign]):
+    """
+    Predicts the ads and campaigns of an optimization request in worker threads: a model
+    that is still loading (or being swapped) never blocks the event loop.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(predict_ads_conversion_rates, ads),
+        asyncio.to_thread(predict_campaign_overcosts, campaigns),
+    )
+
+# Concurrent calls to the predict endpoints share one model call (see MicroBatcher); the
+# batchers need prediction errors raised to hand them to the request that caused them
+ads_prediction_batcher = MicroBatcher(partial(predict_ads_conversion_rates_ml, raise_errors=True))
+campaigns_prediction_batcher = MicroBatcher(partial(predict_campaigns_overcosts_ml, raise_errors=True))
     
 
 # --- 6. Additional Request Models ---
@@ -196,6 +367,17 @@ class TabuSearchRequest(BaseModel):
     diversification_threshold: int = 100
     ts_verbose: bool = True
 
+    # Parallel walkers (walkers > 1) sharing an elite pool every sync_interval iterations
+    walkers: int = 1
+    sync_interval: int = 20
+    elite_size: int = 5
+
+    # Score each neighbourhood in vectorized chunks on a thread pool (large neighborhood_size)
+    parallel_neighborhood: bool = False
+
+    # Makes the search reproducible (None: a different random search every time)
+    seed: Optional[int] = None
+
 
 class ComparisonRequest(BaseModel):
     """Request model for comparing GA and Tabu Search"""
@@ -220,6 +402,9 @@ class ComparisonRequest(BaseModel):
     diversification_threshold: int = 100
     ts_verbose: bool = True
 
+    # Makes both runs reproducible (None: different random runs every time)
+    seed: Optional[int] = None
+
 
 class AlgorithmComparison(BaseModel):
     """Response model for algorithm comparison"""
@@ -231,8 +416,8 @@ class AlgorithmComparison(BaseModel):
 
 # --- 7. New Optimization Endpoints ---
 
-def optimize_tabu_core(request, predicted_ads, predicted_campaigns):
-    best_solution = run_tabu_search_optimization(
+async def optimize_tabu_core(request, predicted_ads, predicted_campaigns):
+    best_solution = await run_tabu_in_pool(
         campaigns=predicted_campaigns,
         ads=predicted_ads,
         max_iterations=request.max_iterations,
@@ -243,13 +428,16 @@ def optimize_tabu_core(request, predicted_ads, predicted_campaigns):
         use_aspiration=request.use_aspiration,
         intensification_threshold=request.intensification_threshold,
         diversification_threshold=request.diversification_threshold,
-        verbose=request.ts_verbose
+        verbose=request.ts_verbose,
+        walkers=request.walkers,
+        sync_interval=request.sync_interval,
+        elite_size=request.elite_size,
+        parallel_neighborhood=request.parallel_neighborhood,
+        seed=request.seed
     )
 
     return best_solution
 
-import random
-
 def random_tabu_params():
     return {
         "max_iterations": random.randint(50, 300),
@@ -274,17 +462,12 @@ async def optimize_with_tabu_search(request: TabuSearchRequest):
 
     try:
         # Predict values
-        predicted_ads = predict_ads_conversion_rates(request.ads)
-        predicted_campaigns = predict_campaign_overcosts(request.campaigns)
-        return optimize_tabu_core(request, predicted_ads, predicted_campaigns)
+        predicted_ads, predicted_campaigns = await predict_request_data(request.ads, request.campaigns)
+        return await optimize_tabu_core(request, predicted_ads, predicted_campaigns)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-import csv
-from datetime import datetime
-from copy import deepcopy
-
 @app.post("/optimize_tabu_search_experiments", tags=["Optimization"])
 async def run_tabu_experiments(request: TabuSearchRequest):
 
@@ -292,8 +475,7 @@ async def run_tabu_experiments(request: TabuSearchRequest):
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"tabu_experiments_{timestamp}.csv"
-    predicted_ads = predict_ads_conversion_rates(request.ads)
-    predicted_campaigns = predict_campaign_overcosts(request.campaigns)
+    predicted_ads, predicted_campaigns = await predict_request_data(request.ads, request.campaigns)
     
     for i in range(100):
         print("Running tabu search experiment:", i+1)
@@ -306,7 +488,7 @@ async def run_tabu_experiments(request: TabuSearchRequest):
 
         try:
             # Predict values
-            solution = optimize_tabu_core(experiment_request, predicted_ads, predicted_campaigns)
+            solution = await optimize_tabu_core(experiment_request, predicted_ads, predicted_campaigns)
         except Exception as e:
             solution = None
 
@@ -360,8 +542,7 @@ async def compare_optimization_algorithms(request: ComparisonRequest):
         )
     
     # Predict values once (use same predictions for both algorithms)
-    predicted_ads = predict_ads_conversion_rates(request.ads)
-    predicted_campaigns = predict_campaign_overcosts(request.campaigns)
+    predicted_ads, predicted_campaigns = await predict_request_data(request.ads, request.campaigns)
     
     # Initialize results
     ga_result = None
@@ -371,25 +552,42 @@ async def compare_optimization_algorithms(request: ComparisonRequest):
     ga_error = None
     ts_error = None
     
-    # Run Genetic Algorithm
+    # Run Genetic Algorithm and Tabu Search in parallel worker processes
     print("\n" + "="*70)
-    print("RUNNING GENETIC ALGORITHM")
+    print("RUNNING GENETIC ALGORITHM AND TABU SEARCH IN PARALLEL")
     print("="*70)
-    try:
-        start_time = time.time()
-        ga_solution = run_genetic_optimization(
-            campaigns=predicted_campaigns,
-            ads=predicted_ads,
+    ga_run, ts_run = await run_comparison_in_pool(
+        campaigns=predicted_campaigns,
+        ads=predicted_ads,
+        ga_params=dict(
             population_size=request.population_size,
             max_generations=request.max_generations,
             mutation_rate=request.mutation_rate,
             crossover_rate=request.crossover_rate,
             total_budget=request.total_budget,
             risk_factor=request.risk_factor,
-            verbose=request.ga_verbose
+            verbose=request.ga_verbose,
+            seed=request.seed
+        ),
+        ts_params=dict(
+            max_iterations=request.max_iterations,
+            tabu_tenure=request.tabu_tenure,
+            neighborhood_size=request.neighborhood_size,
+            total_budget=request.total_budget,
+            risk_factor=request.risk_factor,
+            use_aspiration=request.use_aspiration,
+            intensification_threshold=request.intensification_threshold,
+            diversification_threshold=request.diversification_threshold,
+            verbose=request.ts_verbose,
+            seed=request.seed
         )
-        ga_time = time.time() - start_time
-        
+    )
+    
+    if isinstance(ga_run, BaseException):
+        ga_error = str(ga_run)
+        print(f"GA Error: {ga_error}")
+    else:
+        ga_solution, ga_time, ga_cpu_time = ga_run
         if ga_solution:
             ga_result = {
                 "fitness": ga_solution.fitness,
@@ -399,34 +597,16 @@ async def compare_optimization_algorithms(request: ComparisonRequest):
                 "total_media_cost": ga_solution.total_media_cost,
                 "profit": ga_solution.total_media_revenue - ga_solution.total_media_cost,
                 "execution_time_seconds": ga_time,
+                "cpu_time_seconds": ga_cpu_time,
                 "allocation": ga_solution.allocation,
                 "campaign_metrics": ga_solution.campaign_metrics
             }
-    except Exception as e:
-        ga_error = str(e)
-        print(f"GA Error: {ga_error}")
     
-    # Run Tabu Search
-    print("\n" + "="*70)
-    print("RUNNING TABU SEARCH")
-    print("="*70)
-    try:
-        start_time = time.time()
-        ts_solution = run_tabu_search_optimization(
-            campaigns=predicted_campaigns,
-            ads=predicted_ads,
-            max_iterations=request.max_iterations,
-            tabu_tenure=request.tabu_tenure,
-            neighborhood_size=request.neighborhood_size,
-            total_budget=request.total_budget,
-            risk_factor=request.risk_factor,
-            use_aspiration=request.use_aspiration,
-            intensification_threshold=request.intensification_threshold,
-            diversification_threshold=request.diversification_threshold,
-            verbose=request.ts_verbose
-        )
-        ts_time = time.time() - start_time
-        
+    if isinstance(ts_run, BaseException):
+        ts_error = str(ts_run)
+        print(f"Tabu Search Error: {ts_error}")
+    else:
+        ts_solution, ts_time, ts_cpu_time = ts_run
         if ts_solution:
             ts_result = {
                 "fitness": ts_solution.fitness,
@@ -436,12 +616,10 @@ async def compare_optimization_algorithms(request: ComparisonRequest):
                 "total_media_cost": ts_solution.total_media_cost,
                 "profit": ts_solution.total_media_revenue - ts_solution.total_media_cost,
                 "execution_time_seconds": ts_time,
+                "cpu_time_seconds": ts_cpu_time,
                 "allocation": ts_solution.allocation,
                 "campaign_metrics": ts_solution.campaign_metrics
             }
-    except Exception as e:
-        ts_error = str(e)
-        print(f"Tabu Search Error: {ts_error}")
     
     # Determine winner and create comparison
     if ga_result and ts_result:
@@ -465,6 +643,8 @@ async def compare_optimization_algorithms(request: ComparisonRequest):
             "roi_difference_percentage": roi_diff,
             "ga_execution_time": ga_time,
             "ts_execution_time": ts_time,
+            "ga_cpu_time": ga_result["cpu_time_seconds"],
+            "ts_cpu_time": ts_result["cpu_time_seconds"],
             "time_difference": abs(ga_time - ts_time),
             "faster_algorithm": "Genetic Algorithm" if ga_time < ts_time else "Tabu Search",
             "metrics_comparison": {
@@ -523,300 +703,49 @@ class MultipleComparisonRequest(BaseModel):
     max_campaigns: int
     min_ads: int
     max_ads: int
-
-def generate_random_subset_campaigns_ads(
-    min_campaigns: int,
-    max_campaigns: int,
-    min_ads: int,
-    max_ads: int
-) -> tuple[List[Campaign], List[Ad]]:
-    """Generate random subsets of campaigns and ads from the database"""
-    
-    # Determine random counts
-    n_campaigns = random.randint(min_campaigns, min(max_campaigns, len(campaigns_db)))
-    n_ads = random.randint(min_ads, min(max_ads, len(ads_db)))
-    
-    # Ensure we dont have more campaings that ads
-    n_campaigns = min(n_campaigns, n_ads)
-    
-    # Ensure we have enough data
-    if len(campaigns_db) < n_campaigns or len(ads_db) < n_ads:
-        raise ValueError(f"Not enough data in database. Have {len(campaigns_db)} campaigns and {len(ads_db)} ads.")
-    
-    # Select random subsets
-    selected_campaigns = random.sample(campaigns_db, n_campaigns)
-    selected_ads = random.sample(ads_db, n_ads)
-    
-    return selected_campaigns, selected_ads
-
-def generate_params(campaigns: List[Campaign]) -> dict:
-    #Total budget should be at least the sum of approved budgets
-    total_approved_budgets = sum(c.approved_budget for c in campaigns)
-    total_budget = random.uniform(total_approved_budgets * 1.1, total_approved_budgets * 1.5)
-
-    risk_factor = round(random.uniform(0, 2.0), 2)
-    pop_size = random.randint(10, 100)
-    max_gens = random.randint(20, 200)
-
-    mutation_rate = round(random.uniform(0.05, 0.3), 2)
-    crossover_rate = round(random.uniform(0.7, 0.95), 2)
-
-    tabu_tenure = random.randint(5, 30)
-    intensification_threshold = random.randint(20, 100)
-    diversification_threshold = random.randint(50, 200)
-
-    return {
-        "total_budget": total_budget,
-        "risk_factor": risk_factor,
-        "population_size": pop_size,
-        "max_generations": max_gens,
-        "mutation_rate": mutation_rate,
-        "crossover_rate": crossover_rate,
-        "tabu_tenure": tabu_tenure,
-        "intensification_threshold": intensification_threshold,
-        "diversification_threshold": diversification_threshold,
-        "ga_verbose": False,
-        "max_iterations": max_gens,
-        "tabu_tenure": tabu_tenure,
-        "neighborhood_size": pop_size,
-        "use_aspiration": True,
-        "intensification_threshold": intensification_threshold,
-        "diversification_threshold": diversification_threshold,
-        "ts_verbose": False
-    }
+    seed: Optional[int] = None  # Base seed; each iteration derives its own from it
 
 @app.post("/multiple_comparisons", tags=["Optimization"])
 async def multiple_comparisons(request: MultipleComparisonRequest):
     """
     Run n iterations of GA vs Tabu Search comparison with random parameters.
     Each iteration uses random subsets of campaigns/ads and random algorithm parameters.
-    Results are saved to a CSV file.
+    Iterations run in parallel on the worker pool and are appended to the CSV files as
+    they complete; an interrupted run can be resumed with /multiple_comparisons/{run_id}/resume.
     """
     
     if request.n_iterations <= 0:
         raise HTTPException(status_code=400, detail="n_iterations must be positive.")
     
-    directory_path = "src/Algorithm_Comparisons/"
-
-    # Create path if it doesn't exist
-    os.makedirs(directory_path, exist_ok=True)
-    
-    parameters_registered = []
-    results_registered = []
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    parameters_filename = f"{directory_path}multiple_comparisons_parameters_{timestamp}.csv"
-    results_filename = f"{directory_path}multiple_comparisons_results_{timestamp}.csv"
+    config = BenchmarkConfig(
+        n_iterations=request.n_iterations,
+        min_campaigns=request.min_campaigns,
+        max_campaigns=request.max_campaigns,
+        min_ads=request.min_ads,
+        max_ads=request.max_ads,
+        seed=request.seed if request.seed is not None else random.randrange(2**32)
+    )
+    runner = BenchmarkRunner(config, campaigns_db, ads_db)
     
     print(f"\n{'='*80}")
-    print(f"Startim Comparisons: {request.n_iterations} iterations")
+    print(f"Starting Comparisons: {request.n_iterations} iterations (run {runner.run_id}, seed {config.seed})")
     print(f"{'='*80}\n")
     
-    for iteration in range(request.n_iterations):
-        print(f"\n{'='*80}")
-        print(f"Iteration {iteration + 1}/{request.n_iterations}")
-        print(f"{'='*80}")
-        
-        try:
-            # Generate random subsets
-            campaigns, ads = generate_random_subset_campaigns_ads(
-                request.min_campaigns,
-                request.max_campaigns,
-                request.min_ads,
-                request.max_ads
-            )
-            
-            # Generate random parameters
-            params = generate_params(campaigns)
-            
-            print(f"Campaigns: {len(campaigns)}, Ads: {len(ads)}")
-            print(f"Budget: ${params['total_budget']:,.2f}")
-            print(f"GA: pop={params['population_size']}, gen={params['max_generations']}")
-            print(f"Tabu: iter={params['max_iterations']}, tenure={params['tabu_tenure']}")
-            
-            # Predict values once for both algorithms
-            predicted_ads = predict_ads_conversion_rates(ads)
-            predicted_campaigns = predict_campaign_overcosts(campaigns)
-            
-            # Run Genetic Algorithm
-            print("\n--- Running GA ---")
-            ga_start = time.time()
-            ga_solution = None
-            ga_error = None
-            
-            try:
-                ga_solution = run_genetic_optimization(
-                    campaigns=predicted_campaigns,
-                    ads=predicted_ads,
-                    population_size=params["population_size"],
-                    max_generations=params["max_generations"],
-                    mutation_rate=params["mutation_rate"],
-                    crossover_rate=params["crossover_rate"],
-                    total_budget=params["total_budget"],
-                    risk_factor=params["risk_factor"],
-                    verbose=params["ga_verbose"]
-                )
-            except Exception as e:
-                ga_error = str(e)
-                print(f"GA Error: {ga_error}")
-            
-            ga_time = time.time() - ga_start
-            
-            # Run Tabu Search
-            print("\n--- Running Tabu Search ---")
-            ts_start = time.time()
-            ts_solution = None
-            ts_error = None
-            
-            try:
-                ts_solution = run_tabu_search_optimization(
-                    campaigns=predicted_campaigns,
-                    ads=predicted_ads,
-                    max_iterations=params["max_iterations"],
-                    tabu_tenure=params["tabu_tenure"],
-                    neighborhood_size=params["neighborhood_size"],
-                    total_budget=params["total_budget"],
-                    risk_factor=params["risk_factor"],
-                    use_aspiration=params["use_aspiration"],
-                    intensification_threshold=params["intensification_threshold"],
-                    diversification_threshold=params["diversification_threshold"],
-                    verbose=True
-                )
-            except Exception as e:
-                ts_error = str(e)
-                print(f"Tabu Search Error: {ts_error}")
-            
-            ts_time = time.time() - ts_start
-            
-            # Determine winner
-            winner = "Error"
-            roi_diff = 0
-            time_diff = 0
-            
-            if ga_solution and ts_solution:
-                ga_roi = ga_solution.total_roi
-                ts_roi = ts_solution.total_roi
-                roi_diff = ga_roi - ts_roi
-                time_diff = ga_time - ts_time
-                
-                if ga_roi > ts_roi:
-                    winner = "GA"
-                elif ts_roi > ga_roi:
-                    winner = "Tabu"
-                else:  # ROI is equal
-                    if ga_time < ts_time:
-                        winner = "GA"
-                    elif ts_time < ga_time:
-                        winner = "Tabu"
-                    else:
-                        winner = "Tie"
-            elif ga_solution:
-                winner = "GA"
-            elif ts_solution:
-                winner = "Tabu"
-            
-            # Record Parameters
-            parameters_record = {
-                "iteration": iteration + 1,
-                "n_campaigns": len(campaigns),
-                "n_ads": len(ads),
-                "total_budget": params["total_budget"],
-                "risk_factor": params["risk_factor"],
-                "ga_population_size": params["population_size"],
-                "ga_max_generations": params["max_generations"],
-                "ga_mutation_rate": params["mutation_rate"],
-                "ga_crossover_rate": params["crossover_rate"],
-                "tabu_max_iterations": params["max_iterations"],
-                "tabu_tenure": params["tabu_tenure"],
-                "tabu_neighborhood_size": params["neighborhood_size"],
-                "tabu_use_aspiration": params["use_aspiration"],
-                "tabu_intensification_threshold": params["intensification_threshold"],
-                "tabu_diversification_threshold": params["diversification_threshold"],
-            }
+    summary = await runner.run_async()
+    if not summary["completed_iterations"]:
+        raise HTTPException(status_code=500, detail="No results generated")
+    return summary
 
-            # Record results
-            result_row = {
-                # GA results
-                "ga_fitness": ga_solution.fitness if ga_solution else None,
-                "ga_total_roi": ga_solution.total_roi if ga_solution else None,
-                "ga_execution_time": ga_time,
-                
-                # Tabu results
-                "tabu_fitness": ts_solution.fitness if ts_solution else None,
-                "tabu_total_roi": ts_solution.total_roi if ts_solution else None,
-                "tabu_execution_time": ts_time,
-                
-                # Comparison
-                "roi_difference": roi_diff,
-                "time_difference": time_diff,
-                "winner": winner
-            }
-            
-            parameters_registered.append(parameters_record)
-            results_registered.append(result_row)
-            
-            print(f"\n--- Iteration {iteration + 1} Summary ---")
-            print(f"GA ROI: {ga_solution.total_roi:.4f}" if ga_solution else "GA: Failed")
-            print(f"Tabu ROI: {ts_solution.total_roi:.4f}" if ts_solution else "Tabu: Failed")
-            print(f"Winner: {winner}")
-            print(f"GA Time: {ga_time:.2f}s | Tabu Time: {ts_time:.2f}s")
-            
-        except Exception as e:
-            print(f"Error in iteration {iteration + 1}: {str(e)}")
-            # Still record the failed iteration
-            parameters_registered.append({
-                "iteration": iteration + 1,
-                "error": str(e)
-            })
-            results_registered.append({
-                "iteration": iteration + 1,
-                "error": str(e),
-                "winner": "Error"
-            })
+@app.post("/multiple_comparisons/{run_id}/resume", tags=["Optimization"])
+async def resume_multiple_comparisons(run_id: str):
+    """Runs the iterations of an interrupted /multiple_comparisons run that have no results yet."""
+    try:
+        runner = BenchmarkRunner.resume(run_id, campaigns_db, ads_db)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     
-    # Write results to CSV
-    if parameters_registered:
-        with open(parameters_filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=parameters_registered[0].keys())
-            writer.writeheader()
-            writer.writerows(parameters_registered)
-        print(f"Parameters saved to: {parameters_filename}")
-
-    if results_registered:
-        with open(results_filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=results_registered[0].keys())
-            writer.writeheader()
-            writer.writerows(results_registered)
-        
-        # Calculate summary statistics
-        successful_runs = [r for r in results_registered if r.get("winner") not in ["Error", None]]
-        ga_wins = sum(1 for r in successful_runs if r["winner"] == "GA")
-        tabu_wins = sum(1 for r in successful_runs if r["winner"] == "Tabu")
-        ties = sum(1 for r in successful_runs if r["winner"] == "Tie")
-        
-        print(f"\n{'='*80}")
-        print("BENCHMARK COMPLETE")
-        print(f"{'='*80}")
-        print(f"Total iterations: {request.n_iterations}")
-        print(f"Successful runs: {len(successful_runs)}")
-        print(f"GA wins: {ga_wins}")
-        print(f"Tabu wins: {tabu_wins}")
-        print(f"Ties: {ties}")
-        print(f"Parameters saved to: {parameters_filename}")
-        print(f"Results saved to: {results_filename}")
-        print(f"{'='*80}\n")
-        
-        return {
-            "total_iterations": request.n_iterations,
-            "successful_runs": len(successful_runs),
-            "ga_wins": ga_wins,
-            "tabu_wins": tabu_wins,
-            "ties": ties,
-            "parameters_filename": parameters_filename,
-            "results_filename": results_filename,
-            "message": "Benchmark completed successfully"
-        }
-    else:
-        raise HTTPException(status_code=500, detail="No results generated")
+    print(f"Resuming run {run_id}: {len(runner.pending_iterations())} iterations left")
+    return await runner.run_async()
 
 @app.post("/best_runs", tags=["Best Runs"])
 async def run_tabu_experiments():
@@ -839,4 +768,129 @@ async def run_tabu_experiments():
     return {
         "top_10_by_column_2": top_10_col_2.to_dict(orient="records"),
         "top_10_by_column_5": top_10_col_5.to_dict(orient="records"),
-    }
\ No newline at end of file
+    }
+
+
+# --- 8. Optimization Jobs ---
+
+class OptimizationJobRequest(ComparisonRequest):
+    """Request model for a background GA / Tabu Search run (uses the parameters of the chosen algorithm)"""
+    algorithm: Literal['genetic', 'tabu']
+
+    # GA island model (see OptimizationRequest)
+    islands: int = 1
+    migration_interval: int = 10
+    migrants: int = 2
+    migration_topology: Literal['ring', 'fully_connected'] = 'ring'
+
+    # Tabu Search walkers and neighbourhood evaluation (see TabuSearchRequest)
+    walkers: int = 1
+    sync_interval: int = 20
+    elite_size: int = 5
+    parallel_neighborhood: bool = False
+
+
+@app.post("/jobs/optimize", tags=["Optimization Jobs"])
+async def submit_optimization_job(request: OptimizationJobRequest):
+    """
+    Starts a GA or Tabu Search run in the background and returns its job id.
+    Follow it with GET /jobs/{job_id} or the /jobs/{job_id}/events stream.
+    """
+    if not request.campaigns or not request.ads:
+        raise HTTPException(status_code=400, detail="Campaigns and Ads lists cannot be empty.")
+
+    total_approved_budgets = sum(campaign.approved_budget for campaign in request.campaigns)
+    total_budget_rounded = round(request.total_budget, 2)
+    total_approved_rounded = round(total_approved_budgets, 2)
+
+    if total_budget_rounded < total_approved_rounded:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Total budget (${total_budget_rounded:,.2f}) is less than the sum of approved budgets (${total_approved_rounded:,.2f})."
+        )
+
+    predicted_ads, predicted_campaigns = await predict_request_data(request.ads, request.campaigns)
+
+    if request.algorithm == 'genetic':
+        params = dict(
+            population_size=request.population_size,
+            max_generations=request.max_generations,
+            mutation_rate=request.mutation_rate,
+            crossover_rate=request.crossover_rate,
+            total_budget=request.total_budget,
+            risk_factor=request.risk_factor,
+            verbose=request.ga_verbose,
+            islands=request.islands,
+            migration_interval=request.migration_interval,
+            migrants=request.migrants,
+            migration_topology=request.migration_topology,
+            seed=request.seed
+        )
+    else:
+        params = dict(
+            max_iterations=request.max_iterations,
+            tabu_tenure=request.tabu_tenure,
+            neighborhood_size=request.neighborhood_size,
+            total_budget=request.total_budget,
+            risk_factor=request.risk_factor,
+            use_aspiration=request.use_aspiration,
+            intensification_threshold=request.intensification_threshold,
+            diversification_threshold=request.diversification_threshold,
+            verbose=request.ts_verbose,
+            walkers=request.walkers,
+            sync_interval=request.sync_interval,
+            elite_size=request.elite_size,
+            parallel_neighborhood=request.parallel_neighborhood,
+            seed=request.seed
+        )
+
+    job = job_manager.submit(request.algorithm, predicted_campaigns, predicted_ads, params)
+    return {"job_id": job.id, "status": job.status}
+
+
+@app.get("/jobs/{job_id}", tags=["Optimization Jobs"])
+async def get_optimization_job(job_id: str):
+    """Returns the status, latest progress entry and (when finished) the best solution of a job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.snapshot()
+
+
+@app.delete("/jobs/{job_id}", tags=["Optimization Jobs"])
+async def cancel_optimization_job(job_id: str):
+    """
+    Cancels a job. A running solver stops at its next generation / iteration and
+    the best solution found so far is kept as the job result.
+    """
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.snapshot(include_result=False)
+
+
+@app.get("/jobs/{job_id}/events", tags=["Optimization Jobs"])
+async def stream_optimization_job(job_id: str):
+    """
+    Server-Sent Events stream of a job: one 'progress' event per GA generation /
+    Tabu iteration, followed by a final 'status' event when the job finishes.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        sent = 0
+        while True:
+            finished = job.finished
+            while sent < len(job.progress):
+                yield f"event: progress\ndata: {json.dumps(job.progress[sent], default=float)}\n\n"
+                sent += 1
+            if finished:
+                break
+            await asyncio.sleep(0.25)
+
+        status = job.snapshot(include_result=False)
+        yield f"event: status\ndata: {json.dumps(status, default=float)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -0,0 +1,60 @@
+# test_featureSchema.py
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.Classes.models import Ad
+from src.Predictors.AdsPredictor import ADS_SCHEMA, COLUNAS_MODELO as ADS_COLUMNS, get_time_of_day
+from src.Predictors.CampaignsPredictor import CAMPAIGNS_SCHEMA, COLUNAS_MODELO as CAMPAIGNS_COLUMNS
+
+# Mesma data / hora local com fusos diferentes, e com e sem fuso
+MIXED_TIMESTAMPS = [
+    datetime(2024, 3, 1, 23, 30, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+    datetime(2024, 3, 2, 1, 15),
+    datetime(2024, 3, 2, 7, 0, tzinfo=timezone.utc),
+    datetime(2024, 3, 3, 13, 45, tzinfo=timezone(timedelta(hours=-8))),
+    datetime(2024, 3, 9, 19, 0, tzinfo=timezone(timedelta(hours=1))),
+]
+
+
+def make_ad(ad_id: int, timestamp: datetime) -> Ad:
+    return Ad(id=ad_id, name=f"Ad {ad_id}", click_through_rate=0.1, view_time=10, cost_per_click=1.0,
+              roi=0.5, timestamp=timestamp, age_group='25-34', engagement_level='Liked',
+              device_type='Mobile', location='UK', gender='Male', content_type='Video',
+              ad_topic='Travel', ad_target_audience='Travel Lovers', conversion_rate=0.0)
+
+
+def test_ads_time_of_day_uses_local_time_of_each_timestamp():
+    ads = [make_ad(i, timestamp) for i, timestamp in enumerate(MIXED_TIMESTAMPS)]
+
+    matrix = ADS_SCHEMA.encode_objects(ads)
+
+    # Cálculo original, linha a linha
+    expected = [get_time_of_day(ad.timestamp.hour) for ad in ads]
+    np.testing.assert_array_equal(matrix[:, ADS_COLUMNS.index('time_of_day')], expected)
+
+
+def test_ads_iso_strings_with_offsets():
+    columns = ADS_SCHEMA.to_columns([make_ad(i, timestamp) for i, timestamp in enumerate(MIXED_TIMESTAMPS)])
+    strings = dict(columns, timestamp=[timestamp.isoformat() for timestamp in MIXED_TIMESTAMPS])
+
+    np.testing.assert_array_equal(ADS_SCHEMA.encode(strings), ADS_SCHEMA.encode(columns))
+
+
+def test_campaigns_date_features_use_local_date_of_each_timestamp():
+    columns = {
+        'no_of_days': [10] * len(MIXED_TIMESTAMPS),
+        'approved_budget': [1000.0] * len(MIXED_TIMESTAMPS),
+        'time': MIXED_TIMESTAMPS,
+        'ext_service_name': ['Google Ads'] * len(MIXED_TIMESTAMPS),
+        'channel_name': ['Search'] * len(MIXED_TIMESTAMPS),
+        'search_tag_cat': ['Youtube'] * len(MIXED_TIMESTAMPS),
+    }
+
+    matrix = CAMPAIGNS_SCHEMA.encode(columns)
+
+    # Cálculo original, linha a linha
+    for column, expected in (('start_month', [dt.month for dt in MIXED_TIMESTAMPS]),
+                             ('day_of_week', [dt.weekday() for dt in MIXED_TIMESTAMPS]),
+                             ('is_weekend', [1 if dt.weekday() >= 5 else 0 for dt in MIXED_TIMESTAMPS])):
+        np.testing.assert_array_equal(matrix[:, CAMPAIGNS_COLUMNS.index(column)], expected)
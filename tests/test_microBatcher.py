@@ -0,0 +1,36 @@
+# test_microBatcher.py
+import asyncio
+
+import pytest
+
+from src.Predictors.microBatcher import MicroBatcher
+
+
+def predict(rows):
+    if 'bad' in rows:
+        raise ValueError("bad row")
+    return [row.upper() for row in rows]
+
+
+async def submit_together(batcher, *requests):
+    return await asyncio.gather(*(batcher.submit(rows) for rows in requests), return_exceptions=True)
+
+
+def test_requests_share_one_call_and_get_their_own_rows():
+    batcher = MicroBatcher(predict, max_wait_ms=50)
+
+    first, second = asyncio.run(submit_together(batcher, ['a', 'b'], ['c']))
+
+    assert (first, second) == (['A', 'B'], ['C'])
+    assert batcher.batches == 1
+
+
+def test_failure_only_reaches_the_request_that_caused_it():
+    batcher = MicroBatcher(predict, max_wait_ms=50)
+
+    good, bad, other = asyncio.run(submit_together(batcher, ['a'], ['bad'], ['b', 'c']))
+
+    assert good == ['A']
+    assert other == ['B', 'C']
+    with pytest.raises(ValueError):
+        raise bad
@@ -0,0 +1,18 @@
+# test_responseCache.py
+import pytest
+
+from src.Data_Store.responseCache import _accepts_gzip
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", True),
+    ("GZIP; q=0.5", True),
+    ("br, *;q=0.1", True),
+    ("gzip;q=0", False),
+    ("gzip;q=0, *", False),
+    ("x-gzip-foo", False),
+    ("identity", False),
+    (None, False),
+])
+def test_accepts_gzip(accept_encoding, expected):
+    assert _accepts_gzip(accept_encoding) is expected